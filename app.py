@@ -4,18 +4,335 @@ Servidor Flask para la Calculadora de Ruffini con IA
 Proporciona tanto la interfaz web como una API REST
 """
 
-from flask import Flask, render_template, request, jsonify, send_from_directory
+from flask import Flask, render_template, request, jsonify, send_from_directory, g, Response
+from flask.json.provider import DefaultJSONProvider
+from fractions import Fraction
+import hashlib
 import json
+import math
 import os
-from src.ruffini_calculator import RuffiniCalculator
+import re
+import time
+from src.ruffini_calculator import EXACT_MAX_DIGITS, RuffiniCalculator, PolynomialParseError
+from src.result_cache import LRUCache, SQLiteCache
+from src.ruffini_result import number_str
+from src.metrics import MetricsRegistry
+from src import compute_pool as pool_tasks
+from src import response_formats
+from src.compute_pool import ComputePool, ComputePoolBusy, ComputeBudgetExceeded
+from src.admission import AdmissionError, TokenBucketLimiter, estimate_cost
+from src.single_flight import SingleFlight
+
+class RuffiniJSONProvider(DefaultJSONProvider):
+    """
+    Serializa las fracciones del modo exacto como enteros o cadenas 'p/q'
+    
+    Los enteros exactos con más cifras de las que admite str (por ejemplo,
+    los cocientes de una raíz grande) se escriben como cadenas decimales.
+    """
+    
+    @staticmethod
+    def default(o):
+        if isinstance(o, Fraction):
+            return o.numerator if o.denominator == 1 else number_str(o)
+        return DefaultJSONProvider.default(o)
+    
+    def dumps(self, obj, **kwargs):
+        try:
+            return super().dumps(obj, **kwargs)
+        except ValueError:
+            return super().dumps(response_formats.big_ints_as_strings(obj, response_formats.json_int_max_bits()),
+                                 **kwargs)
 
 # Configuración de la aplicación Flask
 app = Flask(__name__)
+app.json = RuffiniJSONProvider(app)
 app.config['SECRET_KEY'] = 'tu_clave_secreta_aqui'  # Cambiar en producción
 app.config['DEBUG'] = True
+app.config['MAX_BATCH_JOBS'] = 10000  # Máximo de trabajos por petición de lote
+app.config['MAX_EVALUATE_POINTS'] = 100000  # Máximo de puntos por petición de /evaluate
+app.config['CACHE_MAX_SIZE'] = int(os.environ.get('RUFFINI_CACHE_SIZE', 1024))  # 0 desactiva la caché
+app.config['CACHE_TTL'] = float(os.environ.get('RUFFINI_CACHE_TTL', 3600))  # Segundos; 0 = sin caducidad
+app.config['CACHE_BACKEND'] = os.environ.get('RUFFINI_CACHE_BACKEND', 'memory')  # 'memory' (por proceso) o 'sqlite' (compartida)
+app.config['CACHE_PATH'] = os.environ.get('RUFFINI_CACHE_PATH')  # Fichero de la caché 'sqlite'; None = instance/ruffini_cache.sqlite3
+app.config['CACHE_WARM'] = os.environ.get('RUFFINI_CACHE_WARM', '0') not in ('0', '', 'false')  # Precargar /examples en create_app
+app.config['STATIC_RESPONSE_MAX_AGE'] = 3600  # Segundos que el navegador puede reutilizar /examples sin revalidar
+app.config['EXPLANATION_STORE_SIZE'] = 4096  # Cálculos cuya explicación se puede pedir en /explanation/<id>
+# Pool de procesos para cálculos costosos (lo activa create_app)
+app.config['COMPUTE_WORKERS'] = int(os.environ.get('RUFFINI_COMPUTE_WORKERS', 0))  # 0 = un proceso por núcleo
+app.config['COMPUTE_QUEUE_SIZE'] = int(os.environ.get('RUFFINI_COMPUTE_QUEUE', 16))  # Trabajos en espera antes de responder 503
+app.config['COMPUTE_MIN_DEGREE'] = int(os.environ.get('RUFFINI_COMPUTE_MIN_DEGREE', 256))  # Grados menores no compensan el envío a otro proceso
+# Control de admisión: por encima de estos límites se responde 413 (o 429) sin calcular
+app.config['MAX_POLYNOMIAL_LENGTH'] = int(os.environ.get('RUFFINI_MAX_POLYNOMIAL_LENGTH', 1000000))  # Caracteres
+app.config['MAX_DEGREE'] = int(os.environ.get('RUFFINI_MAX_DEGREE', 1000000))
+app.config['MAX_REQUEST_COST'] = int(os.environ.get('RUFFINI_MAX_REQUEST_COST', 5000000))  # Unidades de admission.estimate_cost
+app.config['RATE_LIMIT_PER_MINUTE'] = int(os.environ.get('RUFFINI_RATE_LIMIT', 100))  # Peticiones POST (y /explanation) por IP; 0 = sin límite
+app.config['REQUEST_CPU_SECONDS'] = float(os.environ.get('RUFFINI_REQUEST_CPU_SECONDS', 30))  # Por trabajo del pool; 0 = sin límite
+app.config['MAX_COMPANION_DEGREE'] = int(os.environ.get('RUFFINI_MAX_COMPANION_DEGREE', 500))  # /roots con 'companion' (O(n³) en NumPy)
+
+API_VERSION = '1.0.0'
+STARTED_AT = time.time()
+
+# Métricas expuestas en /metrics (formato de texto de Prometheus)
+metrics = MetricsRegistry()
+http_requests = metrics.counter(
+    'ruffini_http_requests_total', 'Peticiones HTTP atendidas por endpoint, método y código')
+http_latency = metrics.histogram(
+    'ruffini_http_request_duration_seconds', 'Latencia de las peticiones HTTP por endpoint')
+stage_latency = metrics.histogram(
+    'ruffini_calculation_stage_seconds', 'Duración de cada etapa del cálculo (parse, divide, format, steps, verify, explain, evaluate, serialize)')
+calculations = metrics.counter(
+    'ruffini_calculations_total', 'Cálculos de Ruffini servidos (incluidos los de la caché)')
+
+def observe_stage(stage, seconds):
+    """Registra la duración de una etapa del cálculo"""
+    stage_latency.observe(seconds, stage=stage)
 
 # Instancia global del calculador
-calculator = RuffiniCalculator()
+# Es segura entre hilos: ningún método guarda estado en la instancia,
+# los pasos se devuelven como valor.
+calculator = RuffiniCalculator(stage_timer=observe_stage)
+
+def make_cache(max_size, table='entries'):
+    """
+    Caché según CACHE_BACKEND: LRU en memoria o SQLite compartida por los workers
+    
+    Con SQLite, cada caché usa su propia tabla del fichero CACHE_PATH; si
+    no se indica, el fichero va en la carpeta instance/ de la aplicación,
+    que se crea con permisos 0700 (no en el directorio temporal compartido).
+    """
+    backend = app.config['CACHE_BACKEND']
+    if backend == 'sqlite':
+        path = app.config['CACHE_PATH']
+        if not path:
+            os.makedirs(app.instance_path, mode=0o700, exist_ok=True)
+            path = os.path.join(app.instance_path, 'ruffini_cache.sqlite3')
+        return SQLiteCache(path, max_size, app.config['CACHE_TTL'], table=table)
+    if backend != 'memory':
+        raise ValueError(f"RUFFINI_CACHE_BACKEND debe ser 'memory' o 'sqlite', no {backend!r}")
+    return LRUCache(max_size, app.config['CACHE_TTL'])
+
+# Caché de resultados de /calculate y /validate, indexada por los
+# coeficientes normalizados (no por la cadena original)
+result_cache = make_cache(app.config['CACHE_MAX_SIZE'])
+
+# Cálculos idénticos en curso: las peticiones simultáneas comparten uno solo
+in_flight = SingleFlight()
+
+# Cálculos pedidos sin explicación, para generarla bajo demanda en /explanation/<id>.
+# Con la caché SQLite la comparten todos los workers, así que el id sirve en cualquiera
+explanation_requests = make_cache(app.config['EXPLANATION_STORE_SIZE'], table='explanations')
+
+# Pool de procesos para los cálculos de grado alto (None = todo en el hilo de la petición)
+compute_pool = None
+
+# Cuota de peticiones POST por cliente (None = sin límite)
+rate_limiter = (TokenBucketLimiter(app.config['RATE_LIMIT_PER_MINUTE'])
+                if app.config['RATE_LIMIT_PER_MINUTE'] > 0 else None)
+
+metrics.gauge('ruffini_cache_entries', 'Entradas en la caché de resultados', lambda: len(result_cache))
+metrics.gauge('ruffini_cache_hits_total', 'Aciertos de la caché de resultados', lambda: result_cache.hits, 'counter')
+metrics.gauge('ruffini_cache_misses_total', 'Fallos de la caché de resultados', lambda: result_cache.misses, 'counter')
+metrics.gauge('ruffini_cache_evictions_total', 'Entradas desalojadas de la caché', lambda: result_cache.evictions, 'counter')
+metrics.gauge('ruffini_coalesced_requests_total', 'Cálculos que esperaron a otro idéntico en curso en lugar de repetirlo',
+              lambda: in_flight.shared, 'counter')
+metrics.gauge('ruffini_uptime_seconds', 'Segundos desde el arranque del servidor', lambda: time.time() - STARTED_AT)
+metrics.gauge('ruffini_compute_pool_in_flight', 'Cálculos en curso o en espera en el pool de procesos',
+              lambda: compute_pool.in_flight if compute_pool else 0)
+metrics.gauge('ruffini_compute_pool_rejected_total', 'Cálculos rechazados con 503 por el pool lleno',
+              lambda: compute_pool.rejected if compute_pool else 0, 'counter')
+metrics.gauge('ruffini_rate_limited_total', 'Peticiones rechazadas con 429 por superar la cuota del cliente',
+              lambda: rate_limiter.rejected if rate_limiter else 0, 'counter')
+
+def configure_compute_pool(workers, queue_size=None):
+    """Activa (workers > 0) o desactiva el pool de procesos para cálculos costosos"""
+    global compute_pool
+    if compute_pool is not None:
+        compute_pool.shutdown()
+    if queue_size is None:
+        queue_size = app.config['COMPUTE_QUEUE_SIZE']
+    compute_pool = (ComputePool(workers, queue_size, app.config['REQUEST_CPU_SECONDS'])
+                    if workers > 0 else None)
+
+def create_app():
+    """
+    Fábrica de la aplicación para producción (gunicorn, o uvicorn con asgi.py)
+    
+    Desactiva el modo debug y envía los cálculos de grado alto a un pool de
+    procesos acotado: RUFFINI_COMPUTE_WORKERS procesos (por defecto, uno por
+    núcleo) y RUFFINI_COMPUTE_QUEUE trabajos en espera. Con el pool lleno,
+    /calculate, /calculate/batch, /factor, /deflate, /roots, /evaluate y
+    /explanation responden 503.
+    
+    Con RUFFINI_CACHE_WARM precarga en la caché los cálculos de /examples.
+    
+    Ejemplo: gunicorn -k gthread --threads 32 'app:create_app()'
+    """
+    app.config['DEBUG'] = False
+    configure_compute_pool(app.config['COMPUTE_WORKERS'] or os.cpu_count() or 1)
+    if app.config['CACHE_WARM']:
+        warm_cache()
+    return app
+
+def warm_cache():
+    """
+    Precarga en la caché la división de cada ejemplo de /examples
+    
+    Se guardan con las mismas claves que usa /calculate con las opciones
+    por defecto, así que la primera petición de un ejemplo ya es un acierto.
+    
+    Returns:
+        Número de ejemplos precargados
+    """
+    for example in EXAMPLES:
+        terms = calculator.parse_polynomial_terms(example['polynomial'])
+        root = parse_root(example['root'])
+        key = ('divide', normalized_key(terms), root, False)
+        result_cache.set(key, calculator.divide(example['polynomial'], terms, root, False))
+    return len(EXAMPLES)
+
+def run_heavy(degree, method, *args):
+    """
+    Ejecuta calculator.<method>(*args) en el pool de procesos si está activo
+    y el grado lo justifica, o en el propio hilo en caso contrario
+    
+    Puede lanzar ComputePoolBusy si el pool está lleno, y AdmissionError
+    si el trabajo agota REQUEST_CPU_SECONDS segundos de CPU. El límite de
+    CPU es orientativo: solo existe en el pool, y SIGXCPU no interrumpe el
+    código C de NumPy hasta que vuelve a Python, así que los trabajos que
+    pasan mucho tiempo en NumPy se acotan en la admisión.
+    """
+    if compute_pool is None or degree < app.config['COMPUTE_MIN_DEGREE']:
+        return getattr(calculator, method)(*args)
+    
+    start = time.perf_counter()
+    try:
+        result = compute_pool.run(getattr(pool_tasks, method), *args)
+    except ComputeBudgetExceeded:
+        raise AdmissionError(
+            f"El cálculo superó el límite de {app.config['REQUEST_CPU_SECONDS']:g} segundos de CPU")
+    observe_stage('pool', time.perf_counter() - start)
+    return result
+
+def admit(polynomial, quadratic=False, sparse=False, repeat=1, exact=False):
+    """
+    Comprueba, antes de parsear, que el polinomio cabe en los límites del servidor
+    
+    Los argumentos describen el trabajo como en admission.estimate_cost;
+    con exact, además, que ningún número supera EXACT_MAX_DIGITS cifras.
+    
+    Raises:
+        AdmissionError: Si supera MAX_POLYNOMIAL_LENGTH, MAX_DEGREE,
+            MAX_REQUEST_COST o, en modo exacto, EXACT_MAX_DIGITS
+    """
+    if len(polynomial) > app.config['MAX_POLYNOMIAL_LENGTH']:
+        raise AdmissionError(f"El polinomio supera los {app.config['MAX_POLYNOMIAL_LENGTH']} caracteres")
+    
+    estimate = estimate_cost(polynomial, quadratic, sparse, repeat)
+    if estimate['degree'] > app.config['MAX_DEGREE']:
+        raise AdmissionError(f"El grado máximo admitido es {app.config['MAX_DEGREE']}")
+    if exact and estimate['digits'] > EXACT_MAX_DIGITS:
+        raise AdmissionError(f"Los números del modo exacto admiten como máximo {EXACT_MAX_DIGITS} cifras")
+    check_cost(estimate['cost'])
+    return estimate
+
+def check_cost(cost):
+    """Rechaza con AdmissionError los trabajos de coste mayor que MAX_REQUEST_COST"""
+    if cost > app.config['MAX_REQUEST_COST']:
+        raise AdmissionError(
+            'La petición es demasiado costosa: reduce el grado, los pasos o el número de raíces o puntos')
+
+def admission_response(error):
+    """Respuesta 413 o 429 (con Retry-After) para una petición no admitida"""
+    response = jsonify({
+        'success': False,
+        'error': str(error)
+    })
+    response.status_code = error.status
+    if error.retry_after is not None:
+        response.headers['Retry-After'] = str(max(1, math.ceil(error.retry_after)))
+    return response
+
+def busy_response(error):
+    """Respuesta 503 cuando el pool de procesos no admite más trabajo"""
+    response = jsonify({
+        'success': False,
+        'error': f'{error}. Inténtalo de nuevo en unos segundos'
+    })
+    response.status_code = 503
+    response.headers['Retry-After'] = '1'
+    return response
+
+@app.before_request
+def start_request_timer():
+    g.request_started = time.perf_counter()
+
+@app.before_request
+def limit_request_rate():
+    """
+    Aplica la cuota de RATE_LIMIT_PER_MINUTE peticiones POST por IP
+    
+    GET /explanation/<id> también cuenta: repite la división si no está en caché.
+    """
+    if rate_limiter is None or (request.method != 'POST' and request.endpoint != 'explanation'):
+        return None
+    wait = rate_limiter.acquire(request.remote_addr)
+    if wait:
+        return admission_response(AdmissionError(
+            f"Demasiadas peticiones: máximo {app.config['RATE_LIMIT_PER_MINUTE']} por minuto",
+            status=429, retry_after=wait
+        ))
+    return None
+
+@app.after_request
+def record_request_metrics(response):
+    started = g.pop('request_started', None)
+    if started is not None:
+        # Se etiqueta con la regla de la ruta, no con la URL, para acotar las series
+        endpoint = request.url_rule.rule if request.url_rule else 'unmatched'
+        http_requests.inc(endpoint=endpoint, method=request.method, status=response.status_code)
+        http_latency.observe(time.perf_counter() - started, endpoint=endpoint)
+    return response
+
+def timed_jsonify(payload):
+    """jsonify midiendo la serialización como etapa 'serialize'"""
+    start = time.perf_counter()
+    response = jsonify(payload)
+    observe_stage('serialize', time.perf_counter() - start)
+    return response
+
+def negotiated_response(result):
+    """
+    Respuesta en el formato pedido en la cabecera Accept (JSON por defecto)
+    
+    Los formatos compactos se describen en src/response_formats.py.
+    """
+    mimetype = response_formats.negotiate(request.accept_mimetypes)
+    if mimetype == response_formats.JSON:
+        response = timed_jsonify(result)
+    else:
+        start = time.perf_counter()
+        body, mimetype = response_formats.encode(result, mimetype, app.json.dumps)
+        response = app.response_class(body, mimetype=mimetype)
+        observe_stage('serialize', time.perf_counter() - start)
+    response.vary.add('Accept')
+    return response
+
+def wants_compact_response():
+    """Si la cabecera Accept pide un formato compacto en lugar del JSON de siempre"""
+    return response_formats.negotiate(request.accept_mimetypes) != response_formats.JSON
+
+def static_json_response(body, etag):
+    """
+    Respuesta JSON ya serializada con ETag y Cache-Control
+    
+    Devuelve 304 sin cuerpo si el cliente envía un If-None-Match que coincide.
+    """
+    response = app.response_class(body, mimetype='application/json')
+    response.set_etag(etag)
+    response.cache_control.public = True
+    response.cache_control.max_age = app.config['STATIC_RESPONSE_MAX_AGE']
+    return response.make_conditional(request)
 
 @app.route('/')
 def index():
@@ -45,19 +362,388 @@ def calculate():
                 'error': 'El polinomio es requerido'
             }), 400
         
+        exact = bool(data.get('exact', False))
+        
+        verify = bool(data.get('verify', False))
+        
+        if data.get('divisor') is not None:
+            # División entre un divisor cualquiera: (2x - 3), x^2 + x + 1...
+            return calculate_with_divisor(polynomial, data['divisor'],
+                                          parse_steps_option(data.get('include_steps', True)), exact, verify)
+        
         try:
-            root = float(root)
-        except (ValueError, TypeError):
+            root = parse_root(root, exact)
+        except (ValueError, TypeError, ZeroDivisionError):
             return jsonify({
                 'success': False,
                 'error': 'La raíz debe ser un número válido'
             }), 400
         
-        # Realizar el cálculo
-        result = calculator.calculate(polynomial, root)
+        include_steps = parse_steps_option(data.get('include_steps', True))
+        if include_steps is True and wants_compact_response():
+            # Los formatos compactos llevan la traza; no hace falta generar los pasos
+            include_steps = 'compact'
+        # 'explain' es un alias corto de 'include_explanation'
+        include_explanation = bool(data.get('explain', data.get('include_explanation', True)))
+        
+        # Los pasos completos crecen con el cuadrado del grado
+        admit(polynomial, quadratic=include_steps is True,
+              sparse=not include_steps and not include_explanation and not verify, exact=exact)
+        
+        # Parsear el polinomio para obtener la clave normalizada de la caché
+        try:
+            start = time.perf_counter()
+            terms = calculator.parse_polynomial_terms(polynomial, exact)
+            observe_stage('parse', time.perf_counter() - start)
+        except Exception:
+            # El calculador genera la respuesta de error con ayuda de IA
+            return jsonify(calculator.calculate(polynomial, root, exact=exact))
+        
+        # Realizar el cálculo (o reutilizarlo de la caché)
+        result = calculate_cached(polynomial, terms, root, include_steps, include_explanation, exact, verify)
+        
+        if not include_explanation:
+            # La explicación se puede pedir después en /explanation/<id>
+            explanation_id = register_explanation(polynomial, terms, root, exact)
+            result = dict(result, explanation_id=explanation_id,
+                          explanation_url=f'/explanation/{explanation_id}')
+        
+        return negotiated_response(result)
+        
+    except AdmissionError as e:
+        return admission_response(e)
+    except ComputePoolBusy as e:
+        return busy_response(e)
+    except Exception as e:
+        return jsonify({
+            'success': False,
+            'error': f'Error interno del servidor: {str(e)}'
+        }), 500
+
+@app.route('/calculate/batch', methods=['POST'])
+def calculate_batch():
+    """
+    API endpoint para realizar muchos cálculos de Ruffini en una sola petición
+    
+    Acepta una lista de trabajos {polynomial, root} en 'jobs', o bien un único
+    'polynomial' con una lista de 'roots'. Cada polinomio distinto se parsea
+    una sola vez.
+    """
+    try:
+        data = request.get_json()
+        
+        if not data:
+            return jsonify({
+                'success': False,
+                'error': 'No se recibieron datos JSON'
+            }), 400
+        
+        include_steps = parse_steps_option(data.get('include_steps', True))
+        include_explanation = bool(data.get('include_explanation', True))
+        exact = bool(data.get('exact', False))
+        verify = bool(data.get('verify', False))
+        
+        if 'jobs' in data:
+            jobs = data.get('jobs')
+        else:
+            polynomial = data.get('polynomial')
+            roots = data.get('roots')
+            if not isinstance(roots, list):
+                return jsonify({
+                    'success': False,
+                    'error': "Se requiere 'jobs' o 'polynomial' con una lista 'roots'"
+                }), 400
+            jobs = [{'polynomial': polynomial, 'root': root} for root in roots]
+        
+        if not isinstance(jobs, list) or not jobs:
+            return jsonify({
+                'success': False,
+                'error': 'La lista de trabajos está vacía o no es válida'
+            }), 400
+        
+        if len(jobs) > app.config['MAX_BATCH_JOBS']:
+            return jsonify({
+                'success': False,
+                'error': f"Máximo {app.config['MAX_BATCH_JOBS']} trabajos por petición"
+            }), 413
+        
+        check_cost(batch_cost(jobs, include_steps, include_explanation, verify))
+        
+        results = None
+        if 'jobs' not in data and not (include_steps or include_explanation or exact or verify):
+            # Un polinomio con muchas raíces: todas las divisiones a la vez
+            results = run_batch_roots(data.get('polynomial'), data['roots'])
+        
+        if results is None:
+            parsed = {}  # polinomio -> coeficientes (o excepción de parseo)
+            results = []
+            
+            for job in jobs:
+                results.append(run_batch_job(job, parsed, include_steps, include_explanation, exact, verify))
+        
+        return timed_jsonify({
+            'success': True,
+            'count': len(results),
+            'results': results
+        })
+        
+    except AdmissionError as e:
+        return admission_response(e)
+    except ComputePoolBusy as e:
+        return busy_response(e)
+    except Exception as e:
+        return jsonify({
+            'success': False,
+            'error': f'Error interno del servidor: {str(e)}'
+        }), 500
+
+@app.route('/factor', methods=['POST'])
+def factor():
+    """
+    API endpoint para factorizar un polinomio buscando todas sus raíces racionales
+    """
+    try:
+        data = request.get_json()
+        
+        if not data:
+            return jsonify({
+                'success': False,
+                'error': 'No se recibieron datos JSON'
+            }), 400
+        
+        polynomial = data.get('polynomial', '').strip()
         
-        return jsonify(result)
+        if not polynomial:
+            return jsonify({
+                'success': False,
+                'error': 'El polinomio es requerido'
+            }), 400
+        
+        admit(polynomial, quadratic=True, exact=True)
         
+        # Siempre en el pool, con su límite de CPU: factorizar los coeficientes
+        # extremos (Pollard-Brent) no depende del grado
+        return timed_jsonify(run_heavy(math.inf, 'factor', polynomial))
+        
+    except AdmissionError as e:
+        return admission_response(e)
+    except ComputePoolBusy as e:
+        return busy_response(e)
+    except Exception as e:
+        return jsonify({
+            'success': False,
+            'error': f'Error interno del servidor: {str(e)}'
+        }), 500
+
+@app.route('/deflate', methods=['POST'])
+def deflate():
+    """
+    API endpoint para dividir sucesivamente por varias raíces o por (x - a)^k
+    
+    Acepta una lista 'roots', o una 'root' con 'multiplicity' (por defecto 1).
+    Con 'taylor' devuelve también los coeficientes de Taylor en la primera raíz.
+    """
+    try:
+        data = request.get_json()
+        
+        if not data:
+            return jsonify({
+                'success': False,
+                'error': 'No se recibieron datos JSON'
+            }), 400
+        
+        polynomial = data.get('polynomial', '').strip()
+        
+        if not polynomial:
+            return jsonify({
+                'success': False,
+                'error': 'El polinomio es requerido'
+            }), 400
+        
+        exact = bool(data.get('exact', False))
+        taylor = bool(data.get('taylor', False))
+        
+        try:
+            if 'roots' in data:
+                roots = [parse_root(root, exact) for root in data['roots']]
+                multiplicity = len(roots)
+            else:
+                roots = [parse_root(data.get('root'), exact)]
+                multiplicity = int(data.get('multiplicity', 1))
+        except (ValueError, TypeError, ZeroDivisionError):
+            return jsonify({
+                'success': False,
+                'error': "Se requiere una lista numérica 'roots' o una 'root' con 'multiplicity' entera"
+            }), 400
+        
+        # Cada raíz es una división; el desplazamiento de Taylor es cuadrático
+        admit(polynomial, quadratic=taylor, repeat=multiplicity, exact=exact)
+        if 'roots' not in data:
+            roots = roots * multiplicity
+        
+        try:
+            degree = max(calculator.parse_polynomial_terms(polynomial, exact), default=0)
+        except Exception:
+            degree = 0  # deflate_polynomial genera la respuesta de error
+        
+        if len(roots) > max(degree, 1):
+            return jsonify({
+                'success': False,
+                'error': f'Hay más raíces ({len(roots)}) que el grado del polinomio ({degree})'
+            }), 400
+        
+        return timed_jsonify(run_heavy(degree, 'deflate_polynomial', polynomial, roots, exact, taylor))
+        
+    except AdmissionError as e:
+        return admission_response(e)
+    except ComputePoolBusy as e:
+        return busy_response(e)
+    except Exception as e:
+        return jsonify({
+            'success': False,
+            'error': f'Error interno del servidor: {str(e)}'
+        }), 500
+
+@app.route('/roots', methods=['POST'])
+def roots():
+    """
+    API endpoint que calcula numéricamente todas las raíces de un polinomio
+    
+    Devuelve las raíces complejas y las reales, y las racionales exactas que
+    se pueden usar directamente como 'root' en /calculate.
+    """
+    try:
+        data = request.get_json()
+        
+        if not data:
+            return jsonify({
+                'success': False,
+                'error': 'No se recibieron datos JSON'
+            }), 400
+        
+        polynomial = data.get('polynomial', '').strip()
+        method = data.get('method', 'aberth')
+        
+        if not polynomial:
+            return jsonify({
+                'success': False,
+                'error': 'El polinomio es requerido'
+            }), 400
+        
+        estimate = admit(polynomial, quadratic=True, exact=True)
+        if method == 'companion' and estimate['degree'] > app.config['MAX_COMPANION_DEGREE']:
+            # np.roots pasa casi todo el tiempo en LAPACK, donde el límite de CPU no lo interrumpe
+            raise AdmissionError(
+                f"El método 'companion' admite hasta grado {app.config['MAX_COMPANION_DEGREE']}; usa 'aberth'")
+        
+        try:
+            degree = max(calculator.parse_polynomial_terms(polynomial, exact=True), default=0)
+        except Exception:
+            degree = 0  # find_roots genera la respuesta de error
+        
+        return timed_jsonify(run_heavy(degree, 'find_roots', polynomial, method))
+        
+    except AdmissionError as e:
+        return admission_response(e)
+    except ComputePoolBusy as e:
+        return busy_response(e)
+    except Exception as e:
+        return jsonify({
+            'success': False,
+            'error': f'Error interno del servidor: {str(e)}'
+        }), 500
+
+@app.route('/evaluate', methods=['POST'])
+def evaluate():
+    """
+    API endpoint para evaluar un polinomio en muchos puntos a la vez
+    
+    Acepta 'polynomial' o una lista 'coefficients' (de mayor a menor grado),
+    y los puntos como lista 'x' o como rejilla 'range' {start, stop, points}.
+    Con 'derivative' también devuelve P'(x). Los intervalos de la rejilla en
+    los que P cambia de signo contienen al menos una raíz real.
+    """
+    try:
+        data = request.get_json()
+        
+        if not data:
+            return jsonify({
+                'success': False,
+                'error': 'No se recibieron datos JSON'
+            }), 400
+        
+        polynomial = data.get('polynomial')
+        polynomial = polynomial.strip() if isinstance(polynomial, str) else ''
+        
+        if polynomial:
+            admit(polynomial, sparse=True)
+            try:
+                start = time.perf_counter()
+                terms = calculator.parse_polynomial_terms(polynomial)
+                observe_stage('parse', time.perf_counter() - start)
+            except Exception as e:
+                return jsonify({
+                    'success': False,
+                    'error': str(e),
+                    'suggestions': generate_format_suggestions()
+                }), 400
+            degree = max(terms)
+            coefficients = terms if calculator.is_sparse(terms) else calculator.expand_terms(terms)
+        else:
+            coefficients = data.get('coefficients')
+            try:
+                coefficients = [float(coef) for coef in coefficients]
+            except (ValueError, TypeError):
+                coefficients = None
+            if not coefficients:
+                return jsonify({
+                    'success': False,
+                    'error': "Se requiere 'polynomial' o una lista numérica 'coefficients'"
+                }), 400
+            degree = len(coefficients) - 1
+        
+        try:
+            xs = parse_evaluation_points(data)
+        except (KeyError, ValueError, TypeError):
+            return jsonify({
+                'success': False,
+                'error': "Los puntos deben ser una lista numérica 'x' o un 'range' {start, stop, points}"
+            }), 400
+        
+        if len(xs) > app.config['MAX_EVALUATE_POINTS']:
+            return jsonify({
+                'success': False,
+                'error': f"Máximo {app.config['MAX_EVALUATE_POINTS']} puntos por petición"
+            }), 413
+        
+        check_cost(len(coefficients) * len(xs))
+        
+        derivative = bool(data.get('derivative', False))
+        
+        start = time.perf_counter()
+        values, derivatives = run_heavy(degree, 'evaluate_many', coefficients, xs, derivative)
+        observe_stage('evaluate', time.perf_counter() - start)
+        
+        sign_changes, zeros = calculator.sign_changes(xs, values)
+        result = {
+            'success': True,
+            'polynomial': calculator.format_polynomial(coefficients),
+            'degree': degree,
+            'count': len(xs),
+            'x': xs,
+            'values': values,
+            'sign_changes': sign_changes,
+            'zeros': zeros
+        }
+        if derivative:
+            result['derivatives'] = derivatives
+        
+        return timed_jsonify(result)
+        
+    except AdmissionError as e:
+        return admission_response(e)
+    except ComputePoolBusy as e:
+        return busy_response(e)
     except Exception as e:
         return jsonify({
             'success': False,
@@ -80,22 +766,39 @@ def validate_polynomial():
                 'suggestions': generate_format_suggestions()
             })
         
+        try:
+            admit(polynomial)
+        except AdmissionError as e:
+            return admission_response(e)
+        
         # Intentar parsear el polinomio
         try:
-            coefficients = calculator.parse_polynomial(polynomial)
+            terms = calculator.parse_polynomial_terms(polynomial)
+            key = ('validate', normalized_key(terms))
+            validation = result_cache.get(key)
             
-            # Generar análisis con IA
-            analysis = generate_polynomial_analysis(polynomial, coefficients)
+            if validation is None:
+                coefficients = calculator.expand_terms(terms)
+                
+                # Generar análisis con IA
+                validation = {
+                    'valid': True,
+                    'coefficients': coefficients,
+                    'analysis': generate_polynomial_analysis(polynomial, coefficients),
+                    'degree': len(coefficients) - 1,
+                    'formatted': calculator.format_polynomial(coefficients)
+                }
+                result_cache.set(key, validation)
             
+            return jsonify(dict(validation, polynomial=polynomial))
+            
+        except PolynomialParseError as e:
             return jsonify({
-                'valid': True,
-                'polynomial': polynomial,
-                'coefficients': coefficients,
-                'analysis': analysis,
-                'degree': len(coefficients) - 1,
-                'formatted': calculator.format_polynomial(coefficients)
+                'valid': False,
+                'error': str(e),
+                'error_position': e.position,
+                'suggestions': generate_error_suggestions(polynomial, str(e))
             })
-            
         except Exception as e:
             return jsonify({
                 'valid': False,
@@ -113,46 +816,11 @@ def validate_polynomial():
 def get_examples():
     """
     API endpoint que proporciona ejemplos de polinomios
-    """
-    examples = [
-        {
-            'title': 'Polinomio cúbico simple',
-            'polynomial': 'x^3 + 2x^2 - 5x + 6',
-            'root': 2,
-            'description': 'Un polinomio de grado 3 con coeficientes mixtos',
-            'difficulty': 'Intermedio'
-        },
-        {
-            'title': 'Diferencia de cuadrados',
-            'polynomial': 'x^4 - 1',
-            'root': 1,
-            'description': 'Factorización de diferencia de potencias',
-            'difficulty': 'Fácil'
-        },
-        {
-            'title': 'Polinomio con coeficiente principal',
-            'polynomial': '2x^3 - 3x^2 + x - 2',
-            'root': 2,
-            'description': 'Polinomio con coeficiente principal diferente de 1',
-            'difficulty': 'Avanzado'
-        },
-        {
-            'title': 'Polinomio cuadrático',
-            'polynomial': 'x^2 - 5x + 6',
-            'root': 3,
-            'description': 'Un polinomio cuadrático clásico',
-            'difficulty': 'Fácil'
-        },
-        {
-            'title': 'Polinomio con raíz negativa',
-            'polynomial': 'x^3 + x^2 - 2x',
-            'root': -2,
-            'description': 'División por un binomio con raíz negativa',
-            'difficulty': 'Intermedio'
-        }
-    ]
     
-    return jsonify(examples)
+    El cuerpo se serializa una sola vez al importar el módulo; los clientes
+    que envían If-None-Match con el ETag vigente reciben un 304 sin cuerpo.
+    """
+    return static_json_response(EXAMPLES_BODY, EXAMPLES_ETAG)
 
 @app.route('/ai-tutor', methods=['POST'])
 def ai_tutor():
@@ -162,16 +830,11 @@ def ai_tutor():
     try:
         data = request.get_json()
         question = data.get('question', '').strip().lower()
-        context = data.get('context', {})
         
-        # Generar respuesta del tutor basada en la pregunta
-        response = generate_tutor_response(question, context)
+        # Respuesta precalculada para la palabra clave de la pregunta
+        keyword = find_tutor_keyword(question)
         
-        return jsonify({
-            'success': True,
-            'response': response,
-            'type': 'tutor_help'
-        })
+        return app.response_class(TUTOR_BODIES[keyword], mimetype='application/json')
         
     except Exception as e:
         return jsonify({
@@ -179,11 +842,353 @@ def ai_tutor():
             'error': f'Error en el tutor: {str(e)}'
         }), 500
 
+@app.route('/cache/stats')
+def cache_stats():
+    """
+    Endpoint de monitorización con los contadores de la caché de resultados
+    """
+    return jsonify(result_cache.stats())
+
+@app.route('/explanation/<explanation_id>')
+def explanation(explanation_id):
+    """
+    Explicación de IA de un cálculo hecho con include_explanation: false
+    
+    Se genera al pedirla y se envía en streaming como texto plano, por
+    fragmentos, sin construirla entera en memoria. La división sale de la
+    caché de resultados o se repite con los mismos límites que /calculate.
+    """
+    pending = explanation_requests.get(explanation_id)
+    
+    if pending is None:
+        return jsonify({
+            'success': False,
+            'error': 'Explicación no encontrada o caducada; repite el cálculo'
+        }), 404
+    
+    polynomial, terms, root, exact = pending
+    try:
+        # La explicación necesita la tabla densa, aunque el cálculo original fuera disperso
+        admit(polynomial, exact=exact)
+        division = cached_division(polynomial, terms, root, exact)
+    except AdmissionError as e:
+        return admission_response(e)
+    except ComputePoolBusy as e:
+        return busy_response(e)
+    except Exception as e:
+        return jsonify({
+            'success': False,
+            'error': f'Error interno del servidor: {str(e)}'
+        }), 500
+    
+    chunks = calculator.iter_explanation(
+        polynomial, division.root, division.quotient_coefficients, division.remainder, trace=division
+    )
+    
+    return Response(chunks, mimetype='text/plain; charset=utf-8')
+
+@app.route('/metrics')
+def prometheus_metrics():
+    """
+    Endpoint de métricas en formato de texto de Prometheus
+    """
+    return Response(metrics.render(), mimetype='text/plain; version=0.0.4; charset=utf-8')
+
+@app.route('/status')
+def status():
+    """
+    Endpoint con información sobre el estado del servidor
+    """
+    return jsonify({
+        'success': True,
+        'status': 'running',
+        'version': API_VERSION,
+        'uptime': int(time.time() - STARTED_AT),
+        'calculations_performed': int(calculations.total())
+    })
+
 @app.route('/static/<path:filename>')
 def static_files(filename):
     """Servir archivos estáticos"""
     return send_from_directory('static', filename)
 
+# Funciones auxiliares para la caché de resultados
+def normalized_key(terms):
+    """Clave de caché a partir de la forma dispersa: 'x^2-4' y 'x^2 - 4' coinciden"""
+    return tuple(sorted(terms.items()))
+
+def calculate_cached(polynomial, terms, root, include_steps=True, include_explanation=True, exact=False,
+                     verify=False):
+    """
+    Realiza el cálculo a través de la caché de resultados
+    
+    La caché guarda el RuffiniResult compacto de la división, común a
+    todas las opciones; los pasos y la explicación se generan al responder.
+    Los polinomios dispersos sin pasos, explicación ni verificación se
+    dividen sin expandir y se guardan ya como diccionario.
+    
+    Si falta en la caché y ya hay un cálculo idéntico en curso (por
+    ejemplo, toda una clase enviando el mismo ejemplo), se espera a ese.
+    """
+    if not include_steps and not include_explanation and not verify and calculator.is_sparse(terms):
+        degree = max(terms, default=0)
+        key = ('sparse', normalized_key(terms), root, exact)
+        result = result_cache.get(key)
+        if result is None:
+            result = in_flight.do(key, lambda: compute_and_store(
+                key, degree, 'calculate_coefficients', polynomial, terms, root, False, False, exact, verify))
+        calculations.inc()
+        return personalize_result(result, polynomial)
+    
+    division = cached_division(polynomial, terms, root, exact)
+    calculations.inc()
+    return render_result(division, polynomial, include_steps, include_explanation, verify)
+
+def cached_division(polynomial, terms, root, exact=False):
+    """RuffiniResult de la división, de la caché o calculado una sola vez entre las peticiones en curso"""
+    key = ('divide', normalized_key(terms), root, exact)
+    division = result_cache.get(key)
+    
+    if division is None:
+        division = in_flight.do(key, lambda: compute_and_store(
+            key, max(terms, default=0), 'divide', polynomial, terms, root, exact))
+    return division
+
+def compute_and_store(key, degree, method, *args):
+    """run_heavy guardando el resultado en la caché antes de entregarlo a quienes esperan"""
+    result = run_heavy(degree, method, *args)
+    result_cache.set(key, result)
+    return result
+
+def render_result(division, polynomial, include_steps, include_explanation, verify=False):
+    """
+    Convierte un RuffiniResult en el diccionario JSON de la respuesta
+    
+    Los pasos completos (O(n²)) y la explicación se generan en el pool de
+    procesos si el grado lo justifica, con su control de carga y su
+    límite de tiempo de CPU; la traza compacta se genera aquí mismo.
+    """
+    if include_steps is True or include_explanation:
+        return run_heavy(division.degree, 'render', division, polynomial,
+                         include_steps, include_explanation, verify)
+    return calculator.render(division, polynomial, include_steps, include_explanation, verify)
+
+def admit_division(polynomial, divisor, exact=False):
+    """
+    admit para la división entre un divisor cualquiera, antes de parsear ninguno de los dos
+    
+    La división hace un paso por coeficiente del cociente y cada paso
+    recorre el divisor, así que el coste es del orden de (n - m + 1)·(m + 1).
+    """
+    dividend_degree = admit(polynomial, exact=exact)['degree']
+    
+    if isinstance(divisor, str):
+        divisor_degree = admit(divisor, exact=exact)['degree']
+    elif isinstance(divisor, list):
+        if len(divisor) > app.config['MAX_DEGREE'] + 1:
+            raise AdmissionError(f"El grado máximo admitido es {app.config['MAX_DEGREE']}")
+        divisor_degree = len(divisor) - 1
+    else:
+        return  # calculate_with_divisor genera la respuesta de error
+    
+    check_cost(dividend_degree + divisor_degree + 2
+               + max(dividend_degree - divisor_degree + 1, 0) * (divisor_degree + 1))
+
+def calculate_with_divisor(polynomial, divisor, include_steps, exact, verify=False):
+    """Respuesta de /calculate con 'divisor' (cadena o lista de coeficientes) en lugar de 'root'"""
+    admit_division(polynomial, divisor, exact)
+    
+    try:
+        if isinstance(divisor, str):
+            divisor_terms = calculator.parse_polynomial_terms(divisor, exact)
+        else:
+            values = [parse_root(coef, exact) for coef in divisor]
+            divisor_terms = {len(values) - 1 - i: coef for i, coef in enumerate(values) if coef != 0}
+        if not any(coef != 0 for coef in divisor_terms.values()):
+            raise ValueError('El divisor no puede ser el polinomio nulo')
+    except Exception as e:
+        return jsonify({
+            'success': False,
+            'error': f'Divisor no válido: {e}'
+        }), 400
+    
+    try:
+        start = time.perf_counter()
+        terms = calculator.parse_polynomial_terms(polynomial, exact)
+        observe_stage('parse', time.perf_counter() - start)
+    except Exception:
+        # El calculador genera la respuesta de error con ayuda de IA
+        return jsonify(calculator.calculate(polynomial, 0, exact=exact))
+    
+    include_steps = bool(include_steps)
+    key = ('divisor', normalized_key(terms), normalized_key(divisor_terms), include_steps, exact, verify)
+    result = result_cache.get(key)
+    
+    if result is None:
+        result = in_flight.do(key, lambda: compute_and_store(
+            key, max(terms, default=0), 'calculate_divisor',
+            polynomial, terms, divisor_terms, include_steps, exact, verify))
+    
+    calculations.inc()
+    return negotiated_response(personalize_result(result, polynomial))
+
+def register_explanation(polynomial, terms, root, exact=False):
+    """Guarda lo necesario para generar la explicación más tarde y devuelve su id"""
+    explanation_id = hashlib.sha1(repr((polynomial, root, exact)).encode('utf-8')).hexdigest()[:16]
+    explanation_requests.set(explanation_id, (polynomial, terms, root, exact))
+    return explanation_id
+
+def personalize_result(result, polynomial):
+    """Adapta un resultado de la caché a la cadena enviada en esta petición"""
+    cached_polynomial = result['polynomial']
+    if cached_polynomial == polynomial:
+        return result
+    
+    result = dict(result, polynomial=polynomial)
+    if 'ai_explanation' in result:
+        result['ai_explanation'] = result['ai_explanation'].replace(
+            f"Dividir el polinomio: {cached_polynomial}\n",
+            f"Dividir el polinomio: {polynomial}\n",
+            1
+        )
+    
+    return result
+
+# Funciones auxiliares para cálculos en lote
+def parse_root(value, exact=False):
+    """Convierte la raíz recibida: float, o int/Fraction en modo exacto ('1/2' admitido)"""
+    if exact:
+        return calculator.to_exact(value)
+    return float(value)
+
+def parse_steps_option(value):
+    """Normaliza la opción include_steps: True, False o 'compact'"""
+    if isinstance(value, str):
+        value = value.strip().lower()
+        if value == 'compact':
+            return 'compact'
+        return value not in ('false', 'none', '0', '')
+    return bool(value)
+
+def parse_evaluation_points(data):
+    """Puntos de /evaluate: lista 'x' o rejilla equiespaciada 'range' {start, stop, points}"""
+    if 'range' in data:
+        grid = data['range']
+        start, stop = float(grid['start']), float(grid['stop'])
+        points = int(grid.get('points', 200))
+        if points < 2 or points > app.config['MAX_EVALUATE_POINTS']:
+            raise ValueError('Número de puntos fuera de rango')
+        step = (stop - start) / (points - 1)
+        return [start + i * step for i in range(points)]
+    
+    xs = [float(x) for x in data['x']]
+    if not xs:
+        raise ValueError('La lista de puntos está vacía')
+    return xs
+
+def batch_cost(jobs, include_steps, include_explanation, verify=False):
+    """
+    Coste estimado de todo el lote: la suma de cada trabajo, contando los repetidos
+    
+    Los trabajos que no superan admit (o no son válidos) no suman: se
+    responden con su propio error sin calcular nada.
+    """
+    costs = {}  # polinomio -> coste de un trabajo
+    total = 0
+    for job in jobs:
+        polynomial = job.get('polynomial') if isinstance(job, dict) else None
+        if not isinstance(polynomial, str):
+            continue
+        polynomial = polynomial.strip()
+        if polynomial not in costs:
+            if len(polynomial) > app.config['MAX_POLYNOMIAL_LENGTH']:
+                costs[polynomial] = 0
+            else:
+                estimate = estimate_cost(polynomial, quadratic=include_steps is True,
+                                         sparse=not include_steps and not include_explanation and not verify)
+                over_limit = (estimate['degree'] > app.config['MAX_DEGREE']
+                              or estimate['cost'] > app.config['MAX_REQUEST_COST'])
+                costs[polynomial] = 0 if over_limit else estimate['cost']
+        total += costs[polynomial]
+    return total
+
+def run_batch_roots(polynomial, roots):
+    """
+    Lote de un polinomio con muchas raíces, sin pasos ni explicación
+    
+    Hace todas las divisiones a la vez con calculator.calculate_many (el
+    motor vectorizado de ruffini_division_many). Devuelve None si el lote
+    no se presta: alguna raíz no numérica, polinomio no válido o no
+    admitido, o disperso (la división dispersa ya salta los huecos). En
+    ese caso se procesa trabajo a trabajo, que da el error de cada uno.
+    """
+    if not isinstance(polynomial, str) or not polynomial.strip():
+        return None
+    polynomial = polynomial.strip()
+    
+    try:
+        values = [parse_root(root) for root in roots]
+        admit(polynomial, sparse=True)
+        terms = calculator.parse_polynomial_terms(polynomial)
+    except Exception:
+        return None
+    
+    if calculator.is_sparse(terms):
+        return None
+    
+    results = run_heavy(max(terms), 'calculate_many', polynomial, terms, values)
+    calculations.inc(len(results))
+    return results
+
+def run_batch_job(job, parsed, include_steps, include_explanation, exact=False, verify=False):
+    """Ejecuta un trabajo del lote reutilizando los polinomios ya parseados"""
+    if not isinstance(job, dict):
+        return {'success': False, 'error': 'Cada trabajo debe ser un objeto JSON'}
+    
+    polynomial = job.get('polynomial')
+    polynomial = polynomial.strip() if isinstance(polynomial, str) else ''
+    
+    if not polynomial:
+        return {'success': False, 'error': 'El polinomio es requerido'}
+    
+    try:
+        root = parse_root(job.get('root'), exact)
+    except (ValueError, TypeError, ZeroDivisionError):
+        return {
+            'success': False,
+            'polynomial': polynomial,
+            'error': 'La raíz debe ser un número válido'
+        }
+    
+    if polynomial not in parsed:
+        try:
+            admit(polynomial, quadratic=include_steps is True,
+                  sparse=not include_steps and not include_explanation and not verify, exact=exact)
+            parsed[polynomial] = calculator.parse_polynomial_terms(polynomial, exact)
+        except Exception as e:
+            parsed[polynomial] = e
+    
+    coefficients = parsed[polynomial]
+    if isinstance(coefficients, Exception):
+        return {
+            'success': False,
+            'polynomial': polynomial,
+            'root': root,
+            'error': str(coefficients)
+        }
+    
+    try:
+        return calculate_cached(polynomial, coefficients, root, include_steps, include_explanation, exact, verify)
+    except ComputePoolBusy:
+        raise  # Todo el lote responde 503
+    except Exception as e:
+        return {
+            'success': False,
+            'polynomial': polynomial,
+            'root': root,
+            'error': str(e)
+        }
+
 # Funciones auxiliares para IA
 def generate_format_suggestions():
     """Genera sugerencias de formato para polinomios"""
@@ -199,7 +1204,7 @@ def generate_error_suggestions(polynomial, error):
     """Genera sugerencias específicas basadas en errores"""
     suggestions = []
     
-    if "invalid" in error.lower():
+    if "invalid" in error.lower() or "posición" in error:
         suggestions.append("Verifica la sintaxis del polinomio")
         suggestions.append("Asegúrate de usar ^ para exponentes")
     
@@ -263,12 +1268,25 @@ def generate_polynomial_analysis(polynomial, coefficients):
     
     return analysis
 
-def generate_tutor_response(question, context):
-    """Genera respuesta del tutor basada en la pregunta"""
+def find_tutor_keyword(question):
+    """
+    Palabra clave del tutor presente en la pregunta (None si no hay ninguna)
+    
+    Solo se comprueban las claves cuya primera palabra aparece en la
+    pregunta; si hay varias, gana la primera en el orden de TUTOR_RESPONSES.
+    """
+    candidates = set()
+    for word in WORD_PATTERN.findall(question):
+        candidates.update(TUTOR_KEYWORD_INDEX.get(word, ()))
     
-    # Respuestas predefinidas del tutor
-    responses = {
-        'que es ruffini': """🎓 ¿Qué es el método de Ruffini?
+    for keyword in sorted(candidates, key=TUTOR_KEYWORD_ORDER.__getitem__):
+        if keyword in question:
+            return keyword
+    return None
+
+# Respuestas predefinidas del tutor
+TUTOR_RESPONSES = {
+    'que es ruffini': """🎓 ¿Qué es el método de Ruffini?
 
 El método de Ruffini es una técnica simplificada para dividir polinomios por binomios de la forma (x - a).
 
@@ -284,7 +1302,7 @@ El método de Ruffini es una técnica simplificada para dividir polinomios por b
 • Menos propenso a errores
 • Útil para factorizar polinomios""",
 
-        'como usar': """📚 ¿Cómo usar esta calculadora?
+    'como usar': """📚 ¿Cómo usar esta calculadora?
 
 1️⃣ **Ingresa tu polinomio**
    • Formato: x^3 + 2x^2 - 5x + 6
@@ -300,7 +1318,7 @@ El método de Ruffini es una técnica simplificada para dividir polinomios por b
    • Obtén explicaciones detalladas
    • Verifica el resultado automáticamente""",
 
-        'errores comunes': """⚠️ Errores comunes y cómo evitarlos
+    'errores comunes': """⚠️ Errores comunes y cómo evitarlos
 
 ❌ **Error de formato**
 • Malo: x3 + 2x2 - 5x + 6
@@ -316,7 +1334,7 @@ El método de Ruffini es una técnica simplificada para dividir polinomios por b
 
 💡 **Consejo**: Usa el botón "Ejemplo" para ver formatos correctos!""",
 
-        'interpretar resultado': """🧠 ¿Cómo interpretar el resultado?
+    'interpretar resultado': """🧠 ¿Cómo interpretar el resultado?
 
 📋 **El resultado tiene dos partes:**
 
@@ -336,7 +1354,7 @@ El método de Ruffini es una técnica simplificada para dividir polinomios por b
 • Si resto = 0, la raíz es una solución del polinomio
 • Si resto ≠ 0, la raíz no es solución exacta""",
 
-        'ejemplo paso a paso': """📖 Ejemplo paso a paso
+    'ejemplo paso a paso': """📖 Ejemplo paso a paso
 
 **Problema:** Dividir x³ + 2x² - 5x + 6 entre (x - 2)
 
@@ -358,15 +1376,10 @@ El método de Ruffini es una técnica simplificada para dividir polinomios por b
 
 **Verificación:**
 (x² + 4x + 3)(x - 2) + 12 = x³ + 2x² - 5x + 6 ✓"""
-    }
-    
-    # Buscar respuesta más relevante
-    for keyword, response in responses.items():
-        if keyword in question:
-            return response
-    
-    # Respuesta por defecto
-    return """🤖 ¡Hola! Soy tu tutor de IA para el método de Ruffini.
+}
+
+# Respuesta por defecto
+TUTOR_DEFAULT_RESPONSE = """🤖 ¡Hola! Soy tu tutor de IA para el método de Ruffini.
 
 💬 Puedes preguntarme sobre:
 • "¿Qué es Ruffini?"
@@ -377,6 +1390,62 @@ El método de Ruffini es una técnica simplificada para dividir polinomios por b
 
 ¡Escribe tu pregunta y te ayudo! 😊"""
 
+WORD_PATTERN = re.compile(r'\w+')
+
+# Índice primera palabra -> claves, para no recorrer todas las respuestas en cada pregunta
+TUTOR_KEYWORD_ORDER = {keyword: i for i, keyword in enumerate(TUTOR_RESPONSES)}
+TUTOR_KEYWORD_INDEX = {}
+for _keyword in TUTOR_RESPONSES:
+    TUTOR_KEYWORD_INDEX.setdefault(WORD_PATTERN.findall(_keyword)[0], []).append(_keyword)
+
+# Cuerpos JSON de /ai-tutor ya serializados; la clave None es la respuesta por defecto
+TUTOR_BODIES = {
+    keyword: app.json.dumps({'success': True, 'response': text, 'type': 'tutor_help'}) + '\n'
+    for keyword, text in [*TUTOR_RESPONSES.items(), (None, TUTOR_DEFAULT_RESPONSE)]
+}
+
+# Ejemplos de /examples, serializados una vez con su ETag
+EXAMPLES = [
+    {
+        'title': 'Polinomio cúbico simple',
+        'polynomial': 'x^3 + 2x^2 - 5x + 6',
+        'root': 2,
+        'description': 'Un polinomio de grado 3 con coeficientes mixtos',
+        'difficulty': 'Intermedio'
+    },
+    {
+        'title': 'Diferencia de cuadrados',
+        'polynomial': 'x^4 - 1',
+        'root': 1,
+        'description': 'Factorización de diferencia de potencias',
+        'difficulty': 'Fácil'
+    },
+    {
+        'title': 'Polinomio con coeficiente principal',
+        'polynomial': '2x^3 - 3x^2 + x - 2',
+        'root': 2,
+        'description': 'Polinomio con coeficiente principal diferente de 1',
+        'difficulty': 'Avanzado'
+    },
+    {
+        'title': 'Polinomio cuadrático',
+        'polynomial': 'x^2 - 5x + 6',
+        'root': 3,
+        'description': 'Un polinomio cuadrático clásico',
+        'difficulty': 'Fácil'
+    },
+    {
+        'title': 'Polinomio con raíz negativa',
+        'polynomial': 'x^3 + x^2 - 2x',
+        'root': -2,
+        'description': 'División por un binomio con raíz negativa',
+        'difficulty': 'Intermedio'
+    }
+]
+
+EXAMPLES_BODY = app.json.dumps(EXAMPLES) + '\n'
+EXAMPLES_ETAG = hashlib.sha256(EXAMPLES_BODY.encode('utf-8')).hexdigest()[:32]
+
 if __name__ == '__main__':
     # Crear directorio de templates si no existe
     templates_dir = os.path.join(os.path.dirname(__file__), 'templates')
@@ -394,5 +1463,7 @@ if __name__ == '__main__':
         print("📚 Presiona Ctrl+C para detener el servidor")
     else:
         print("🌐 Servidor en modo producción")
+        print("💡 Para producción se recomienda: gunicorn -k gthread --threads 32 'app:create_app()'")
+        create_app()
     
-    app.run(host='0.0.0.0', port=port, debug=debug)
+    app.run(host='0.0.0.0', port=port, debug=debug, threaded=True)
@@ -0,0 +1,16 @@
+#!/usr/bin/env python3
+"""
+Punto de entrada ASGI para la Calculadora de Ruffini
+Permite servir la aplicación con uvicorn o hypercorn (requiere asgiref)
+
+Uso:
+    uvicorn asgi:application --host 0.0.0.0 --port 5000
+"""
+
+from asgiref.wsgi import WsgiToAsgi
+
+from app import create_app
+
+# Flask es WSGI: cada petición se atiende en un hilo del adaptador y los
+# cálculos de grado alto se envían al pool de procesos de create_app
+application = WsgiToAsgi(create_app())
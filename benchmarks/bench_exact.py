@@ -0,0 +1,47 @@
+#!/usr/bin/env python3
+"""
+Benchmark de la aritmética de la división de Ruffini
+Compara los modos float, entero exacto (int) y racional exacto (Fraction)
+"""
+
+import os
+import sys
+import timeit
+from fractions import Fraction
+
+# Agregar el directorio padre al path para importar la calculadora
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.ruffini_calculator import RuffiniCalculator
+
+
+def run(degrees=(10, 50, 200, 1000)):
+    """Ejecuta el benchmark e imprime los tiempos por división"""
+    calculator = RuffiniCalculator()
+    
+    print(f"{'grado':>6} {'float (ms)':>11} {'int (ms)':>10} {'Fraction (ms)':>14}")
+    for degree in degrees:
+        int_coefficients = [((i * 7) % 19) - 9 for i in range(degree + 1)]
+        int_coefficients[0] = 1
+        float_coefficients = [float(c) for c in int_coefficients]
+        
+        modes = [
+            (float_coefficients, 0.5),
+            (int_coefficients, 2),
+            (int_coefficients, Fraction(1, 2)),
+        ]
+        
+        timings = []
+        for coefficients, root in modes:
+            number = max(1, 20000 // (degree + 1))
+            elapsed = min(timeit.repeat(
+                lambda: calculator.synthetic_division(coefficients, root),
+                number=number, repeat=3
+            ))
+            timings.append(elapsed / number * 1000)
+        
+        print(f"{degree:>6} {timings[0]:>11.4f} {timings[1]:>10.4f} {timings[2]:>14.4f}")
+
+
+if __name__ == '__main__':
+    run()
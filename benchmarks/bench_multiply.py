@@ -0,0 +1,46 @@
+#!/usr/bin/env python3
+"""
+Benchmark del producto de polinomios
+Compara el producto clásico con el que elige multiply (Karatsuba o FFT) y mide la expansión de (x - 1)^n
+"""
+
+import os
+import sys
+import timeit
+
+# Agregar el directorio padre al path para importar la calculadora
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.polynomial_arithmetic import multiply, power, _schoolbook
+
+
+def run(degrees=(16, 64, 256, 1024, 4096)):
+    """Ejecuta el benchmark e imprime los tiempos por producto"""
+    print(f"{'grado':>6} {'clásico int (ms)':>17} {'multiply int (ms)':>18} {'multiply float (ms)':>20}")
+    for degree in degrees:
+        int_coefficients = [((i * 7) % 19) - 9 or 1 for i in range(degree + 1)]
+        float_coefficients = [float(c) for c in int_coefficients]
+        
+        cases = [
+            lambda: _schoolbook(int_coefficients, int_coefficients),
+            lambda: multiply(int_coefficients, int_coefficients),
+            lambda: multiply(float_coefficients, float_coefficients),
+        ]
+        
+        timings = []
+        for case in cases:
+            number = max(1, 200000 // (degree + 1) ** 2)
+            elapsed = min(timeit.repeat(case, number=number, repeat=3))
+            timings.append(elapsed / number * 1000)
+        
+        print(f"{degree:>6} {timings[0]:>17.4f} {timings[1]:>18.4f} {timings[2]:>20.4f}")
+    
+    print()
+    for exponent in (100, 500, 2000):
+        for label, base in (('int', [1, -1]), ('float', [1.0, -1.0])):
+            elapsed = min(timeit.repeat(lambda: power(base, exponent), number=1, repeat=3))
+            print(f"(x - 1)^{exponent} {label:>5}: {elapsed * 1000:.2f} ms")
+
+
+if __name__ == '__main__':
+    run()
@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+"""
+Microbenchmark del parser de polinomios
+Compara el parser de una sola pasada con el parser anterior basado en varias regex
+"""
+
+import os
+import re
+import sys
+import timeit
+
+# Agregar el directorio padre al path para importar la calculadora
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.ruffini_calculator import RuffiniCalculator
+
+
+def legacy_parse_polynomial(poly_str):
+    """Parser anterior (varias pasadas de regex), conservado como referencia"""
+    poly_str = poly_str.replace(' ', '').replace('-', '+-')
+    
+    degrees = re.findall(r'x\^(\d+)', poly_str)
+    if not degrees:
+        max_degree = 1 if 'x' in poly_str else 0
+    else:
+        max_degree = max(map(int, degrees))
+    
+    coefficients = [0] * (max_degree + 1)
+    terms = re.findall(r'[+-]?[^+-]+', poly_str)
+    
+    for term in terms:
+        term = term.strip()
+        if not term:
+            continue
+        
+        if 'x' not in term:
+            coefficients[max_degree] = float(term)
+        else:
+            coef_match = re.match(r'([+-]?\d*)', term)
+            coef_str = coef_match.group(1) if coef_match else '1'
+            
+            if coef_str == '' or coef_str == '+':
+                coef = 1
+            elif coef_str == '-':
+                coef = -1
+            else:
+                coef = float(coef_str)
+            
+            if '^' in term:
+                degree_match = re.search(r'x\^(\d+)', term)
+                degree = int(degree_match.group(1)) if degree_match else 1
+            else:
+                degree = 1
+            
+            coefficients[max_degree - degree] = coef
+    
+    return coefficients
+
+
+def dense_polynomial(degree):
+    """Genera un polinomio denso de grado dado: x^n - 2x^(n-1) + 3x^(n-2) ..."""
+    terms = []
+    for i, d in enumerate(range(degree, -1, -1)):
+        coef = (i % 9) + 1
+        sign = '-' if i % 2 else '+'
+        if d == 0:
+            terms.append(f"{sign} {coef}")
+        elif d == 1:
+            terms.append(f"{sign} {coef}x")
+        else:
+            terms.append(f"{sign} {coef}x^{d}")
+    return ' '.join(terms).lstrip('+ ')
+
+
+def run(degrees=(3, 10, 100, 1000, 10000, 30000)):
+    """Ejecuta el benchmark e imprime los tiempos por llamada"""
+    calculator = RuffiniCalculator()
+    
+    print(f"{'grado':>8} {'anterior (ms)':>15} {'nuevo (ms)':>12} {'aceleración':>12}")
+    for degree in degrees:
+        poly = dense_polynomial(degree)
+        assert legacy_parse_polynomial(poly) == calculator.parse_polynomial(poly)
+        
+        number = max(1, 20000 // (degree + 1))
+        legacy = min(timeit.repeat(lambda: legacy_parse_polynomial(poly), number=number, repeat=3)) / number
+        new = min(timeit.repeat(lambda: calculator.parse_polynomial(poly), number=number, repeat=3)) / number
+        
+        print(f"{degree:>8} {legacy * 1000:>15.3f} {new * 1000:>12.3f} {legacy / new:>11.1f}x")
+
+
+if __name__ == '__main__':
+    run()
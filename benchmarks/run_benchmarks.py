@@ -0,0 +1,252 @@
+#!/usr/bin/env python3
+"""
+Suite de benchmarks de la Calculadora de Ruffini
+Mide por separado cada etapa del cálculo y los endpoints HTTP, y guarda los resultados en JSON
+
+Uso:
+    python benchmarks/run_benchmarks.py --output resultados.json
+    python benchmarks/run_benchmarks.py --quick --compare resultados.json
+"""
+
+import argparse
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import time
+from datetime import datetime, timezone
+
+# Agregar el directorio padre al path para importar la calculadora
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(ROOT_DIR)
+
+from src.ruffini_calculator import RuffiniCalculator, np
+from benchmarks.bench_parser import dense_polynomial
+
+DEGREES = [1, 10, 100, 1000, 10000, 100000]
+QUICK_DEGREES = [1, 10, 100, 1000]
+
+# Las etapas que generan los pasos completos son O(n²); por encima de este
+# grado se omiten para que la suite termine en un tiempo razonable
+MAX_DEGREE_WITH_STEPS = 1000
+
+ROOT = 2.0
+
+# Raíces del cribado de un polinomio por muchas raíces a la vez (en [-1, 1)
+# para que los valores no desborden). Es O(grado · raíces): por encima de
+# MAX_DEGREE_SCREENING se omite
+SCREEN_ROOTS = [k / 500 for k in range(-500, 500)]
+MAX_DEGREE_SCREENING = 10000
+
+
+def sparse_polynomial(degree):
+    """Polinomio disperso de grado dado con como mucho cuatro términos"""
+    if degree <= 1:
+        return dense_polynomial(degree)
+    return f"x^{degree} - 3x^{degree // 2} + 2x - 7"
+
+
+def measure(func, min_time=0.2, repeat=5):
+    """
+    Mide func y devuelve estadísticas por llamada
+
+    Ajusta el número de llamadas por repetición para que cada una dure al
+    menos min_time / repeat segundos.
+    """
+    number = 1
+    target = min_time / repeat
+    while True:
+        start = time.perf_counter()
+        for _ in range(number):
+            func()
+        elapsed = time.perf_counter() - start
+        if elapsed >= target or number >= 1 << 20:
+            break
+        number *= 2 if elapsed == 0 else max(2, min(10, int(target / elapsed) + 1))
+
+    samples = [elapsed / number]
+    for _ in range(repeat - 1):
+        start = time.perf_counter()
+        for _ in range(number):
+            func()
+        samples.append((time.perf_counter() - start) / number)
+
+    return {
+        'best': min(samples),
+        'median': statistics.median(samples),
+        'number': number,
+        'repeat': repeat
+    }
+
+
+def stage_benchmarks(calculator, polynomial, degree):
+    """Funciones a medir para un polinomio: nombre -> (callable, necesita pasos)"""
+    coefficients = calculator.parse_polynomial(polynomial)
+    terms = calculator.parse_polynomial_terms(polynomial)
+    quotient, remainder, steps = (
+        calculator.ruffini_division_steps(coefficients, ROOT)
+        if degree <= MAX_DEGREE_WITH_STEPS else (None, None, None)
+    )
+    fast_quotient, _ = calculator.synthetic_division(coefficients, ROOT)
+
+    benchmarks = {
+        'parse_polynomial': (lambda: calculator.parse_polynomial(polynomial), False),
+        'parse_polynomial_terms': (lambda: calculator.parse_polynomial_terms(polynomial), False),
+        'ruffini_division': (lambda: calculator.ruffini_division_steps(coefficients, ROOT), True),
+        'synthetic_division': (lambda: calculator.synthetic_division(coefficients, ROOT), False),
+        'ruffini_division_sparse': (lambda: calculator.ruffini_division_sparse(terms, ROOT), False),
+        'format_polynomial': (lambda: calculator.format_polynomial(fast_quotient), False),
+        'generate_ai_explanation': (
+            lambda: calculator.generate_ai_explanation(polynomial, ROOT, quotient, remainder, steps), True
+        ),
+        'calculate': (lambda: calculator.calculate(polynomial, ROOT), True),
+        'calculate_fast': (
+            lambda: calculator.calculate(polynomial, ROOT, include_steps=False, include_explanation=False), False
+        ),
+    }
+
+    if degree <= MAX_DEGREE_SCREENING:
+        # Cribado por SCREEN_ROOTS: una synthetic_division por raíz frente al motor vectorizado
+        benchmarks['synthetic_division_roots'] = (
+            lambda: [calculator.synthetic_division(coefficients, root) for root in SCREEN_ROOTS], False
+        )
+        if np is not None:
+            benchmarks['ruffini_division_many'] = (
+                lambda: calculator.ruffini_division_many(coefficients, SCREEN_ROOTS), False
+            )
+
+    return benchmarks
+
+
+def http_benchmarks(client, polynomial):
+    """Endpoints a medir con el cliente de pruebas de Flask"""
+    def post(path, payload):
+        response = client.post(path, json=payload)
+        assert response.status_code == 200, response.status_code
+        return response
+
+    return {
+        'http_calculate': (lambda: post('/calculate', {'polynomial': polynomial, 'root': ROOT}), True),
+        'http_calculate_fast': (lambda: post('/calculate', {
+            'polynomial': polynomial, 'root': ROOT,
+            'include_steps': False, 'include_explanation': False
+        }), False),
+        'http_validate': (lambda: post('/validate', {'polynomial': polynomial}), False),
+    }
+
+
+def make_client():
+    """Cliente de pruebas de Flask con la caché de resultados y el límite de peticiones desactivados"""
+    os.environ['RUFFINI_CACHE_SIZE'] = '0'
+    os.environ['RUFFINI_RATE_LIMIT'] = '0'
+    from app import app
+
+    app.config['TESTING'] = True
+    return app.test_client()
+
+
+def git_commit():
+    try:
+        return subprocess.check_output(
+            ['git', 'rev-parse', '--short', 'HEAD'], cwd=ROOT_DIR, stderr=subprocess.DEVNULL
+        ).decode().strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def run(degrees, min_time, include_http=True, only=None):
+    """Ejecuta la suite y devuelve el documento de resultados"""
+    calculator = RuffiniCalculator()
+    client = make_client() if include_http else None
+    results = []
+
+    for shape, generator in (('dense', dense_polynomial), ('sparse', sparse_polynomial)):
+        for degree in degrees:
+            polynomial = generator(degree)
+            benchmarks = stage_benchmarks(calculator, polynomial, degree)
+            if client is not None:
+                benchmarks.update(http_benchmarks(client, polynomial))
+
+            for name, (func, needs_steps) in benchmarks.items():
+                if only and name not in only:
+                    continue
+                if needs_steps and degree > MAX_DEGREE_WITH_STEPS:
+                    continue
+
+                stats = measure(func, min_time)
+                results.append(dict(benchmark=name, shape=shape, degree=degree, **stats))
+                print(f"{name:<26} {shape:<7} {degree:>7} {stats['best'] * 1e3:>12.4f} ms", file=sys.stderr)
+
+    return {
+        'meta': {
+            'timestamp': datetime.now(timezone.utc).isoformat(),
+            'commit': git_commit(),
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'min_time': min_time
+        },
+        'results': results
+    }
+
+
+def compare(current, baseline, threshold):
+    """
+    Compara con una ejecución anterior y devuelve las regresiones
+
+    Una medición es regresión si su mejor tiempo supera al de referencia
+    en un factor mayor que threshold.
+    """
+    reference = {
+        (r['benchmark'], r['shape'], r['degree']): r['best'] for r in baseline['results']
+    }
+    regressions = []
+
+    for r in current['results']:
+        key = (r['benchmark'], r['shape'], r['degree'])
+        if key in reference and reference[key] > 0:
+            ratio = r['best'] / reference[key]
+            if ratio > threshold:
+                regressions.append(dict(benchmark=key[0], shape=key[1], degree=key[2], ratio=ratio))
+
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Benchmarks de la Calculadora de Ruffini')
+    parser.add_argument('--output', '-o', help='Fichero JSON de resultados (por defecto stdout)')
+    parser.add_argument('--quick', action='store_true', help=f'Solo grados {QUICK_DEGREES}')
+    parser.add_argument('--degrees', type=int, nargs='+', help='Grados a medir')
+    parser.add_argument('--only', nargs='+', help='Medir solo estos benchmarks')
+    parser.add_argument('--no-http', action='store_true', help='Omitir los endpoints HTTP')
+    parser.add_argument('--min-time', type=float, default=0.2,
+                        help='Segundos mínimos de medición por benchmark')
+    parser.add_argument('--compare', help='JSON de una ejecución anterior para detectar regresiones')
+    parser.add_argument('--threshold', type=float, default=1.25,
+                        help='Factor de empeoramiento que cuenta como regresión')
+    args = parser.parse_args(argv)
+
+    degrees = args.degrees or (QUICK_DEGREES if args.quick else DEGREES)
+    document = run(degrees, args.min_time, include_http=not args.no_http, only=args.only)
+
+    text = json.dumps(document, indent=2)
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            f.write(text + '\n')
+    else:
+        print(text)
+
+    if args.compare:
+        with open(args.compare, encoding='utf-8') as f:
+            regressions = compare(document, json.load(f), args.threshold)
+        for r in regressions:
+            print(f"⚠️  Regresión: {r['benchmark']} {r['shape']} grado {r['degree']}: "
+                  f"{r['ratio']:.2f}x más lento", file=sys.stderr)
+        return 1 if regressions else 0
+
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
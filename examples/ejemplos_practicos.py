@@ -173,45 +173,34 @@ class EjemplosRuffini:
         print(f"Objetivo: Factorizar completamente {polynomial}")
         print()
         print("Estrategia:")
-        print("1. Usar el teorema del factor racional")
-        print("2. Probar divisores del término independiente: ±1, ±2, ±3, ±6")
-        print("3. Aplicar Ruffini sucesivamente")
+        print("1. Usar el teorema de la raíz racional para generar candidatos")
+        print("2. Descartar candidatos con cotas y con los tests de P(1) y P(-1)")
+        print("3. Aplicar Ruffini sucesivamente con cada raíz encontrada")
         print()
         
-        # Probar diferentes raíces
-        possible_roots = [1, -1, 2, -2, 3, -3, 6, -6]
-        factors = []
-        current_poly = polynomial
+        result = self.calculator.factor(polynomial)
         
         print("🔍 PROCESO DE FACTORIZACIÓN:")
         print()
         
-        for root in possible_roots:
-            print(f"Probando raíz = {root}...")
-            result = self.calculator.calculate(current_poly, root)
+        if result['success']:
+            print(f"Candidatos evaluados: {result['candidates_tested']}")
+            print()
+            
+            for info in result['roots']:
+                print(f"✅ ¡Raíz encontrada! x = {info['root']} (multiplicidad {info['multiplicity']})")
+                print(f"   Factor: {info['factor']}")
+            
+            print()
+            print("📋 Factorización encontrada:")
+            print(f"{polynomial} = {result['factorization']}")
             
-            if result['success'] and result['remainder'] == 0:
-                print(f"✅ ¡Raíz encontrada! (x - {root}) es un factor")
-                factors.append(f"(x - {root})")
-                current_poly = result['quotient']
-                print(f"Nuevo polinomio a factorizar: {current_poly}")
+            if not result['fully_factored']:
                 print()
-                
-                # Si llegamos a un polinomio cuadrático, podemos parar
-                if len(result['quotient_coefficients']) <= 3:  # grado 2 o menos
-                    print("📋 Factorización encontrada:")
-                    factors_str = " × ".join(factors)
-                    print(f"{polynomial} = {factors_str} × ({current_poly})")
-                    
-                    # Si el cociente final es cuadrático, podríamos factorizarlo más
-                    if len(result['quotient_coefficients']) == 3:
-                        print()
-                        print("💡 El factor cuadrático se puede factorizar usando la fórmula cuadrática o")
-                        print("   continuar con el método de Ruffini si tiene raíces racionales.")
-                    
-                    break
-            else:
-                print("❌ No es una raíz")
+                print(f"💡 El factor {result['remaining_factor']} no tiene raíces racionales;")
+                print("   se puede estudiar con la fórmula cuadrática o métodos numéricos.")
+        else:
+            print(f"❌ Error: {result['error']}")
         
         print("\n" + "="*70 + "\n")
     
@@ -0,0 +1,130 @@
+"""
+Control de admisión de la Calculadora de Ruffini
+Estimación del coste de una petición antes de parsear y limitación de peticiones por cliente
+"""
+
+import re
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, Hashable
+
+try:
+    from src.ruffini_calculator import SPARSE_MIN_DEGREE, literal_digits
+except ImportError:  # Ejecución directa desde src/
+    from ruffini_calculator import SPARSE_MIN_DEGREE, literal_digits
+
+# Exponentes tal como los acepta el parser (x^n, con espacios opcionales)
+_EXPONENT_PATTERN = re.compile(r'\^[ \t]*(\d+)')
+
+# Números tal como los acepta el parser (enteros, decimales y notación científica)
+_LITERAL_PATTERN = re.compile(r'(?:\d+(?:\.\d*)?|\.\d+)(?:[eE][+-]?\d+)?')
+
+# Exponentes con más cifras se consideran infinitos sin convertirlos a int
+_MAX_EXPONENT_DIGITS = 15
+
+
+class AdmissionError(ValueError):
+    """
+    La petición supera un límite y no se atiende
+
+    status es el código HTTP de la respuesta: 413 si es demasiado costosa,
+    429 si el cliente ha agotado su cuota. retry_after (segundos) se envía
+    en la cabecera Retry-After.
+    """
+
+    def __init__(self, message: str, status: int = 413, retry_after: float = None):
+        super().__init__(message)
+        self.status = status
+        self.retry_after = retry_after
+
+
+def estimate_cost(polynomial: str, quadratic: bool = False, sparse: bool = False,
+                  repeat: int = 1) -> Dict[str, int]:
+    """
+    Estima el coste de procesar un polinomio sin parsearlo
+
+    Solo lee los exponentes y los números y cuenta las apariciones de 'x',
+    así que no reserva memoria proporcional al grado: 'x^99999999 + 1'
+    cuesta lo mismo de estimar que 'x^2 + 1'.
+
+    Args:
+        polynomial: Cadena tal como llega en la petición
+        quadratic: Si el trabajo crece con el cuadrado del grado (pasos
+            completos, búsqueda de raíces, desplazamiento de Taylor)
+        sparse: Si la operación puede trabajar en forma dispersa, de modo
+            que cuesta según el número de términos y no según el grado
+        repeat: Veces que se repite el trabajo (raíces, puntos...)
+
+    Returns:
+        Diccionario con 'length', 'degree', 'terms', 'cost' (unidades de
+        trabajo, del orden de coeficientes procesados) y 'digits' (cifras
+        del mayor número en modo exacto, ver literal_digits: '1e5000'
+        cuenta 5001 aunque se escriba con 6 caracteres)
+    """
+    degree = 1 if 'x' in polynomial else 0
+    for exponent in _EXPONENT_PATTERN.findall(polynomial):
+        if len(exponent) > _MAX_EXPONENT_DIGITS:
+            degree = 10 ** _MAX_EXPONENT_DIGITS
+            break
+        degree = max(degree, int(exponent))
+
+    terms = min(polynomial.count('x') + 1, degree + 1)
+    size = degree + 1
+
+    if sparse and degree >= SPARSE_MIN_DEGREE and terms * 4 <= size:
+        cost = terms
+    else:
+        cost = size * size if quadratic else size
+
+    return {
+        'length': len(polynomial),
+        'degree': degree,
+        'terms': terms,
+        'cost': cost * max(repeat, 1),
+        'digits': max((literal_digits(literal) for literal in _LITERAL_PATTERN.findall(polynomial)), default=0)
+    }
+
+
+class TokenBucketLimiter:
+    """
+    Limitador de peticiones por cliente con cubetas de fichas
+
+    Cada cliente dispone de hasta burst fichas que se reponen a razón de
+    rate_per_minute por minuto; cada petición gasta una. Se recuerdan como
+    mucho max_clients clientes (los menos recientes se olvidan, lo que
+    equivale a devolverles la cubeta llena).
+    """
+
+    def __init__(self, rate_per_minute: float, burst: int = None, max_clients: int = 10000):
+        self.rate = rate_per_minute / 60.0
+        self.burst = burst or max(1, int(rate_per_minute))
+        self.max_clients = max_clients
+        self.rejected = 0
+        self._buckets = OrderedDict()
+        self._lock = threading.Lock()
+
+    def acquire(self, client: Hashable) -> float:
+        """
+        Gasta una ficha del cliente
+
+        Returns:
+            0 si la petición se admite, o los segundos hasta la próxima ficha
+        """
+        now = time.monotonic()
+        with self._lock:
+            tokens, updated = self._buckets.pop(client, (self.burst, now))
+            tokens = min(self.burst, tokens + (now - updated) * self.rate)
+
+            if tokens >= 1:
+                wait = 0.0
+                tokens -= 1
+            else:
+                wait = (1 - tokens) / self.rate
+                self.rejected += 1
+
+            self._buckets[client] = (tokens, now)
+            if len(self._buckets) > self.max_clients:
+                self._buckets.popitem(last=False)
+
+        return wait
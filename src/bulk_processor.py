@@ -0,0 +1,240 @@
+#!/usr/bin/env python3
+"""
+Procesamiento masivo no interactivo para la Calculadora de Ruffini
+Lee trabajos (polinomio, raíz) en NDJSON o CSV y escribe un resultado NDJSON por línea
+
+Uso:
+    python src/bulk_processor.py trabajos.ndjson > resultados.ndjson
+    cat trabajos.csv | python src/bulk_processor.py --format csv --workers 8
+"""
+
+import argparse
+import csv
+import json
+import os
+import sys
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from fractions import Fraction
+from itertools import islice
+from typing import Any, Dict, Iterable, Iterator, List, TextIO
+
+try:
+    from src.ruffini_calculator import RuffiniCalculator
+except ImportError:  # Ejecución directa: python src/bulk_processor.py
+    from ruffini_calculator import RuffiniCalculator
+
+# Instancia por proceso (cada worker del pool tiene la suya)
+calculator = RuffiniCalculator()
+
+
+def iter_jobs(stream: TextIO, fmt: str = 'ndjson') -> Iterator[Dict[str, Any]]:
+    """
+    Genera los trabajos de la entrada uno a uno, sin cargarla en memoria
+
+    Cada trabajo lleva 'line' con su número de línea. En NDJSON cada línea es
+    un objeto con 'polynomial' y 'root' (y opcionalmente 'id'); en CSV se
+    usan las columnas 'polynomial' y 'root' de la cabecera, o las dos
+    primeras columnas si no hay cabecera.
+    """
+    if fmt == 'csv':
+        reader = csv.reader(stream)
+        header = None
+
+        for row in reader:
+            line = reader.line_num
+            if not row:
+                continue
+
+            if header is None and line == 1 and 'polynomial' in row:
+                header = row
+                continue
+
+            if header is not None:
+                job = dict(zip(header, row))
+            else:
+                job = {'polynomial': row[0], 'root': row[1] if len(row) > 1 else None}
+
+            job['line'] = line
+            yield job
+    else:
+        for line, text in enumerate(stream, start=1):
+            text = text.strip()
+            if not text:
+                continue
+
+            try:
+                job = json.loads(text)
+            except ValueError as e:
+                job = {'error': f'JSON inválido: {e}'}
+
+            if not isinstance(job, dict):
+                job = {'error': 'Cada línea debe ser un objeto JSON'}
+
+            job['line'] = line
+            yield job
+
+
+def process_job(job: Dict[str, Any], options: Dict[str, Any], parsed: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Calcula un trabajo reutilizando los polinomios ya parseados en el lote
+
+    Returns:
+        Resultado de calculate_coefficients con 'line' (e 'id' si venía en la entrada)
+    """
+    header = {'line': job.get('line')}
+    if 'id' in job:
+        header['id'] = job['id']
+
+    if 'error' in job:
+        return dict(header, success=False, error=job['error'])
+
+    polynomial = job.get('polynomial')
+    polynomial = polynomial.strip() if isinstance(polynomial, str) else ''
+    if not polynomial:
+        return dict(header, success=False, error='El polinomio es requerido')
+
+    try:
+        root = job.get('root')
+        root = calculator.to_exact(root) if options['exact'] else float(root)
+    except (ValueError, TypeError, ZeroDivisionError):
+        return dict(header, success=False, polynomial=polynomial, error='La raíz debe ser un número válido')
+
+    try:
+        if polynomial not in parsed:
+            parsed[polynomial] = calculator.parse_polynomial_terms(polynomial, options['exact'])
+
+        result = calculator.calculate_coefficients(
+            polynomial, parsed[polynomial], root,
+            include_steps=options['include_steps'],
+            include_explanation=options['include_explanation'],
+            exact=options['exact']
+        )
+    except Exception as e:
+        return dict(header, success=False, polynomial=polynomial, error=str(e))
+
+    return dict(header, **result)
+
+
+def process_batch(jobs: List[Dict[str, Any]], options: Dict[str, Any]) -> List[str]:
+    """Procesa un lote de trabajos y devuelve las líneas NDJSON ya serializadas"""
+    parsed = {}
+    return [to_json_line(process_job(job, options, parsed)) for job in jobs]
+
+
+def to_json_line(result: Dict[str, Any]) -> str:
+    """Serializa un resultado como una línea JSON (fracciones como 'p/q')"""
+    return json.dumps(result, ensure_ascii=False, default=_json_default)
+
+
+def _json_default(value: Any) -> Any:
+    if isinstance(value, Fraction):
+        return value.numerator if value.denominator == 1 else str(value)
+    raise TypeError(f"Tipo no serializable: {type(value).__name__}")
+
+
+def _batches(jobs: Iterable[Dict[str, Any]], size: int) -> Iterator[List[Dict[str, Any]]]:
+    iterator = iter(jobs)
+    while True:
+        batch = list(islice(iterator, size))
+        if not batch:
+            return
+        yield batch
+
+
+def run(jobs: Iterable[Dict[str, Any]], output: TextIO, options: Dict[str, Any],
+        workers: int = 1, batch_size: int = 1000) -> int:
+    """
+    Procesa los trabajos en streaming y escribe un resultado por línea, en orden
+
+    Con workers > 1 los lotes se reparten en un pool de procesos. Como mucho
+    hay 2 × workers lotes en vuelo, así que la memoria no depende del
+    tamaño de la entrada.
+
+    Returns:
+        Número de trabajos procesados
+    """
+    count = 0
+
+    if workers <= 1:
+        for batch in _batches(jobs, batch_size):
+            for line in process_batch(batch, options):
+                output.write(line + '\n')
+            count += len(batch)
+        output.flush()
+        return count
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        pending = deque()
+
+        for batch in _batches(jobs, batch_size):
+            pending.append(pool.submit(process_batch, batch, options))
+
+            # Backpressure: esperar al lote más antiguo antes de leer más
+            while len(pending) >= 2 * workers:
+                lines = pending.popleft().result()
+                output.write('\n'.join(lines) + '\n')
+                count += len(lines)
+
+        while pending:
+            lines = pending.popleft().result()
+            output.write('\n'.join(lines) + '\n')
+            count += len(lines)
+
+    output.flush()
+    return count
+
+
+def main(argv: List[str] = None) -> int:
+    """
+    Punto de entrada de línea de comandos para el procesamiento masivo
+    """
+    parser = argparse.ArgumentParser(
+        description='Procesamiento masivo de divisiones de Ruffini (NDJSON/CSV -> NDJSON)'
+    )
+    parser.add_argument('input', nargs='?', default='-',
+                        help="Fichero de trabajos ('-' o vacío para stdin)")
+    parser.add_argument('-o', '--output', default='-',
+                        help="Fichero de resultados ('-' o vacío para stdout)")
+    parser.add_argument('--format', choices=['ndjson', 'csv'],
+                        help='Formato de entrada (por defecto según la extensión, o ndjson)')
+    parser.add_argument('--workers', type=int, default=1,
+                        help='Procesos en paralelo (por defecto 1; 0 = todos los núcleos)')
+    parser.add_argument('--batch-size', type=int, default=1000,
+                        help='Trabajos por lote enviado a cada proceso')
+    parser.add_argument('--steps', choices=['none', 'compact', 'full'], default='none',
+                        help='Pasos a incluir en cada resultado (por defecto ninguno)')
+    parser.add_argument('--explain', action='store_true',
+                        help='Incluir la explicación de IA en cada resultado')
+    parser.add_argument('--exact', action='store_true',
+                        help='Aritmética exacta con enteros y fracciones')
+
+    args = parser.parse_args(argv)
+
+    fmt = args.format
+    if fmt is None:
+        fmt = 'csv' if args.input.lower().endswith('.csv') else 'ndjson'
+
+    workers = args.workers or os.cpu_count() or 1
+    options = {
+        'include_steps': {'none': False, 'compact': 'compact', 'full': True}[args.steps],
+        'include_explanation': args.explain,
+        'exact': args.exact
+    }
+
+    source = sys.stdin if args.input == '-' else open(args.input, newline='', encoding='utf-8')
+    target = sys.stdout if args.output == '-' else open(args.output, 'w', encoding='utf-8')
+
+    try:
+        run(iter_jobs(source, fmt), target, options, workers, max(1, args.batch_size))
+    finally:
+        if source is not sys.stdin:
+            source.close()
+        if target is not sys.stdout:
+            target.close()
+
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
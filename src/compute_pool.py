@@ -0,0 +1,211 @@
+"""
+Pool de procesos acotado para los cálculos costosos del servidor
+Saca las divisiones de grado alto del hilo de la petición y rechaza trabajo cuando la cola está llena
+"""
+
+import math
+import signal
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, Callable, Dict, List, Tuple, Union
+
+try:
+    from src.ruffini_calculator import RuffiniCalculator
+    from src.ruffini_result import RuffiniResult
+except ImportError:  # Ejecución directa: python src/compute_pool.py
+    from ruffini_calculator import RuffiniCalculator
+    from ruffini_result import RuffiniResult
+
+try:
+    import resource
+except ImportError:  # Windows: sin RLIMIT_CPU, los trabajos no tienen presupuesto de CPU
+    resource = None
+
+# Instancia por proceso (cada worker del pool tiene la suya)
+calculator = RuffiniCalculator()
+
+
+def calculate_coefficients(polynomial: str, terms: Dict[int, Any], root: Any,
+                           include_steps: Union[bool, str], include_explanation: bool,
+                           exact: bool, verify: bool = False) -> Dict[str, Any]:
+    """calculate_coefficients ejecutado dentro de un worker del pool"""
+    return calculator.calculate_coefficients(
+        polynomial, terms, root,
+        include_steps=include_steps,
+        include_explanation=include_explanation,
+        exact=exact,
+        verify=verify
+    )
+
+
+def calculate_many(polynomial: str, terms: Dict[int, Any], roots: List[float]) -> List[Dict[str, Any]]:
+    """calculate_many ejecutado dentro de un worker del pool"""
+    return calculator.calculate_many(polynomial, terms, roots)
+
+
+def calculate_divisor(polynomial: str, terms: Dict[int, Any], divisor: Dict[int, Any],
+                      include_steps: bool, exact: bool, verify: bool) -> Dict[str, Any]:
+    """calculate_divisor ejecutado dentro de un worker del pool"""
+    return calculator.calculate_divisor(polynomial, terms, divisor, include_steps, exact, verify)
+
+
+def divide(polynomial: str, terms: Dict[int, Any], root: Any, exact: bool) -> RuffiniResult:
+    """divide ejecutado dentro de un worker del pool (el búfer array('d') viaja compacto)"""
+    return calculator.divide(polynomial, terms, root, exact)
+
+
+def render(division: RuffiniResult, polynomial: str, include_steps: Union[bool, str],
+           include_explanation: bool, verify: bool) -> Dict[str, Any]:
+    """render ejecutado dentro de un worker del pool (pasos y explicación fuera del hilo de la petición)"""
+    return calculator.render(division, polynomial, include_steps, include_explanation, verify)
+
+
+def factor(polynomial: str) -> Dict[str, Any]:
+    """factor ejecutado dentro de un worker del pool"""
+    return calculator.factor(polynomial)
+
+
+def deflate_polynomial(polynomial: str, roots: List[Any], exact: bool, taylor: bool) -> Dict[str, Any]:
+    """deflate_polynomial ejecutado dentro de un worker del pool"""
+    return calculator.deflate_polynomial(polynomial, roots, exact, taylor)
+
+
+def find_roots(polynomial: str, method: str) -> Dict[str, Any]:
+    """find_roots ejecutado dentro de un worker del pool"""
+    return calculator.find_roots(polynomial, method)
+
+
+def evaluate_many(coefficients: Any, xs: List[float], derivative: bool) -> Tuple[List[float], Any]:
+    """evaluate_many ejecutado dentro de un worker del pool"""
+    return calculator.evaluate_many(coefficients, xs, derivative)
+
+
+class ComputePoolBusy(RuntimeError):
+    """Todos los huecos del pool están ocupados; el cliente debe reintentar más tarde"""
+
+
+class ComputeBudgetExceeded(BaseException):
+    """
+    El trabajo agotó su presupuesto de tiempo de CPU y se canceló
+
+    Deriva de BaseException, como KeyboardInterrupt, porque llega con una
+    señal en cualquier punto del cálculo: así no la capturan los
+    'except Exception' con los que el calculador convierte sus errores en
+    respuestas {'success': False}.
+    """
+
+
+def _cpu_budget_exceeded(signum, frame):
+    raise ComputeBudgetExceeded('El cálculo superó su límite de tiempo de CPU')
+
+
+def run_with_cpu_budget(func: Callable[..., Any], seconds: float, *args) -> Any:
+    """
+    Ejecuta func(*args) dentro de un worker con un límite de segundos de CPU
+
+    Sube el límite blando RLIMIT_CPU del proceso a lo ya consumido más
+    seconds; al alcanzarlo el sistema envía SIGXCPU, que interrumpe el
+    trabajo con ComputeBudgetExceeded sin matar al worker. Después se
+    restaura el límite anterior.
+    """
+    if resource is None or not seconds:
+        return func(*args)
+
+    usage = resource.getrusage(resource.RUSAGE_SELF)
+    soft, hard = resource.getrlimit(resource.RLIMIT_CPU)
+    limit = math.ceil(usage.ru_utime + usage.ru_stime + seconds)
+    if hard != resource.RLIM_INFINITY:
+        limit = min(limit, hard)
+
+    previous = signal.signal(signal.SIGXCPU, _cpu_budget_exceeded)
+    resource.setrlimit(resource.RLIMIT_CPU, (limit, hard))
+    try:
+        return func(*args)
+    finally:
+        resource.setrlimit(resource.RLIMIT_CPU, (soft, hard))
+        signal.signal(signal.SIGXCPU, previous)
+
+
+class ComputePool:
+    """
+    ProcessPoolExecutor con un número máximo de trabajos admitidos
+
+    Admite como mucho workers + queue_size trabajos a la vez (en ejecución
+    o esperando); por encima, run lanza ComputePoolBusy en lugar de encolar
+    sin límite. El hilo que espera el resultado no retiene el GIL, así que
+    las rutas baratas siguen respondiendo mientras los procesos calculan.
+
+    Los procesos se crean en el primer uso, de modo que un servidor que
+    hace fork de sus workers (gunicorn) no hereda un pool ya arrancado.
+
+    Con cpu_seconds, cada trabajo que consume más tiempo de CPU se cancela
+    con ComputeBudgetExceeded (ver run_with_cpu_budget).
+    """
+
+    def __init__(self, workers: int, queue_size: int = 16, cpu_seconds: float = None):
+        self.workers = max(1, workers)
+        self.queue_size = max(0, queue_size)
+        self.cpu_seconds = cpu_seconds
+        self.rejected = 0
+        self._slots = threading.BoundedSemaphore(self.workers + self.queue_size)
+        self._in_flight = 0
+        self._executor = None
+        self._lock = threading.Lock()
+
+    @property
+    def in_flight(self) -> int:
+        """Trabajos admitidos que aún no han terminado"""
+        return self._in_flight
+
+    def run(self, func: Callable[..., Any], *args) -> Any:
+        """
+        Ejecuta func(*args) en un proceso del pool y devuelve su resultado
+
+        Raises:
+            ComputePoolBusy: Si no queda hueco para el trabajo
+            ComputeBudgetExceeded: Si el trabajo agota su tiempo de CPU
+        """
+        if not self._slots.acquire(blocking=False):
+            with self._lock:
+                self.rejected += 1
+            raise ComputePoolBusy('Servidor ocupado: demasiados cálculos en curso')
+
+        with self._lock:
+            self._in_flight += 1
+
+        try:
+            executor = self._get_executor()
+            future = executor.submit(run_with_cpu_budget, func, self.cpu_seconds, *args)
+        except Exception:
+            self._release()
+            raise
+
+        future.add_done_callback(lambda _: self._release())
+
+        try:
+            return future.result()
+        except BrokenProcessPool:
+            # Un worker murió (por ejemplo, por falta de memoria): el
+            # siguiente trabajo arranca un pool nuevo
+            with self._lock:
+                if self._executor is executor:
+                    self._executor = None
+            raise
+
+    def _release(self) -> None:
+        with self._lock:
+            self._in_flight -= 1
+        self._slots.release()
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        with self._lock:
+            if self._executor is None:
+                self._executor = ProcessPoolExecutor(max_workers=self.workers)
+            return self._executor
+
+    def shutdown(self) -> None:
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=True)
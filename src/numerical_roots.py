@@ -0,0 +1,183 @@
+"""
+Cálculo numérico de todas las raíces (reales y complejas) de un polinomio
+Método de Aberth-Ehrlich y, con NumPy, autovalores de la matriz compañera
+"""
+
+import cmath
+import math
+from typing import Callable, List, Sequence, Tuple
+
+try:
+    import numpy as np
+except ImportError:  # NumPy es opcional: sin él, Aberth se ejecuta en Python puro
+    np = None
+
+# División sintética: (coeficientes, raíz) -> (cociente, resto)
+Divide = Callable[[Sequence[complex], complex], Tuple[List[complex], complex]]
+
+
+def horner_with_derivative(coefficients: Sequence[complex], z: complex) -> Tuple[complex, complex]:
+    """P(z) y P'(z) en una sola pasada de Horner"""
+    value = coefficients[0]
+    slope = 0
+    for coef in coefficients[1:]:
+        slope = slope * z + value
+        value = value * z + coef
+    return value, slope
+
+
+def root_bound(coefficients: Sequence[complex]) -> float:
+    """
+    Cota de Fujiwara del módulo de las raíces
+
+    Todas las raíces cumplen |z| <= 2 · max |a_i / a_0|^(1/i), con el
+    término independiente a la mitad.
+    """
+    n = len(coefficients) - 1
+    lead = abs(coefficients[0])
+    bound = 0.0
+    for i, coef in enumerate(coefficients[1:], start=1):
+        ratio = abs(coef) / lead
+        if i == n:
+            ratio /= 2
+        if ratio:
+            bound = max(bound, ratio ** (1 / i))
+    return 2 * bound
+
+
+def initial_guesses(coefficients: Sequence[complex]) -> List[complex]:
+    """Puntos iniciales repartidos en una circunferencia alrededor del centroide de las raíces"""
+    n = len(coefficients) - 1
+    centre = -coefficients[1] / (n * coefficients[0])
+    radius = max(root_bound(coefficients), 1e-3)
+    # El desfase evita arrancar sobre el eje real, donde los polinomios
+    # reales tienen sus simetrías
+    return [centre + radius * cmath.exp(1j * (2 * math.pi * k / n + 0.4)) for k in range(n)]
+
+
+def aberth_roots(coefficients: Sequence[complex], tol: float = 1e-12,
+                 max_iter: int = 500) -> Tuple[List[complex], int]:
+    """
+    Todas las raíces de un polinomio por el método de Aberth-Ehrlich
+
+    Cada aproximación se corrige con el paso de Newton modificado por la
+    repulsión de las demás, de modo que todas convergen a la vez y a raíces
+    distintas. Convergencia cúbica para raíces simples.
+
+    Args:
+        coefficients: Coeficientes de mayor a menor grado, con a_0 != 0
+        tol: Tolerancia relativa de la corrección para dar una raíz por buena
+        max_iter: Máximo de iteraciones
+
+    Returns:
+        Tupla con (raíces, iteraciones realizadas)
+    """
+    n = len(coefficients) - 1
+    if n < 1:
+        return [], 0
+
+    coefficients = [complex(coef) for coef in coefficients]
+    if n == 1:
+        return [-coefficients[1] / coefficients[0]], 0
+
+    if np is not None:
+        return _aberth_vectorized(coefficients, tol, max_iter)
+
+    roots = initial_guesses(coefficients)
+    converged = [False] * n
+
+    for iteration in range(1, max_iter + 1):
+        for k in range(n):
+            if converged[k]:
+                continue
+            z = roots[k]
+            value, slope = horner_with_derivative(coefficients, z)
+            if value == 0:
+                converged[k] = True
+                continue
+            repulsion = sum(1 / (z - roots[j]) for j in range(n) if j != k and z != roots[j])
+            newton = value / slope if slope != 0 else value
+            correction = newton / (1 - newton * repulsion)
+            roots[k] = z - correction
+            converged[k] = abs(correction) <= tol * max(abs(roots[k]), 1.0)
+
+        if all(converged):
+            return roots, iteration
+
+    return roots, max_iter
+
+
+def _aberth_vectorized(coefficients: List[complex], tol: float, max_iter: int) -> Tuple[List[complex], int]:
+    """Aberth con NumPy: P, P' y la repulsión se calculan para todas las raíces a la vez"""
+    n = len(coefficients) - 1
+    roots = np.array(initial_guesses(coefficients), dtype=complex)
+    active = np.ones(n, dtype=bool)
+
+    with np.errstate(divide='ignore', invalid='ignore', over='ignore'):
+        for iteration in range(1, max_iter + 1):
+            z = roots[active]
+            value = np.full_like(z, coefficients[0])
+            slope = np.zeros_like(z)
+            for coef in coefficients[1:]:
+                slope = slope * z + value
+                value = value * z + coef
+
+            differences = z[:, None] - roots[None, :]
+            differences[differences == 0] = np.inf  # Excluye j == k
+            repulsion = (1 / differences).sum(axis=1)
+
+            newton = np.where(slope != 0, value / slope, value)
+            correction = newton / (1 - newton * repulsion)
+            correction[value == 0] = 0
+            correction[~np.isfinite(correction)] = 0
+
+            roots[active] = z - correction
+            done = np.abs(correction) <= tol * np.maximum(np.abs(roots[active]), 1.0)
+            indices = np.flatnonzero(active)
+            active[indices[done]] = False
+
+            if not active.any():
+                return roots.tolist(), iteration
+
+    return roots.tolist(), max_iter
+
+
+def companion_roots(coefficients: Sequence[complex]) -> List[complex]:
+    """
+    Raíces como autovalores de la matriz compañera (requiere NumPy)
+
+    Es el método de numpy.roots: robusto, pero O(n³) en tiempo y O(n²) en
+    memoria, así que para grados altos conviene Aberth.
+    """
+    if np is None:
+        raise ImportError("El método de la matriz compañera requiere NumPy (pip install numpy)")
+    return np.roots(np.asarray(coefficients, dtype=complex)).tolist()
+
+
+def newton_polish(coefficients: Sequence[complex], root: complex, divide: Divide,
+                  steps: int = 3) -> Tuple[complex, float]:
+    """
+    Refina una raíz con el método de Newton usando la división de Ruffini
+
+    P(z) es el resto de dividir P entre (x - z) y P'(z) el resto de dividir
+    el cociente otra vez entre (x - z). Se para si un paso empeora el residuo.
+
+    Returns:
+        Tupla con (raíz refinada, |P(raíz)|)
+    """
+    quotient, value = divide(coefficients, root)
+    residual = abs(value)
+
+    for _ in range(steps):
+        if residual == 0 or len(quotient) == 0:
+            break
+        slope = divide(quotient, root)[1]
+        if slope == 0:
+            break
+        candidate = root - value / slope
+        candidate_quotient, candidate_value = divide(coefficients, candidate)
+        if not abs(candidate_value) < residual:
+            break
+        root, quotient, value, residual = candidate, candidate_quotient, candidate_value, abs(candidate_value)
+
+    return root, residual
@@ -0,0 +1,190 @@
+"""
+Aritmética de polinomios sobre listas de coeficientes
+Suma, resta, producto (clásico, Karatsuba o FFT según el grado), potencia y composición
+
+Los coeficientes van de mayor a menor grado, como los devuelve
+RuffiniCalculator.parse_polynomial. Con int o Fraction el resultado es exacto.
+"""
+
+from typing import Any, List, Sequence, Tuple
+
+try:
+    import numpy as np
+except ImportError:  # NumPy es opcional, solo lo usa el producto por FFT
+    np = None
+
+# Longitud mínima de ambos factores para usar Karatsuba en lugar del producto clásico
+KARATSUBA_THRESHOLD = 32
+
+# Longitud mínima de ambos factores para usar la FFT (solo con coeficientes float y NumPy)
+FFT_THRESHOLD = 64
+
+# Rango máximo entre el mayor y el menor coeficiente no nulo para usar la FFT.
+# Su error es relativo al mayor coeficiente, así que con rangos mayores (por
+# ejemplo, los binomiales de (x - 1)^500) los coeficientes pequeños se perderían
+FFT_MAX_DYNAMIC_RANGE = 1e6
+
+
+def trim(coefficients: Sequence[Any]) -> List[Any]:
+    """Quita los ceros iniciales (el polinomio nulo queda como [0])"""
+    start = 0
+    while start < len(coefficients) - 1 and coefficients[start] == 0:
+        start += 1
+    return list(coefficients[start:])
+
+
+def add(p: Sequence[Any], q: Sequence[Any]) -> List[Any]:
+    """p + q"""
+    if len(p) < len(q):
+        p, q = q, p
+    offset = len(p) - len(q)
+    result = list(p)
+    for i, coef in enumerate(q):
+        result[offset + i] += coef
+    return trim(result)
+
+
+def subtract(p: Sequence[Any], q: Sequence[Any]) -> List[Any]:
+    """p - q"""
+    return add(p, [-coef for coef in q])
+
+
+def scale(p: Sequence[Any], factor: Any) -> List[Any]:
+    """factor · p"""
+    return trim([coef * factor for coef in p])
+
+
+def _schoolbook(p: Sequence[Any], q: Sequence[Any]) -> List[Any]:
+    """Producto clásico, O(len(p)·len(q))"""
+    zero = p[0] * 0
+    result = [zero] * (len(p) + len(q) - 1)
+    for i, a in enumerate(p):
+        if a == 0:
+            continue
+        for j, b in enumerate(q):
+            result[i + j] += a * b
+    return result
+
+
+def _karatsuba(p: List[Any], q: List[Any]) -> List[Any]:
+    """
+    Producto de Karatsuba, O(n^1.585)
+
+    Trabaja con los coeficientes en orden creciente de grado y con p y q
+    de la misma longitud.
+    """
+    n = len(p)
+    if n < KARATSUBA_THRESHOLD:
+        return _schoolbook(p, q)
+
+    half = n // 2
+    p_low, p_high = p[:half], p[half:]
+    q_low, q_high = q[:half], q[half:]
+
+    low = _karatsuba(p_low, q_low)
+    high = _karatsuba(p_high, q_high)
+
+    # Igualar longitudes para la llamada del término cruzado
+    p_sum = [a + b for a, b in zip(p_low + [p_low[0] * 0] * (len(p_high) - half), p_high)]
+    q_sum = [a + b for a, b in zip(q_low + [q_low[0] * 0] * (len(q_high) - half), q_high)]
+    middle = _karatsuba(p_sum, q_sum)
+
+    zero = p[0] * 0
+    result = [zero] * (2 * n - 1)
+    for i, coef in enumerate(low):
+        result[i] += coef
+        middle[i] -= coef
+    for i, coef in enumerate(high):
+        result[i + 2 * half] += coef
+        middle[i] -= coef
+    for i, coef in enumerate(middle):
+        result[i + half] += coef
+    return result
+
+
+def _fft_multiply(p: Sequence[float], q: Sequence[float]) -> List[float]:
+    """Producto por FFT real de NumPy, O(n log n), con error de redondeo de coma flotante"""
+    length = len(p) + len(q) - 1
+    size = 1 << (length - 1).bit_length()
+    spectrum = np.fft.rfft(p, size) * np.fft.rfft(q, size)
+    return np.fft.irfft(spectrum, size)[:length].tolist()
+
+
+def _fft_safe(coefficients: Sequence[Any]) -> bool:
+    """Si los coeficientes son float con un rango lo bastante pequeño para la FFT"""
+    if not all(type(coef) is float for coef in coefficients):
+        return False
+    magnitudes = [abs(coef) for coef in coefficients if coef != 0]
+    return bool(magnitudes) and max(magnitudes) <= FFT_MAX_DYNAMIC_RANGE * min(magnitudes)
+
+
+def multiply(p: Sequence[Any], q: Sequence[Any]) -> List[Any]:
+    """
+    p · q eligiendo el algoritmo según el tamaño y el tipo de los coeficientes
+
+    Producto clásico para factores cortos; FFT cuando ambos son largos, los
+    coeficientes son float de magnitudes parecidas y NumPy está instalado;
+    Karatsuba en el resto de casos, que mantiene exactos los int y Fraction.
+    """
+    p, q = trim(p), trim(q)
+    if len(p) < len(q):
+        p, q = q, p
+
+    if len(q) < KARATSUBA_THRESHOLD:
+        return trim(_schoolbook(p, q))
+
+    if np is not None and len(q) >= FFT_THRESHOLD and _fft_safe(p) and _fft_safe(q):
+        return trim(_fft_multiply(p, q))
+
+    # Karatsuba en orden creciente, rellenando q hasta la longitud de p
+    p_low = p[::-1]
+    q_low = q[::-1] + [q[0] * 0] * (len(p) - len(q))
+    product = _karatsuba(p_low, q_low)[:len(p) + len(q) - 1]
+    return trim(product[::-1])
+
+
+def power(p: Sequence[Any], exponent: int) -> List[Any]:
+    """p^exponent por cuadrados sucesivos (O(log exponent) productos)"""
+    if exponent < 0:
+        raise ValueError("El exponente debe ser un entero no negativo")
+
+    result = [p[0] * 0 + 1] if p else [1]
+    base = trim(p)
+    while exponent:
+        if exponent & 1:
+            result = multiply(result, base)
+        exponent >>= 1
+        if exponent:
+            base = multiply(base, base)
+    return result
+
+
+def compose(p: Sequence[Any], q: Sequence[Any]) -> List[Any]:
+    """p(q(x)) por Horner sobre polinomios"""
+    p = trim(p)
+    result = [p[0]]
+    for coef in p[1:]:
+        result = add(multiply(result, q), [coef])
+    return result
+
+
+def verify_division(dividend: Sequence[Any], divisor: Sequence[Any], quotient: Sequence[Any],
+                    remainder: Sequence[Any], rel_tol: float = 1e-9) -> Tuple[bool, Any]:
+    """
+    Comprueba que cociente × divisor + resto reproduce el dividendo
+
+    Con coeficientes exactos la comparación es exacta; con float se admite
+    un error relativo rel_tol respecto al mayor coeficiente en juego.
+
+    Returns:
+        Tupla con (comprobación superada, máximo error absoluto)
+    """
+    rebuilt = add(multiply(quotient, divisor), remainder)
+    difference = subtract(dividend, rebuilt)
+    max_error = max(abs(coef) for coef in difference)
+
+    if all(type(coef) is not float for coef in difference):
+        return max_error == 0, max_error
+
+    magnitude = max([abs(coef) for coef in dividend] + [abs(coef) for coef in rebuilt] + [1.0])
+    return max_error <= rel_tol * magnitude, max_error
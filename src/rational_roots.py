@@ -0,0 +1,267 @@
+"""
+Búsqueda de raíces racionales de polinomios con coeficientes enteros
+Teorema de la raíz racional con poda de candidatos y deflación por Ruffini
+"""
+
+import math
+import random
+from fractions import Fraction
+from typing import Dict, List, Tuple
+
+# Primos pequeños para la división por tentativa antes de Pollard-Brent
+_SMALL_PRIMES = [p for p in range(2, 1000) if all(p % d for d in range(2, int(p ** 0.5) + 1))]
+
+
+def is_probable_prime(n: int) -> bool:
+    """Test de Miller-Rabin (determinista para n < 3.3e24)"""
+    if n < 2:
+        return False
+
+    for p in _SMALL_PRIMES[:13]:
+        if n % p == 0:
+            return n == p
+
+    d, s = n - 1, 0
+    while d % 2 == 0:
+        d //= 2
+        s += 1
+
+    for a in _SMALL_PRIMES[:13]:
+        x = pow(a, d, n)
+        if x == 1 or x == n - 1:
+            continue
+        for _ in range(s - 1):
+            x = x * x % n
+            if x == n - 1:
+                break
+        else:
+            return False
+
+    return True
+
+
+def _pollard_brent(n: int) -> int:
+    """Encuentra un divisor no trivial de un n compuesto (Pollard-Brent)"""
+    if n % 2 == 0:
+        return 2
+
+    while True:
+        y, c, m = random.randrange(1, n), random.randrange(1, n), 128
+        g = r = q = 1
+
+        while g == 1:
+            x = y
+            for _ in range(r):
+                y = (y * y + c) % n
+            k = 0
+            while k < r and g == 1:
+                ys = y
+                for _ in range(min(m, r - k)):
+                    y = (y * y + c) % n
+                    q = q * abs(x - y) % n
+                g = math.gcd(q, n)
+                k += m
+            r *= 2
+
+        if g == n:
+            g = 1
+            while g == 1:
+                ys = (ys * ys + c) % n
+                g = math.gcd(abs(x - ys), n)
+
+        if g != n:
+            return g
+
+
+def prime_factors(n: int) -> Dict[int, int]:
+    """
+    Factorización en primos de |n| como diccionario primo -> exponente
+
+    División por tentativa con primos pequeños y Pollard-Brent para el resto,
+    de modo que términos independientes grandes no requieren recorrer
+    hasta la raíz cuadrada.
+    """
+    n = abs(n)
+    factors = {}
+
+    for p in _SMALL_PRIMES:
+        if p * p > n:
+            break
+        while n % p == 0:
+            factors[p] = factors.get(p, 0) + 1
+            n //= p
+
+    pending = [n] if n > 1 else []
+    while pending:
+        m = pending.pop()
+        if is_probable_prime(m):
+            factors[m] = factors.get(m, 0) + 1
+        else:
+            d = _pollard_brent(m)
+            pending.extend((d, m // d))
+
+    return factors
+
+
+def divisors(n: int, limit: float = math.inf) -> List[int]:
+    """
+    Divisores positivos de |n| (n != 0) que no superan limit, en orden creciente
+
+    Los productos que superan el límite se descartan mientras se generan,
+    así que un término independiente con muchos divisores no obliga a
+    enumerarlos todos.
+    """
+    result = [1]
+    for p, exponent in sorted(prime_factors(n).items()):
+        extended = []
+        for d in result:
+            for _ in range(exponent + 1):
+                if d > limit:
+                    break
+                extended.append(d)
+                d *= p
+        result = extended
+    return sorted(result)
+
+
+def log_root_bound(coefficients: List[int]) -> float:
+    """
+    Logaritmo de la cota de Fujiwara para el módulo de las raíces
+
+    Se trabaja con logaritmos para no desbordar float con enteros grandes.
+
+    Args:
+        coefficients: Coeficientes enteros de mayor a menor grado
+    """
+    n = len(coefficients) - 1
+    log_lead = math.log(abs(coefficients[0]))
+    log_bound = -math.inf
+
+    for i, coef in enumerate(coefficients[1:], start=1):
+        if coef:
+            log_ratio = math.log(abs(coef)) - log_lead
+            if i == n:
+                log_ratio -= math.log(2)
+            log_bound = max(log_bound, log_ratio / i)
+
+    return math.log(2) + log_bound
+
+
+def sign_changes(coefficients: List[int]) -> int:
+    """Número de cambios de signo (regla de los signos de Descartes)"""
+    signs = [c > 0 for c in coefficients if c]
+    return sum(1 for a, b in zip(signs, signs[1:]) if a != b)
+
+
+def divide_linear(coefficients: List[int], p: int, q: int) -> List[int]:
+    """
+    Divide un polinomio entero entre (q·x - p) con aritmética entera
+
+    Si p/q no es raíz, alguna división intermedia no es exacta o el resto
+    no es cero, y se devuelve None en cuanto se detecta. Por el lema de
+    Gauss, si p/q es raíz el cociente tiene coeficientes enteros.
+
+    Returns:
+        Coeficientes enteros del cociente, o None si p/q no es raíz
+    """
+    quotient = []
+    carry = 0
+
+    for coef in coefficients[:-1]:
+        value, rest = divmod(coef + carry, q)
+        if rest:
+            return None
+        quotient.append(value)
+        carry = p * value
+
+    if coefficients[-1] + carry != 0:
+        return None
+
+    return quotient
+
+
+def find_rational_roots(coefficients: List[int]) -> Tuple[List[Tuple[Fraction, int]], List[int], int]:
+    """
+    Encuentra todas las raíces racionales de un polinomio con coeficientes enteros
+
+    Los candidatos p/q (p divide al término independiente, q al coeficiente
+    principal) se podan con la cota de Fujiwara, la regla de Descartes y
+    los tests de P(1) y P(-1): si p/q es raíz, (q - p) divide a P(1) y
+    (q + p) divide a P(-1). Cada raíz encontrada se extrae por deflación
+    sucesiva, lo que da su multiplicidad, y los candidatos restantes se
+    filtran contra el polinomio deflactado.
+
+    Args:
+        coefficients: Coeficientes enteros de mayor a menor grado, sin
+            ceros iniciales
+
+    Returns:
+        Tupla con (lista de (raíz, multiplicidad), coeficientes enteros del
+        factor sin raíces racionales, número de candidatos evaluados)
+    """
+    roots = []
+    tested = 0
+
+    # Raíz 0: ceros al final de la lista
+    zeros = 0
+    while len(coefficients) > 1 and coefficients[-1] == 0:
+        coefficients = coefficients[:-1]
+        zeros += 1
+    if zeros:
+        roots.append((Fraction(0), zeros))
+
+    if len(coefficients) <= 1:
+        return roots, coefficients, tested
+
+    constant, lead = coefficients[-1], coefficients[0]
+    log_bound = log_root_bound(coefficients) + 1e-9
+    allow_positive = sign_changes(coefficients) > 0
+    allow_negative = sign_changes([c if i % 2 == 0 else -c for i, c in enumerate(reversed(coefficients))]) > 0
+
+    denominators = divisors(lead)
+    max_numerator = math.exp(min(log_bound + math.log(denominators[-1]), 700.0))
+
+    candidates = []
+    for p in divisors(constant, max_numerator):
+        for q in denominators:
+            if math.gcd(p, q) == 1 and math.log(p) - math.log(q) <= log_bound:
+                if allow_positive:
+                    candidates.append((p, q))
+                if allow_negative:
+                    candidates.append((-p, q))
+
+    # Primero los candidatos de menor módulo y denominador
+    candidates.sort(key=lambda pq: (math.log(abs(pq[0])) - math.log(pq[1]), pq[1], pq[0] < 0))
+
+    value_at_one = sum(coefficients)
+    value_at_minus_one = sum(c if i % 2 == 0 else -c for i, c in enumerate(reversed(coefficients)))
+
+    for p, q in candidates:
+        if len(coefficients) <= 1:
+            break
+
+        # El candidato debe seguir siendo válido para el polinomio deflactado
+        if coefficients[-1] % p or coefficients[0] % q:
+            continue
+        if value_at_one and (p == q or value_at_one % (q - p)):
+            continue
+        if value_at_minus_one and (p == -q or value_at_minus_one % (q + p)):
+            continue
+
+        tested += 1
+        multiplicity = 0
+        quotient = divide_linear(coefficients, p, q)
+
+        while quotient is not None:
+            multiplicity += 1
+            coefficients = quotient
+            if len(coefficients) <= 1:
+                break
+            quotient = divide_linear(coefficients, p, q)
+
+        if multiplicity:
+            roots.append((Fraction(p, q), multiplicity))
+            value_at_one = sum(coefficients)
+            value_at_minus_one = sum(c if i % 2 == 0 else -c for i, c in enumerate(reversed(coefficients)))
+
+    return roots, coefficients, tested
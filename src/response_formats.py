@@ -0,0 +1,233 @@
+"""
+Formatos compactos de respuesta para /calculate, elegidos por la cabecera Accept
+JSON columnar (cada fila de la tabla una sola vez), MessagePack y arrays float64 empaquetados
+"""
+
+import json
+import struct
+import sys
+from array import array
+from fractions import Fraction
+from typing import Any, Callable, Dict, List, Tuple
+
+try:
+    import msgpack
+except ImportError:  # MessagePack es opcional: sin él no se ofrece ese formato
+    msgpack = None
+
+try:
+    from src.ruffini_result import number_str
+except ImportError:
+    from ruffini_result import number_str
+
+JSON = 'application/json'
+COLUMNAR_JSON = 'application/vnd.ruffini.columnar+json'
+MSGPACK = 'application/msgpack'
+PACKED = 'application/vnd.ruffini.packed'
+
+# Cabecera del formato empaquetado: magia, versión, flags y longitudes de
+# coeficientes, cociente, resto y metadatos JSON (24 bytes, little-endian)
+PACKED_MAGIC = b'RUFP'
+PACKED_VERSION = 1
+PACKED_HEADER = struct.Struct('<4sHHIIII')
+PACKED_HAS_TRACE = 1  # flag: tras el resto van row2 y row3 de la traza
+
+# Claves numéricas que el formato empaquetado saca de los metadatos
+PACKED_ARRAYS = ('coefficients', 'quotient_coefficients', 'remainder_coefficients', 'remainder', 'trace')
+
+
+def offered_mimetypes() -> List[str]:
+    """Formatos disponibles, por orden de preferencia ante empates (JSON primero)"""
+    offered = [JSON, COLUMNAR_JSON, PACKED]
+    if msgpack is not None:
+        offered.append(MSGPACK)
+    return offered
+
+
+def negotiate(accept: Any) -> str:
+    """Formato de la respuesta según la cabecera Accept (werkzeug MIMEAccept)"""
+    return accept.best_match(offered_mimetypes(), default=JSON)
+
+
+def columnar(result: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Versión columnar del resultado: sin 'steps' ni descripciones repetidas
+
+    Con raíz, los pasos se sustituyen por la traza (row1, row2 y row3 una
+    vez cada una). Con divisor, 'trace' guarda una lista por campo de los
+    pasos (position, quotient_coefficient, products).
+    """
+    steps = result.get('steps')
+    if steps is None:
+        return result
+
+    result = dict(result)
+    del result['steps']
+
+    if steps and 'row1' in steps[0]:
+        last = steps[-1]
+        result['trace'] = {
+            'row1': list(last['row1']),
+            'row2': [0] + [step['row2'][step['step']] for step in steps[1:]],
+            'row3': list(last['row3'])
+        }
+    else:
+        fields = ('position', 'quotient_coefficient', 'products')
+        result['trace'] = {field: [step[field] for step in steps] for field in fields}
+
+    return result
+
+
+def _msgpack_default(o: Any) -> Any:
+    """Fracciones del modo exacto como en el JSON: entero o cadena 'p/q'"""
+    if isinstance(o, Fraction):
+        return o.numerator if o.denominator == 1 else number_str(o)
+    raise TypeError(f'Tipo no serializable: {type(o).__name__}')
+
+
+def json_int_max_bits() -> int:
+    """
+    Bits por debajo de los cuales un int cabe en el límite de cifras de
+    str (sys.get_int_max_str_digits; 0 si no hay límite)
+    """
+    digits = getattr(sys, 'get_int_max_str_digits', lambda: 0)()
+    return int(digits * 3.32) if digits else 0
+
+
+def big_ints_as_strings(value: Any, max_bits: int) -> Any:
+    """
+    Copia de value con los int (y las partes de las Fraction) de más de
+    max_bits bits convertidos a cadena decimal
+
+    En modo exacto los coeficientes pueden superar lo que JSON (límite de
+    cifras de str) o MessagePack (64 bits) saben escribir como número.
+    """
+    if isinstance(value, bool):
+        return value
+    if isinstance(value, int):
+        return number_str(value) if max_bits and value.bit_length() > max_bits else value
+    if isinstance(value, Fraction):
+        if value.denominator == 1:
+            return big_ints_as_strings(value.numerator, max_bits)
+        return number_str(value)
+    if isinstance(value, dict):
+        return {key: big_ints_as_strings(item, max_bits) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [big_ints_as_strings(item, max_bits) for item in value]
+    return value
+
+
+def _float64(values: List[Any]) -> bytes:
+    packed = array('d', values)
+    if sys.byteorder == 'big':
+        packed.byteswap()
+    return packed.tobytes()
+
+
+def can_pack(result: Dict[str, Any]) -> bool:
+    """Si el resultado cabe en float64 sin perder nada (no en modo exacto)"""
+    return result.get('success', False) and not result.get('exact') and 'coefficients' in result
+
+
+def pack(result: Dict[str, Any], dumps: Callable[[Any], str] = json.dumps) -> bytes:
+    """
+    Resultado en el formato empaquetado application/vnd.ruffini.packed
+
+    Estructura (little-endian):
+        cabecera   24 bytes: b'RUFP', versión (u16), flags (u16), n, q, r, m (u32)
+        metadatos  m bytes: JSON UTF-8 con el resto de claves, rellenado con
+                   espacios para que los arrays empiecen alineados a 8 bytes
+        arrays     float64: coefficients (n), quotient_coefficients (q),
+                   resto (r) y, con el flag PACKED_HAS_TRACE, row2 y row3 (n cada una)
+
+    La traza de una división entre un divisor no es numérica y va en los metadatos.
+    """
+    result = columnar(result)
+    coefficients = list(result['coefficients'])
+    quotient = list(result['quotient_coefficients'])
+    if 'remainder_coefficients' in result:
+        remainder = list(result['remainder_coefficients'])
+    else:
+        remainder = [result['remainder']]
+
+    trace = result.get('trace')
+    flags = 0
+    if trace is not None and 'row2' in trace:
+        flags |= PACKED_HAS_TRACE
+
+    meta = {key: value for key, value in result.items() if key not in PACKED_ARRAYS}
+    if trace is not None and not flags & PACKED_HAS_TRACE:
+        meta['trace'] = trace
+
+    meta_bytes = dumps(meta).encode('utf-8')
+    meta_bytes += b' ' * (-(PACKED_HEADER.size + len(meta_bytes)) % 8)
+
+    parts = [
+        PACKED_HEADER.pack(PACKED_MAGIC, PACKED_VERSION, flags,
+                           len(coefficients), len(quotient), len(remainder), len(meta_bytes)),
+        meta_bytes,
+        _float64(coefficients + quotient + remainder)
+    ]
+    if flags & PACKED_HAS_TRACE:
+        parts.append(_float64(list(trace['row2']) + list(trace['row3'])))
+
+    return b''.join(parts)
+
+
+def unpack(body: bytes) -> Dict[str, Any]:
+    """Inverso de pack: diccionario con los arrays como listas de float"""
+    magic, version, flags, n, q, r, m = PACKED_HEADER.unpack_from(body)
+    if magic != PACKED_MAGIC or version != PACKED_VERSION:
+        raise ValueError('No es una respuesta empaquetada de la Calculadora de Ruffini')
+
+    offset = PACKED_HEADER.size
+    result = json.loads(body[offset:offset + m].decode('utf-8'))
+    offset += m
+
+    values = array('d')
+    values.frombytes(body[offset:])
+    if sys.byteorder == 'big':
+        values.byteswap()
+    values = values.tolist()
+
+    result['coefficients'] = values[:n]
+    result['quotient_coefficients'] = values[n:n + q]
+    remainder = values[n + q:n + q + r]
+    if 'remainder_polynomial' in result:
+        result['remainder_coefficients'] = remainder
+    else:
+        result['remainder'] = remainder[0]
+
+    if flags & PACKED_HAS_TRACE:
+        start = n + q + r
+        result['trace'] = {
+            'row1': result['coefficients'],
+            'row2': values[start:start + n],
+            'row3': values[start + n:start + 2 * n]
+        }
+
+    return result
+
+
+def encode(result: Dict[str, Any], mimetype: str,
+           dumps: Callable[[Any], str] = json.dumps) -> Tuple[bytes, str]:
+    """
+    Serializa el resultado en el formato negociado
+
+    Los resultados que no admiten el formato empaquetado (modo exacto,
+    errores) se devuelven como JSON columnar.
+
+    Returns:
+        Tupla con (cuerpo, mimetype real de la respuesta)
+    """
+    if mimetype == PACKED and can_pack(result):
+        return pack(result, dumps), PACKED
+    if mimetype == MSGPACK and msgpack is not None:
+        result = columnar(result)
+        try:
+            return msgpack.packb(result, default=_msgpack_default, use_bin_type=True), MSGPACK
+        except OverflowError:
+            # Enteros exactos de más de 64 bits
+            return msgpack.packb(big_ints_as_strings(result, 63), default=_msgpack_default,
+                                 use_bin_type=True), MSGPACK
+    return (dumps(columnar(result)) + '\n').encode('utf-8'), COLUMNAR_JSON
@@ -0,0 +1,368 @@
+"""
+Cachés de resultados de la Calculadora de Ruffini
+LRU en memoria por proceso, o en un fichero SQLite compartido por todos los procesos del nodo
+Ambas acotadas por número de entradas y, opcionalmente, por tiempo de vida (TTL)
+"""
+
+import base64
+import hashlib
+import json
+import os
+import re
+import sqlite3
+import threading
+import time
+from array import array
+from collections import OrderedDict
+from fractions import Fraction
+from typing import Any, Dict, Hashable, Optional
+
+try:
+    from src.ruffini_result import RuffiniResult
+except ImportError:
+    from ruffini_result import RuffiniResult
+
+# Nombres de tabla admitidos por SQLiteCache (se interpolan en el SQL)
+_TABLE_NAME = re.compile(r'[A-Za-z_][A-Za-z0-9_]*')
+
+# Enteros de más bits se guardan en hexadecimal: str() de un int tiene un
+# límite de dígitos y la conversión decimal es cuadrática
+_INT_MAX_BITS = 64
+
+
+def _encode(value: Any) -> Any:
+    """
+    Convierte un valor de la caché en uno serializable a JSON
+    
+    Los tipos que JSON no distingue (tuplas, diccionarios con claves no
+    textuales, Fraction, complex, enteros grandes, array y RuffiniResult)
+    se guardan como un objeto de una sola clave que empieza por '~'.
+    """
+    if value is None or isinstance(value, (bool, str, float)):
+        return value
+    if isinstance(value, int):
+        if value.bit_length() > _INT_MAX_BITS:
+            return {'~int': format(value, 'x')}
+        return value
+    if isinstance(value, list):
+        return [_encode(item) for item in value]
+    if isinstance(value, tuple):
+        return {'~tuple': [_encode(item) for item in value]}
+    if isinstance(value, dict):
+        if all(isinstance(key, str) and not key.startswith('~') for key in value):
+            return {key: _encode(item) for key, item in value.items()}
+        return {'~dict': [[_encode(key), _encode(item)] for key, item in value.items()]}
+    if isinstance(value, Fraction):
+        return {'~frac': [_encode(value.numerator), _encode(value.denominator)]}
+    if isinstance(value, complex):
+        return {'~complex': [value.real, value.imag]}
+    if isinstance(value, array):
+        return {'~array': [value.typecode, base64.b64encode(value.tobytes()).decode('ascii')]}
+    if isinstance(value, RuffiniResult):
+        return {'~ruffini': [value.polynomial, _encode(value.root), _encode(value._table),
+                             value.quotient, value.exact]}
+    raise TypeError(f'Tipo no admitido en la caché: {type(value).__name__}')
+
+
+def _decode_object(obj: Dict[str, Any]) -> Any:
+    """object_hook de json.loads: deshace las etiquetas de _encode"""
+    if len(obj) != 1:
+        return obj
+    (tag, value), = obj.items()
+    if tag == '~int':
+        return int(value, 16)
+    if tag == '~tuple':
+        return tuple(value)
+    if tag == '~dict':
+        return {key: item for key, item in value}
+    if tag == '~frac':
+        return Fraction(*value)
+    if tag == '~complex':
+        return complex(*value)
+    if tag == '~array':
+        table = array(value[0])
+        table.frombytes(base64.b64decode(value[1]))
+        return table
+    if tag == '~ruffini':
+        return RuffiniResult(*value)
+    return obj
+
+
+def dumps(value: Any) -> str:
+    """Serializa un valor de la caché a JSON (ver _encode)"""
+    return json.dumps(_encode(value), separators=(',', ':'))
+
+
+def loads(text: str) -> Any:
+    """Inversa de dumps"""
+    return json.loads(text, object_hook=_decode_object)
+
+
+class LRUCache:
+    """
+    Caché LRU segura entre hilos con TTL opcional y contadores para monitorización
+    """
+    
+    def __init__(self, max_size: int = 1024, ttl: Optional[float] = None):
+        """
+        Args:
+            max_size: Número máximo de entradas (0 desactiva la caché)
+            ttl: Segundos que una entrada es válida (None o 0: sin caducidad)
+        """
+        self.max_size = max_size
+        self.ttl = ttl or None
+        self._data = OrderedDict()  # clave -> (instante de caducidad, valor)
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+    
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """Devuelve el valor guardado para key, o default si no está o caducó"""
+        with self._lock:
+            entry = self._data.get(key)
+            
+            if entry is None:
+                self.misses += 1
+                return default
+            
+            expires_at, value = entry
+            if expires_at is not None and expires_at <= time.monotonic():
+                del self._data[key]
+                self.expirations += 1
+                self.misses += 1
+                return default
+            
+            self._data.move_to_end(key)
+            self.hits += 1
+            return value
+    
+    def set(self, key: Hashable, value: Any) -> None:
+        """Guarda value para key, desalojando la entrada menos usada si se supera max_size"""
+        if self.max_size <= 0:
+            return
+        
+        expires_at = time.monotonic() + self.ttl if self.ttl else None
+        
+        with self._lock:
+            self._data[key] = (expires_at, value)
+            self._data.move_to_end(key)
+            
+            while len(self._data) > self.max_size:
+                self._data.popitem(last=False)
+                self.evictions += 1
+    
+    def clear(self) -> None:
+        """Vacía la caché (los contadores se conservan)"""
+        with self._lock:
+            self._data.clear()
+    
+    def stats(self) -> Dict[str, Any]:
+        """Contadores de aciertos, fallos, desalojos y caducidades"""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                'size': len(self._data),
+                'max_size': self.max_size,
+                'ttl': self.ttl,
+                'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.evictions,
+                'expirations': self.expirations,
+                'hit_rate': self.hits / lookups if lookups else 0.0
+            }
+    
+    def __len__(self) -> int:
+        return len(self._data)
+
+
+class SQLiteCache:
+    """
+    Caché compartida entre procesos sobre un fichero SQLite en modo WAL
+    
+    Misma interfaz que LRUCache. Todos los workers (por ejemplo, de
+    gunicorn) que abren el mismo fichero comparten las entradas. Los
+    valores se guardan como JSON (ver dumps), nunca con pickle, de modo
+    que leer el fichero no ejecuta código; aun así conviene que esté en
+    un directorio privado del servidor.
+    
+    Al superar max_size se desalojan las entradas usadas hace más tiempo.
+    Los contadores (hits, misses...) son de este proceso; 'size' es el
+    total del fichero. Si SQLite falla (por ejemplo, base de datos
+    bloqueada más allá del timeout) o una entrada no se puede leer, la
+    operación cuenta como fallo de caché y la petición se calcula
+    normalmente; la entrada ilegible se borra.
+    """
+    
+    def __init__(self, path: str, max_size: int = 1024, ttl: Optional[float] = None,
+                 timeout: float = 5.0, table: str = 'entries'):
+        """
+        Args:
+            path: Fichero SQLite (se crea si no existe)
+            max_size: Número máximo de entradas (0 desactiva la caché)
+            ttl: Segundos que una entrada es válida (None o 0: sin caducidad)
+            timeout: Segundos de espera si otro proceso tiene el fichero bloqueado
+            table: Tabla de la caché; varias cachés pueden compartir fichero
+                con tablas distintas, cada una con su propio max_size
+        """
+        if not _TABLE_NAME.fullmatch(table):
+            raise ValueError(f'Nombre de tabla no válido: {table!r}')
+        
+        self.path = path
+        self.table = table
+        self.max_size = max_size
+        self.ttl = ttl or None
+        self.timeout = timeout
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+        self.errors = 0
+        
+        if max_size > 0:
+            with self._connect() as connection:
+                connection.execute(f"""
+                    CREATE TABLE IF NOT EXISTS {self.table} (
+                        key TEXT PRIMARY KEY,
+                        value BLOB NOT NULL,
+                        expires_at REAL,
+                        last_used REAL NOT NULL
+                    )
+                """)
+                connection.execute(
+                    f"CREATE INDEX IF NOT EXISTS {self.table}_last_used ON {self.table} (last_used)")
+    
+    def _connect(self) -> sqlite3.Connection:
+        """Conexión de este hilo y proceso (se reabre tras un fork)"""
+        connection = getattr(self._local, 'connection', None)
+        if connection is None or self._local.pid != os.getpid():
+            connection = sqlite3.connect(self.path, timeout=self.timeout)
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("PRAGMA synchronous=NORMAL")
+            self._local.connection = connection
+            self._local.pid = os.getpid()
+        return connection
+    
+    @staticmethod
+    def _key(key: Hashable) -> str:
+        """Clave de texto estable entre procesos (hash() cambia en cada proceso)"""
+        return hashlib.sha1(repr(key).encode('utf-8')).hexdigest()
+    
+    def _count(self, counter: str) -> None:
+        with self._lock:
+            setattr(self, counter, getattr(self, counter) + 1)
+    
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """Devuelve el valor guardado para key, o default si no está o caducó"""
+        if self.max_size <= 0:
+            self._count('misses')
+            return default
+        
+        text_key = self._key(key)
+        now = time.time()
+        
+        try:
+            with self._connect() as connection:
+                row = connection.execute(
+                    f"SELECT value, expires_at FROM {self.table} WHERE key = ?", (text_key,)
+                ).fetchone()
+                
+                if row is None:
+                    self._count('misses')
+                    return default
+                
+                value, expires_at = row
+                if expires_at is not None and expires_at <= now:
+                    connection.execute(f"DELETE FROM {self.table} WHERE key = ?", (text_key,))
+                    self._count('expirations')
+                    self._count('misses')
+                    return default
+                
+                connection.execute(f"UPDATE {self.table} SET last_used = ? WHERE key = ?", (now, text_key))
+        except sqlite3.Error:
+            self._count('errors')
+            self._count('misses')
+            return default
+        
+        try:
+            result = loads(value)
+        except Exception:
+            # Entrada corrupta o de otro formato (por ejemplo, de una versión anterior)
+            self._discard(text_key)
+            self._count('errors')
+            self._count('misses')
+            return default
+        
+        self._count('hits')
+        return result
+    
+    def _discard(self, text_key: str) -> None:
+        """Borra una entrada ilegible"""
+        try:
+            with self._connect() as connection:
+                connection.execute(f"DELETE FROM {self.table} WHERE key = ?", (text_key,))
+        except sqlite3.Error:
+            pass
+    
+    def set(self, key: Hashable, value: Any) -> None:
+        """Guarda value para key, desalojando las entradas menos usadas si se supera max_size"""
+        if self.max_size <= 0:
+            return
+        
+        now = time.time()
+        expires_at = now + self.ttl if self.ttl else None
+        
+        try:
+            text = dumps(value)
+            with self._connect() as connection:
+                connection.execute(
+                    f"INSERT OR REPLACE INTO {self.table} (key, value, expires_at, last_used) VALUES (?, ?, ?, ?)",
+                    (self._key(key), text, expires_at, now)
+                )
+                
+                excess = connection.execute(f"SELECT COUNT(*) FROM {self.table}").fetchone()[0] - self.max_size
+                if excess > 0:
+                    connection.execute(
+                        f"DELETE FROM {self.table} WHERE key IN "
+                        f"(SELECT key FROM {self.table} ORDER BY last_used LIMIT ?)", (excess,)
+                    )
+                    with self._lock:
+                        self.evictions += excess
+        except (sqlite3.Error, TypeError, ValueError):
+            self._count('errors')
+    
+    def clear(self) -> None:
+        """Vacía la caché para todos los procesos (los contadores se conservan)"""
+        if self.max_size <= 0:
+            return
+        with self._connect() as connection:
+            connection.execute(f"DELETE FROM {self.table}")
+    
+    def stats(self) -> Dict[str, Any]:
+        """Contadores de este proceso y tamaño total del fichero compartido"""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                'backend': 'sqlite',
+                'path': self.path,
+                'size': len(self),
+                'max_size': self.max_size,
+                'ttl': self.ttl,
+                'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.evictions,
+                'expirations': self.expirations,
+                'errors': self.errors,
+                'hit_rate': self.hits / lookups if lookups else 0.0
+            }
+    
+    def __len__(self) -> int:
+        if self.max_size <= 0:
+            return 0
+        try:
+            return self._connect().execute(f"SELECT COUNT(*) FROM {self.table}").fetchone()[0]
+        except sqlite3.Error:
+            return 0
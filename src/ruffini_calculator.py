@@ -3,79 +3,323 @@ Calculadora de Ruffini con integración de IA
 Implementa el método de Ruffini para división polinómica con explicaciones detalladas
 """
 
+from array import array
 import json
-from typing import List, Tuple, Dict, Any
+import math
+import sys
+from fractions import Fraction
+from functools import reduce
+from typing import List, Tuple, Dict, Any, Callable, Iterable, Iterator, Union
 import re
+import time
+
+try:
+    import numpy as np
+except ImportError:  # NumPy es opcional, solo lo usa el motor vectorizado
+    np = None
+
+try:
+    from src.rational_roots import find_rational_roots
+    from src.numerical_roots import aberth_roots, companion_roots, newton_polish
+    from src.ruffini_result import RuffiniResult, number_str
+    from src.polynomial_arithmetic import verify_division
+except ImportError:  # Ejecución directa: python src/ruffini_calculator.py
+    from rational_roots import find_rational_roots
+    from numerical_roots import aberth_roots, companion_roots, newton_polish
+    from ruffini_result import RuffiniResult, number_str
+    from polynomial_arithmetic import verify_division
+
+# Un término del polinomio: signo opcional, coeficiente opcional, '*' opcional
+# y la variable x con exponente opcional. Se compila una sola vez.
+_TERM_PATTERN = re.compile(r"""
+    [ \t]*(?P<sign>[+-])?
+    [ \t]*(?P<coef>(?:\d+(?:\.\d*)?|\.\d+)(?:[eE][+-]?\d+)?)?
+    [ \t]*(?:(?P<star>\*)[ \t]*)?
+    (?:(?P<var>x)(?:[ \t]*\^[ \t]*(?P<exp>\d+))?)?
+    [ \t]*
+""", re.VERBOSE)
+
+
+# Grado a partir del cual un polinomio con pocos términos se mantiene disperso
+SPARSE_MIN_DEGREE = 64
+
+# Cifras máximas del valor exacto de un número en modo exacto: '1e9999999'
+# ocuparía diez millones de cifras y bloquearía el cálculo al convertirlo
+EXACT_MAX_DIGITS = 1000
+
+# Una raíz numérica se considera real si su parte imaginaria es menor que
+# esta fracción de su módulo; las reales se prueban como fracciones p/q con
+# q hasta RATIONAL_ROOT_MAX_DENOMINATOR
+REAL_ROOT_TOLERANCE = 1e-8
+RATIONAL_ROOT_MAX_DENOMINATOR = 1000
+
+# Las aproximaciones de una raíz de multiplicidad m se dispersan en un
+# círculo de radio ~ε^(1/m): las que distan menos de esta fracción de su
+# módulo forman un grupo de tamaño m, y la tolerancia de REAL_ROOT_TOLERANCE
+# pasa a REAL_ROOT_TOLERANCE^(1/m)
+ROOT_CLUSTER_RADIUS = 1e-2
+
+# Límites de la explicación: con más pasos se muestran solo los primeros y
+# los últimos, y las filas largas se abrevian, para que el texto no crezca
+# cuadráticamente con el grado
+EXPLANATION_MAX_STEPS = 20
+EXPLANATION_EDGE_STEPS = 5
+EXPLANATION_ROW_ITEMS = 8
+
+# Plantillas de la explicación, definidas una sola vez
+_EXPLANATION_HEADER = """
+🤖 EXPLICACIÓN CON IA - MÉTODO DE RUFFINI
+
+📊 PROBLEMA:
+Dividir el polinomio: {polynomial}
+Entre: (x - {root})
+
+🔍 PROCESO PASO A PASO:
+
+El método de Ruffini es una forma simplificada de la división polinómica.
+Se utiliza específicamente para dividir un polinomio entre un binomio de la forma (x - a).
+
+📋 PASOS REALIZADOS:
+"""
+
+_EXPLANATION_STEP = """
+{step}. {description}
+   Fila 1: {row1}
+   Fila 2: {row2}
+   Resultado: {row3}
+"""
+
+_EXPLANATION_OMITTED = """
+   ... {count} pasos intermedios omitidos (se repite la misma operación) ...
+"""
+
+_EXPLANATION_FOOTER = """
+✅ RESULTADO FINAL:
+• Cociente: {quotient}
+• Resto: {remainder}
+
+🎯 VERIFICACIÓN:
+El resultado se puede verificar con: ({quotient}) × (x - {root}) + {remainder}
+
+💡 INTERPRETACIÓN:
+"""
+
+_EXPLANATION_FACTOR = "Como el resto es 0, (x - {root}) es un factor del polinomio original."
+_EXPLANATION_NOT_FACTOR = "Como el resto es {remainder} ≠ 0, (x - {root}) no es un factor exacto del polinomio."
+
+
+def _finite_list(values: Iterable[float]) -> List[Union[float, None]]:
+    """Lista de floats con None en lugar de inf y nan, que JSON no admite"""
+    if np is not None and isinstance(values, np.ndarray):
+        return np.where(np.isfinite(values), values, None).tolist()
+    return [value if math.isfinite(value) else None for value in values]
+
+
+def literal_digits(literal: str) -> int:
+    """
+    Cifras aproximadas del valor exacto de un número escrito como en el
+    parser ('12', '0.5', '1e300', '1/3'): las de la mantisa más el valor
+    absoluto del exponente, sin calcular la potencia
+    """
+    mantissa, _, exponent = literal.lower().partition('e')
+    exponent = exponent.lstrip('+-')
+    if not exponent.isdigit():
+        return len(mantissa)
+    if len(exponent) > 15:
+        return 10 ** 15
+    return len(mantissa) + int(exponent)
+
+
+def _power(x: float, degree: int) -> float:
+    """x ** degree con inf en lugar de OverflowError"""
+    try:
+        return x ** degree
+    except OverflowError:
+        return math.copysign(math.inf, x) if degree % 2 else math.inf
+
+
+class PolynomialParseError(ValueError):
+    """
+    Error de sintaxis al parsear un polinomio
+    
+    El atributo position indica el índice (desde 0) del carácter
+    de la cadena original donde se detectó el error.
+    """
+    
+    def __init__(self, message: str, position: int):
+        super().__init__(f"{message} (posición {position})")
+        self.position = position
+
 
 class RuffiniCalculator:
     """
     Calculadora que implementa el método de Ruffini para división polinómica
     """
     
-    def __init__(self):
-        self.steps = []  # Para almacenar pasos del proceso
-        self.explanation = []  # Para explicaciones de IA
+    def __init__(self, stage_timer: Callable[[str, float], None] = None):
+        """
+        Args:
+            stage_timer: Función opcional stage_timer(etapa, segundos) que
+                recibe la duración de cada etapa de calculate: 'parse',
+                'divide', 'format', 'steps' y 'explain'. Debe ser segura
+                entre hilos si la calculadora se comparte
+        """
+        self.stage_timer = stage_timer
+    
+    def _lap(self, stage: str, start: float) -> float:
+        """Informa la duración de una etapa y devuelve el instante actual"""
+        now = time.perf_counter()
+        if self.stage_timer is not None:
+            self.stage_timer(stage, now - start)
+        return now
         
-    def parse_polynomial(self, poly_str: str) -> List[float]:
+    def parse_polynomial(self, poly_str: str, exact: bool = False) -> List[float]:
         """
         Convierte una cadena de polinomio en lista de coeficientes
         Ejemplo: "x^3 + 2x^2 - 5x + 6" -> [1, 2, -5, 6]
+        
+        Con exact=True los coeficientes son int o Fraction (ver to_exact).
         """
-        # Remover espacios y normalizar
-        poly_str = poly_str.replace(' ', '').replace('-', '+-')
+        return self.expand_terms(self.parse_polynomial_terms(poly_str, exact))
+    
+    def expand_terms(self, terms: Dict[int, float]) -> List[float]:
+        """
+        Expande la forma dispersa grado -> coeficiente a la lista densa de coeficientes
+        """
+        max_degree = max(terms)
         
-        # Encontrar el grado máximo
-        degrees = re.findall(r'x\^(\d+)', poly_str)
-        if not degrees:
-            # Si no hay x^n, buscar x solo
-            if 'x' in poly_str:
-                max_degree = 1
-            else:
-                max_degree = 0
-        else:
-            max_degree = max(map(int, degrees))
+        # Inicializar coeficientes en cero (del mismo tipo que los coeficientes).
+        # No vale terms[max_degree] * 0: con un float negativo da -0.0
+        zero = type(terms[max_degree])(0)
+        coefficients = [zero] * (max_degree + 1)
         
-        # Inicializar coeficientes en cero
-        coefficients = [0] * (max_degree + 1)
+        for degree, coef in terms.items():
+            coefficients[max_degree - degree] = coef
         
-        # Encontrar todos los términos
-        terms = re.findall(r'[+-]?[^+-]+', poly_str)
+        return coefficients
+    
+    def is_sparse(self, terms: Dict[int, float]) -> bool:
+        """
+        Indica si conviene mantener el polinomio en forma dispersa
         
-        for term in terms:
-            term = term.strip()
-            if not term:
-                continue
-                
-            # Término constante
-            if 'x' not in term:
-                coefficients[max_degree] = float(term)
+        Lo es cuando el grado es alto y menos de una cuarta parte de los
+        coeficientes son distintos de cero.
+        """
+        max_degree = max(terms)
+        return max_degree >= SPARSE_MIN_DEGREE and len(terms) * 4 <= max_degree + 1
+    
+    def parse_polynomial_terms(self, poly_str: str, exact: bool = False) -> Dict[int, float]:
+        """
+        Convierte una cadena de polinomio en un diccionario disperso grado -> coeficiente
+        Ejemplo: "x^3 + 2x^2 - 5x + 6" -> {3: 1.0, 2: 2.0, 1: -5.0, 0: 6.0}
+        
+        Recorre la cadena una sola vez con un patrón precompilado, por lo que
+        el coste es lineal en la longitud de la entrada. Los términos del
+        mismo grado se suman.
+        
+        Con exact=True los coeficientes enteros se leen como int y los
+        decimales como Fraction, sin pasar por float.
+        
+        Raises:
+            PolynomialParseError: Si la cadena no es un polinomio válido
+        """
+        terms = {}
+        get = terms.get
+        zero, one = (0, 1) if exact else (0.0, 1.0)
+        
+        # scanner.match encadena coincidencias contiguas: un único recorrido
+        for match in iter(_TERM_PATTERN.scanner(poly_str).match, None):
+            sign, coef_str, star, var, exp = match.groups()
+            
+            if star is not None and coef_str is None:
+                raise PolynomialParseError("Falta el coeficiente antes de '*'", match.start('star'))
+            
+            if coef_str is None and var is None:
+                # No hay más términos: fin de la cadena o carácter inválido
+                error_pos = match.end()
+                if error_pos < len(poly_str):
+                    raise PolynomialParseError(f"Carácter inesperado '{poly_str[error_pos]}'", error_pos)
+                if not terms:
+                    raise PolynomialParseError("Polinomio vacío", error_pos)
+                if sign is not None:
+                    raise PolynomialParseError("Término incompleto al final", error_pos)
+                break
+            
+            if star is not None and var is None:
+                raise PolynomialParseError("Se esperaba 'x' después de '*'", match.end())
+            
+            if sign is None and terms:
+                error_pos = self._first_non_blank(poly_str, match.start())
+                raise PolynomialParseError(
+                    f"Se esperaba '+' o '-' antes de '{poly_str[error_pos:match.end()].strip()}'",
+                    error_pos
+                )
+            
+            if coef_str is None:
+                coef = one
+            elif not exact:
+                coef = float(coef_str)
+            elif coef_str.isdigit() and len(coef_str) <= EXACT_MAX_DIGITS:
+                coef = int(coef_str)  # Camino rápido para enteros
             else:
-                # Extraer coeficiente
-                coef_match = re.match(r'([+-]?\d*)', term)
-                coef_str = coef_match.group(1) if coef_match else '1'
-                
-                if coef_str == '' or coef_str == '+':
-                    coef = 1
-                elif coef_str == '-':
-                    coef = -1
-                else:
-                    coef = float(coef_str)
-                
-                # Extraer grado
-                if '^' in term:
-                    degree_match = re.search(r'x\^(\d+)', term)
-                    degree = int(degree_match.group(1)) if degree_match else 1
-                else:
-                    degree = 1
-                
-                coefficients[max_degree - degree] = coef
+                coef = self.to_exact(coef_str)
+            
+            if sign == '-':
+                coef = -coef
+            
+            if var is None:
+                degree = 0
+            else:
+                degree = int(exp) if exp is not None else 1
+            
+            terms[degree] = get(degree, zero) + coef
         
-        return coefficients
+        return terms
+    
+    @staticmethod
+    def to_exact(value: Any) -> Union[int, Fraction]:
+        """
+        Convierte un número (int, float, Fraction o cadena como '3', '0.5'
+        o '1/2') a su valor exacto: int si es entero, Fraction si no
+        
+        Los float se convierten a partir de su representación decimal, de
+        modo que 0.1 pasa a ser 1/10 y no la fracción binaria exacta.
+        
+        Raises:
+            ValueError: Si la cadena tiene más de EXACT_MAX_DIGITS cifras
+                (contando el exponente) o no es un número
+        """
+        if isinstance(value, int) and not isinstance(value, bool):
+            return value
+        
+        if isinstance(value, float):
+            if not math.isfinite(value):
+                raise ValueError(f"No se puede representar {value} de forma exacta")
+            value = Fraction(repr(value))
+        elif isinstance(value, str):
+            value = value.strip()
+            if literal_digits(value) > EXACT_MAX_DIGITS:
+                raise ValueError(f"Los números del modo exacto admiten como máximo {EXACT_MAX_DIGITS} cifras")
+            value = Fraction(value)
+        else:
+            value = Fraction(value)
+        
+        return value.numerator if value.denominator == 1 else value
+    
+    @staticmethod
+    def _first_non_blank(text: str, pos: int) -> int:
+        """Posición del primer carácter no blanco a partir de pos"""
+        while pos < len(text) and text[pos] in ' \t':
+            pos += 1
+        return pos
     
     def ruffini_division(self, coefficients: List[float], root: float) -> Tuple[List[float], float]:
         """
         Realiza la división de Ruffini
         
+        No modifica el estado de la instancia; para obtener también los
+        pasos, usar ruffini_division_steps.
+        
         Args:
             coefficients: Lista de coeficientes del polinomio
             root: Valor por el que se divide (x - root)
@@ -83,69 +327,355 @@ class RuffiniCalculator:
         Returns:
             Tupla con (coeficientes del cociente, resto)
         """
-        self.steps = []
+        return self.synthetic_division(coefficients, root)
+    
+    def ruffini_division_steps(self, coefficients: List[float], root: float) -> Tuple[List[float], float, List[Dict[str, Any]]]:
+        """
+        Realiza la división de Ruffini sin modificar el estado de la instancia
+        
+        Los pasos completos repiten las filas en cada iteración (O(n²) en
+        memoria); para grados altos conviene usar synthetic_division o
+        compact_trace.
+        
+        Args:
+            coefficients: Lista de coeficientes del polinomio
+            root: Valor por el que se divide (x - root)
+            
+        Returns:
+            Tupla con (coeficientes del cociente, resto, pasos)
+        """
+        trace = self.compact_trace(coefficients, root)
+        steps = list(self.iter_steps(trace, root))
+        
+        # El último elemento es el resto
+        result = trace['row3']
+        return result[:-1], result[-1], steps
+    
+    def synthetic_division(self, coefficients: List[float], root: float) -> Tuple[List[float], float]:
+        """
+        División de Ruffini sin registrar pasos (camino rápido, O(n))
+        
+        Returns:
+            Tupla con (coeficientes del cociente, resto)
+        """
+        if isinstance(root, Fraction) and all(type(coef) is int for coef in coefficients):
+            return self._rational_synthetic_division(coefficients, root)
+        
+        result = [coefficients[0]]
+        for coef in coefficients[1:]:
+            result.append(coef + result[-1] * root)
+        
+        return result[:-1], result[-1]
+    
+    def _rational_synthetic_division(self, coefficients: List[int], root: Fraction) -> Tuple[List[Fraction], Fraction]:
+        """
+        División exacta de coeficientes enteros por una raíz racional p/q
+        
+        Trabaja con enteros escalados B_k = b_k * q^k (Horner con enteros
+        grandes) y solo construye las Fraction al final, evitando el máximo
+        común divisor en cada suma y producto.
+        """
+        p, q = root.numerator, root.denominator
+        scaled = [coefficients[0]]
+        powers = [1]
+        q_power = 1
+        
+        for coef in coefficients[1:]:
+            q_power *= q
+            powers.append(q_power)
+            scaled.append(coef * q_power + p * scaled[-1])
+        
+        result = [Fraction(value, power) for value, power in zip(scaled, powers)]
+        return result[:-1], result[-1]
+    
+    def expanded_synthetic_division(self, coefficients: List[float], divisor: List[float],
+                                    record_steps: bool = False) -> Tuple[List[float], List[float], Union[List[Dict[str, Any]], None]]:
+        """
+        División sintética expandida entre un divisor cualquiera
+        
+        Generaliza Ruffini a divisores de grado m y coeficiente principal
+        distinto de 1, como (2x - 3) o x^2 + x + 1. Trabaja sobre una única
+        copia del dividendo: en cada paso fija un coeficiente del cociente
+        y resta sus productos por el divisor en las m posiciones siguientes,
+        O(n·m) en total.
+        
+        Args:
+            coefficients: Coeficientes del dividendo (de mayor a menor grado)
+            divisor: Coeficientes del divisor, con el principal distinto de 0
+            record_steps: Si se devuelve un paso por coeficiente del cociente
+                (solo guarda los m productos de cada paso, O(n·m) en memoria)
+            
+        Returns:
+            Tupla con (cociente, resto, pasos o None). El resto tiene m
+            coeficientes (grado menor que el del divisor)
+        """
+        # Quitar ceros iniciales del divisor
+        start = 0
+        while start < len(divisor) - 1 and divisor[start] == 0:
+            start += 1
+        divisor = divisor[start:]
+        
+        if divisor[0] == 0:
+            raise ValueError("No se puede dividir entre el polinomio nulo")
+        
+        m = len(divisor) - 1
         n = len(coefficients)
+        steps = [] if record_steps else None
         
-        # Primera fila: coeficientes originales
-        self.steps.append({
-            'step': 0,
-            'description': 'Coeficientes del polinomio original',
-            'row1': coefficients.copy(),
-            'row2': [0] * n,
-            'row3': [coefficients[0]]
-        })
+        if n <= m:
+            # El dividendo ya tiene grado menor que el divisor
+            return [type(coefficients[0])(0)], list(coefficients), steps
         
-        result = [coefficients[0]]  # El primer coeficiente se copia
+        lead = divisor[0]
+        exact = not any(isinstance(coef, float) for coef in list(coefficients) + divisor)
+        
+        work = list(coefficients)
+        for i in range(n - m):
+            value = work[i]
+            if lead == 1:
+                coef = value
+            elif exact:
+                coef = self.to_exact(Fraction(value) / lead)
+            else:
+                coef = value / lead
+            work[i] = coef
+            
+            if coef != 0:
+                for j in range(1, m + 1):
+                    work[i + j] -= divisor[j] * coef
+            
+            if record_steps:
+                steps.append({
+                    'step': i + 1,
+                    'description': (f'Paso {i + 1}: Dividir {number_str(value)} ÷ {number_str(lead)} = {number_str(coef)}, '
+                                    f'luego restar {number_str(coef)} × divisor a los siguientes coeficientes'),
+                    'position': i,
+                    'quotient_coefficient': coef,
+                    'products': [divisor[j] * coef for j in range(1, m + 1)]
+                })
+        
+        return work[:n - m], work[n - m:], steps
+    
+    def ruffini_division_sparse(self, terms: Dict[int, float], root: float) -> Tuple[Dict[int, float], float]:
+        """
+        División de Ruffini sobre la forma dispersa grado -> coeficiente
+        
+        Salta los huecos entre términos cuando el valor acumulado es 0 o la
+        raíz es 0, de modo que, por ejemplo, x^1000000 - 1 entre x no recorre
+        un millón de coeficientes. Con otras raíces el cociente es denso por
+        naturaleza y se recorre cada grado, pero sin expandir la entrada.
+        
+        Returns:
+            Tupla con (cociente disperso grado -> coeficiente, resto)
+        """
+        degrees = sorted(terms, reverse=True)
+        quotient = {}
+        zero = type(terms[degrees[0]])(0)  # Cero del mismo tipo que los coeficientes (nunca -0.0)
+        value = zero
+        pos = 0  # Índice del siguiente término no nulo por procesar
+        degree = degrees[0]
+        
+        while True:
+            if pos < len(degrees) and degrees[pos] == degree:
+                value = value * root + terms[degree]
+                pos += 1
+            else:
+                value = value * root
+            
+            if degree == 0:
+                return quotient, value
+            
+            if value != 0:
+                quotient[degree - 1] = value
+            
+            if value == 0 or root == 0:
+                # Los valores intermedios son 0 hasta el siguiente término
+                value = zero
+                degree = degrees[pos] if pos < len(degrees) else 0
+            else:
+                degree -= 1
+    
+    def ruffini_division_many(self, coefficients: List[float], roots: Iterable[float]) -> Tuple[Any, Any]:
+        """
+        División de Ruffini de un mismo polinomio por muchas raíces a la vez
+        
+        Recorre los coeficientes una sola vez y opera con vectores de NumPy
+        sobre todas las raíces en cada paso, en lugar de llamar a
+        ruffini_division en un bucle de Python. Requiere NumPy.
+        
+        Args:
+            coefficients: Lista de coeficientes del polinomio
+            roots: Valores por los que se divide (x - root)
+            
+        Returns:
+            Tupla con (matriz de cocientes de forma (len(roots), grado),
+            vector de restos de longitud len(roots))
+        """
+        if np is None:
+            raise ImportError("El motor vectorizado requiere NumPy (pip install numpy)")
+        
+        coefficients = np.asarray(coefficients, dtype=float)
+        roots = np.asarray(roots, dtype=float).ravel()
+        n = len(coefficients)
+        
+        if n == 0:
+            raise ValueError("El polinomio no tiene coeficientes")
+        
+        result = np.empty((len(roots), n), dtype=float)
+        result[:, 0] = coefficients[0]  # El primer coeficiente se copia
         
         for i in range(1, n):
-            # Multiplicar el resultado anterior por la raíz
-            product = result[i-1] * root
-            
-            # Sumar al coeficiente actual
-            new_coef = coefficients[i] + product
-            result.append(new_coef)
-            
-            # Guardar paso
-            row2 = [0] * n
-            row2[i] = product
-            
-            self.steps.append({
-                'step': i,
-                'description': f'Paso {i}: Multiplicar {result[i-1]} × {root} = {product}, luego sumar {coefficients[i]} + {product} = {new_coef}',
-                'row1': coefficients.copy(),
-                'row2': row2,
-                'row3': result.copy()
-            })
+            # Multiplicar la columna anterior por cada raíz y sumar el coeficiente
+            np.multiply(result[:, i-1], roots, out=result[:, i])
+            result[:, i] += coefficients[i]
         
-        # El último elemento es el resto
-        remainder = result[-1]
-        quotient = result[:-1]
+        return result[:, :-1], result[:, -1]
+    
+    def evaluate_many(self, coefficients: Union[List[float], Dict[int, float]], xs: Iterable[float],
+                      derivative: bool = False) -> Tuple[List[float], Union[List[float], None]]:
+        """
+        Evalúa P(x) (y opcionalmente P'(x)) en muchos puntos con Horner
+        
+        Con NumPy, cada paso de Horner opera sobre el vector de todos los
+        puntos a la vez; sin NumPy se hace el mismo recorrido punto a punto.
+        La forma dispersa grado -> coeficiente se evalúa término a término
+        con potencias, sin expandirla.
+        
+        Args:
+            coefficients: Lista de coeficientes o forma dispersa grado -> coeficiente
+            xs: Puntos en los que se evalúa
+            derivative: Si también se calcula P'(x) en los mismos puntos
+            
+        Returns:
+            Tupla con (valores de P, valores de P' o None). Los valores que
+            desbordan (inf o nan) se devuelven como None
+        """
+        if not coefficients:
+            raise ValueError("El polinomio no tiene coeficientes")
+        
+        if isinstance(coefficients, dict):
+            pairs = [(degree, float(coef)) for degree, coef in coefficients.items()]
+        else:
+            coefficients = [float(coef) for coef in coefficients]
+        
+        if np is None:
+            xs = [float(x) for x in xs]
+            if isinstance(coefficients, dict):
+                values = [sum(c * _power(x, d) for d, c in pairs) for x in xs]
+                slopes = [sum(c * d * _power(x, d - 1) for d, c in pairs if d > 0) for x in xs] if derivative else None
+            else:
+                values = []
+                slopes = [] if derivative else None
+                for x in xs:
+                    value = slope = 0.0
+                    for coef in coefficients:
+                        slope = slope * x + value  # P' se acumula con los valores previos de P
+                        value = value * x + coef
+                    values.append(value)
+                    if derivative:
+                        slopes.append(slope)
+            return _finite_list(values), _finite_list(slopes) if derivative else None
+        
+        xs = np.asarray(xs, dtype=float).ravel()
+        with np.errstate(over='ignore', invalid='ignore'):
+            if isinstance(coefficients, dict):
+                values = np.zeros_like(xs)
+                slopes = np.zeros_like(xs) if derivative else None
+                for degree, coef in pairs:
+                    values += coef * np.power(xs, degree)
+                    if derivative and degree > 0:
+                        slopes += coef * degree * np.power(xs, degree - 1)
+            else:
+                values = np.full_like(xs, coefficients[0])
+                slopes = np.zeros_like(xs) if derivative else None
+                for coef in coefficients[1:]:
+                    if derivative:
+                        slopes *= xs
+                        slopes += values
+                    values *= xs
+                    values += coef
+        
+        return _finite_list(values), _finite_list(slopes) if derivative else None
+    
+    @staticmethod
+    def sign_changes(xs: List[float], values: List[float]) -> Tuple[List[List[float]], List[float]]:
+        """
+        Busca raíces reales en una rejilla de puntos ordenada
+        
+        Returns:
+            Tupla con (intervalos [x_i, x_i+1] donde P cambia de signo,
+            puntos donde P vale exactamente 0)
+        """
+        intervals = []
+        zeros = [x for x, value in zip(xs, values) if value == 0]
+        
+        for i in range(len(values) - 1):
+            left, right = values[i], values[i + 1]
+            if left is not None and right is not None and left * right < 0:
+                intervals.append([xs[i], xs[i + 1]])
         
-        return quotient, remainder
+        return intervals, zeros
+    
+    def compact_trace(self, coefficients: List[float], root: float) -> Dict[str, List[float]]:
+        """
+        Traza compacta de la división: las tres filas finales de la tabla
+        de Ruffini, guardadas una sola vez (O(n) en memoria)
+        
+        Returns:
+            Diccionario con 'row1' (coeficientes), 'row2' (productos) y
+            'row3' (resultado; el último elemento es el resto), como
+            RuffiniResult.trace
+        """
+        return RuffiniResult('', root, self._division_table(coefficients, root), '').trace()
     
-    def format_polynomial(self, coefficients: List[float]) -> str:
+    def iter_steps(self, trace: Dict[str, List[float]], root: float) -> Iterator[Dict[str, Any]]:
+        """
+        Genera bajo demanda los pasos detallados a partir de una traza compacta
+        
+        Cada paso se construye solo cuando se consume, de modo que se pueden
+        emitir en streaming sin mantener toda la lista en memoria. Ver
+        RuffiniResult.iter_steps.
+        """
+        return RuffiniResult.from_trace(trace, root).iter_steps()
+    
+    def step_at(self, trace: Dict[str, List[float]], root: float, i: int) -> Dict[str, Any]:
+        """Construye el paso i de la traza compacta (0 = coeficientes originales)"""
+        return RuffiniResult.from_trace(trace, root).step(i)
+    
+    def format_polynomial(self, coefficients: Union[List[float], Dict[int, float]]) -> str:
         """
         Convierte lista de coeficientes a representación polinómica
+        
+        También acepta la forma dispersa grado -> coeficiente de
+        parse_polynomial_terms, sin expandirla a una lista densa.
         """
         if not coefficients:
             return "0"
         
         terms = []
-        degree = len(coefficients) - 1
         
-        for i, coef in enumerate(coefficients):
+        if isinstance(coefficients, dict):
+            pairs = sorted(coefficients.items(), reverse=True)
+        else:
+            degree = len(coefficients) - 1
+            pairs = ((degree - i, coef) for i, coef in enumerate(coefficients))
+        
+        for current_degree, coef in pairs:
             if coef == 0:
                 continue
-                
-            current_degree = degree - i
             
             # Formato del coeficiente
             if coef == 1 and current_degree > 0:
                 coef_str = ""
             elif coef == -1 and current_degree > 0:
                 coef_str = "-"
+            elif isinstance(coef, float) and coef.is_integer():
+                coef_str = str(int(coef))
+            elif isinstance(coef, Fraction) and coef.denominator != 1 and current_degree > 0:
+                # Paréntesis para que 3/2x no se lea como 3/(2x)
+                coef_str = f"-({number_str(-coef)})" if coef < 0 else f"({number_str(coef)})"
             else:
-                coef_str = str(int(coef) if coef.is_integer() else coef)
+                coef_str = number_str(coef)
             
             # Formato de la variable
             if current_degree == 0:
@@ -161,91 +691,686 @@ class RuffiniCalculator:
             return "0"
         
         # Unir términos con signos apropiados
-        result = terms[0]
+        parts = [terms[0]]
         for term in terms[1:]:
             if term.startswith('-'):
-                result += f" - {term[1:]}"
+                parts.append(f" - {term[1:]}")
             else:
-                result += f" + {term}"
+                parts.append(f" + {term}")
         
-        return result
+        return ''.join(parts)
     
-    def generate_ai_explanation(self, polynomial: str, root: float, quotient: List[float], remainder: float) -> str:
+    def generate_ai_explanation(self, polynomial: str, root: float, quotient: List[float], remainder: float,
+                                steps: Iterable[Dict[str, Any]] = None,
+                                trace: Union[Dict[str, List[float]], RuffiniResult] = None) -> str:
         """
         Genera explicación detallada del proceso usando IA
+        
+        Hay que pasar los pasos o la traza. Ver iter_explanation.
         """
-        explanation = f"""
-🤖 EXPLICACIÓN CON IA - MÉTODO DE RUFFINI
-
-📊 PROBLEMA:
-Dividir el polinomio: {polynomial}
-Entre: (x - {root})
-
-🔍 PROCESO PASO A PASO:
-
-El método de Ruffini es una forma simplificada de la división polinómica.
-Se utiliza específicamente para dividir un polinomio entre un binomio de la forma (x - a).
-
-📋 PASOS REALIZADOS:
-"""
+        return ''.join(self.iter_explanation(polynomial, root, quotient, remainder, steps, trace))
+    
+    def iter_explanation(self, polynomial: str, root: float, quotient: List[float], remainder: float,
+                         steps: Iterable[Dict[str, Any]] = None,
+                         trace: Union[Dict[str, List[float]], RuffiniResult] = None) -> Iterator[str]:
+        """
+        Genera la explicación por fragmentos, para enviarla en streaming
         
-        for i, step in enumerate(self.steps):
-            explanation += f"\n{step['step']}. {step['description']}"
-            explanation += f"\n   Fila 1: {step['row1']}"
-            explanation += f"\n   Fila 2: {step['row2']}"
-            explanation += f"\n   Resultado: {step['row3']}\n"
+        Los pasos salen de steps (cualquier iterable, por ejemplo el
+        generador de iter_steps) o, si se pasa, de la traza compacta o del
+        RuffiniResult de divide; con la traza solo se construyen los pasos
+        que se muestran. Con más de
+        EXPLANATION_MAX_STEPS pasos se muestran los EXPLANATION_EDGE_STEPS
+        primeros y últimos y las filas se abrevian, de modo que el coste no
+        crece cuadráticamente con el grado.
+        """
+        yield _EXPLANATION_HEADER.format(polynomial=polynomial, root=number_str(root))
+        
+        if trace is not None:
+            division = trace if isinstance(trace, RuffiniResult) else RuffiniResult.from_trace(trace, root)
+            count = division.size
+            shown = self._shown_steps(count)
+            selected = (division.step(i) for i in shown)
+        elif steps is not None:
+            steps = steps if isinstance(steps, list) else list(steps)
+            count = len(steps)
+            shown = self._shown_steps(count)
+            selected = (steps[i] for i in shown)
+        else:
+            raise ValueError("Se requieren los pasos o la traza de la división")
+        
+        abbreviate = count > EXPLANATION_MAX_STEPS
+        previous = -1
+        
+        for i, step in zip(shown, selected):
+            if i > previous + 1:
+                yield _EXPLANATION_OMITTED.format(count=i - previous - 1)
+            previous = i
+            
+            yield _EXPLANATION_STEP.format(
+                step=step['step'],
+                description=step['description'],
+                row1=self._format_row(step['row1'], abbreviate, i),
+                row2=self._format_row(step['row2'], abbreviate, i),
+                row3=self._format_row(step['row3'], abbreviate, i)
+            )
         
         quotient_poly = self.format_polynomial(quotient)
+        yield _EXPLANATION_FOOTER.format(quotient=quotient_poly, remainder=number_str(remainder), root=number_str(root))
         
-        explanation += f"""
-✅ RESULTADO FINAL:
-• Cociente: {quotient_poly}
-• Resto: {remainder}
-
-🎯 VERIFICACIÓN:
-El resultado se puede verificar con: ({quotient_poly}) × (x - {root}) + {remainder}
-
-💡 INTERPRETACIÓN:
-"""
+        template = _EXPLANATION_FACTOR if remainder == 0 else _EXPLANATION_NOT_FACTOR
+        yield template.format(root=number_str(root), remainder=number_str(remainder))
+    
+    @staticmethod
+    def _shown_steps(count: int) -> List[int]:
+        """Índices de los pasos que aparecen en la explicación"""
+        if count <= EXPLANATION_MAX_STEPS:
+            return list(range(count))
+        return list(range(EXPLANATION_EDGE_STEPS)) + list(range(count - EXPLANATION_EDGE_STEPS, count))
+    
+    @staticmethod
+    def _format_row(row: List[float], abbreviate: bool, column: int = 0) -> str:
+        """
+        Fila de la tabla como lista; si abbreviate, solo sus extremos y
+        la columna que se está calculando (con sus vecinas)
+        """
+        n = len(row)
+        if not abbreviate or n <= EXPLANATION_ROW_ITEMS:
+            # str de cada valor: en modo exacto, 1/2 en lugar de Fraction(1, 2)
+            return f"[{', '.join(number_str(value) for value in row)}]"
         
-        if remainder == 0:
-            explanation += f"Como el resto es 0, (x - {root}) es un factor del polinomio original."
+        edge = EXPLANATION_ROW_ITEMS // 2
+        shown = sorted({*range(edge), *range(max(column - 1, 0), min(column + 2, n)), *range(n - edge, n)})
+        parts = []
+        for k, i in enumerate(shown):
+            if k and i > shown[k - 1] + 1:
+                parts.append('…')
+            parts.append(number_str(row[i]))
+        return f"[{', '.join(parts)}] ({n} valores)"
+    
+    def calculate(self, polynomial_str: str, root: float,
+                  include_steps: Union[bool, str] = True, include_explanation: bool = True,
+                  exact: bool = False, verify: bool = False) -> Dict[str, Any]:
+        """
+        Función principal que realiza el cálculo completo
+        
+        No modifica el estado de la instancia, por lo que una misma
+        calculadora puede compartirse entre hilos. Ver calculate_coefficients
+        para las opciones include_steps, include_explanation, exact y verify.
+        """
+        try:
+            # Parsear el polinomio (forma dispersa; se expande solo si hace falta)
+            start = time.perf_counter()
+            coefficients = self.parse_polynomial_terms(polynomial_str, exact)
+            self._lap('parse', start)
+            
+            return self.calculate_coefficients(polynomial_str, coefficients, root,
+                                               include_steps=include_steps,
+                                               include_explanation=include_explanation,
+                                               exact=exact, verify=verify)
+            
+        except PolynomialParseError as e:
+            return {
+                'success': False,
+                'error': str(e),
+                'error_position': e.position,
+                'ai_help': self.generate_error_help(str(e))
+            }
+        except Exception as e:
+            return {
+                'success': False,
+                'error': str(e),
+                'ai_help': self.generate_error_help(str(e))
+            }
+    
+    def calculate_coefficients(self, polynomial_str: str, coefficients: Union[List[float], Dict[int, float]], root: float,
+                               include_steps: Union[bool, str] = True, include_explanation: bool = True,
+                               exact: bool = False, verify: bool = False) -> Dict[str, Any]:
+        """
+        Realiza el cálculo a partir de coeficientes ya parseados
+        
+        Permite reutilizar un mismo polinomio parseado con varias raíces
+        (por ejemplo, en el endpoint de lotes) y omitir los pasos o la
+        explicación cuando no se necesitan.
+        
+        Args:
+            coefficients: Lista densa de coeficientes o forma dispersa
+                grado -> coeficiente. Un polinomio disperso sin pasos ni
+                explicación se divide sin expandirlo y el resultado lleva
+                'terms' y 'quotient_terms' (pares [grado, coeficiente]) en
+                lugar de 'coefficients' y 'quotient_coefficients'
+            include_steps: True para los pasos completos ('steps'), 'compact'
+                para la traza compacta ('trace') o False para no registrar
+                pasos
+            include_explanation: Si se genera 'ai_explanation'
+            exact: Aritmética exacta. Coeficientes y raíz se convierten con
+                to_exact; si todos son enteros el cálculo se hace con int
+                (camino rápido) y si no, con Fraction. El resto es exacto,
+                por lo que la comprobación de factor (resto == 0) es fiable
+            verify: Si se añade 'verification', la comprobación de que
+                (cociente) × (x - root) + resto reproduce el polinomio
+                (ver verification). Con verify el polinomio se expande
+                aunque sea disperso, para poder comprobarlo
+        """
+        if isinstance(coefficients, dict):
+            if not include_steps and not include_explanation and not verify and self.is_sparse(coefficients):
+                if exact:
+                    root = self.to_exact(root)
+                    coefficients = {degree: self.to_exact(coef) for degree, coef in coefficients.items()}
+                result = self._calculate_sparse(polynomial_str, coefficients, root)
+                if exact:
+                    result['exact'] = True
+                return result
+        
+        division = self.divide(polynomial_str, coefficients, root, exact=exact)
+        return self.render(division, polynomial_str, include_steps, include_explanation, verify)
+    
+    def divide(self, polynomial_str: str, coefficients: Union[List[float], Dict[int, float]], root: float,
+               exact: bool = False) -> RuffiniResult:
+        """
+        División de Ruffini con resultado compacto, para uso como biblioteca
+        
+        Calcula la fila de resultados en una sola pasada sobre un búfer que
+        comparte con los coeficientes (ver RuffiniResult); no construye
+        listas intermedias ni pasos. calculate_coefficients lo usa y
+        render convierte el resultado a diccionario.
+        
+        Args:
+            coefficients: Lista densa de coeficientes o forma dispersa grado -> coeficiente
+            exact: Aritmética exacta (ver calculate_coefficients)
+        """
+        if isinstance(coefficients, dict):
+            coefficients = self.expand_terms(coefficients)
+        
+        if exact:
+            root = self.to_exact(root)
+            coefficients = [self.to_exact(coef) for coef in coefficients]
+        
+        start = time.perf_counter()
+        table = self._division_table(coefficients, root)
+        start = self._lap('divide', start)
+        
+        n = len(coefficients)
+        if isinstance(table, array):
+            quotient = self.format_polynomial(memoryview(table)[n:-1].tolist())
         else:
-            explanation += f"Como el resto es {remainder} ≠ 0, (x - {root}) no es un factor exacto del polinomio."
+            quotient = self.format_polynomial(table[n:-1])
+        self._lap('format', start)
         
-        return explanation
+        return RuffiniResult(polynomial_str, root, table, quotient, exact)
     
-    def calculate(self, polynomial_str: str, root: float) -> Dict[str, Any]:
+    def _division_table(self, coefficients: List[float], root: float) -> Union[array, List[Any]]:
         """
-        Función principal que realiza el cálculo completo
+        Búfer de RuffiniResult: los coeficientes seguidos de la fila de
+        resultados (cociente y resto), calculada en una sola pasada
+        """
+        if isinstance(root, Fraction) and all(type(coef) is int for coef in coefficients):
+            # Camino rápido exacto con enteros escalados
+            quotient, remainder = self._rational_synthetic_division(coefficients, root)
+            return list(coefficients) + [coefficients[0]] + quotient[1:] + [remainder]
+        
+        if all(type(coef) is float for coef in coefficients):
+            table = array('d', coefficients)
+        else:
+            table = list(coefficients)
+        
+        value = coefficients[0]  # El primer coeficiente se copia
+        table.append(value)
+        for coef in coefficients[1:]:
+            value = coef + value * root
+            table.append(value)
+        return table
+    
+    def render(self, division: RuffiniResult, polynomial_str: str, include_steps: Union[bool, str] = True,
+               include_explanation: bool = True, verify: bool = False) -> Dict[str, Any]:
+        """
+        Convierte el resultado de divide en el diccionario de calculate_coefficients
+        
+        Con pasos completos es O(n²), así que el servidor lo ejecuta en el
+        pool de procesos igual que la división.
+        
+        Args:
+            polynomial_str: Cadena a mostrar (la de la petición si el
+                resultado viene de caché)
+        """
+        start = time.perf_counter()
+        result = division.to_dict(include_steps, polynomial=polynomial_str)
+        if include_steps and include_steps != 'compact':
+            self._lap('steps', start)
+        
+        if verify:
+            start = time.perf_counter()
+            result['verification'] = self.verification(
+                result['coefficients'], [1, -division.root],
+                result['quotient_coefficients'], [division.remainder]
+            )
+            self._lap('verify', start)
+        
+        if include_explanation:
+            start = time.perf_counter()
+            result['ai_explanation'] = self.generate_ai_explanation(
+                polynomial_str, division.root, result['quotient_coefficients'], division.remainder,
+                trace=division
+            )
+            self._lap('explain', start)
+        
+        return result
+    
+    def calculate_many(self, polynomial_str: str, coefficients: Union[List[float], Dict[int, float]],
+                       roots: List[float]) -> List[Dict[str, Any]]:
+        """
+        Divide un mismo polinomio entre (x - r) para cada raíz, sin pasos ni explicación
+        
+        Con NumPy hace todas las divisiones a la vez con ruffini_division_many;
+        sin NumPy, una synthetic_division por raíz. Las operaciones en coma
+        flotante son las mismas en ambos casos, así que cada resultado
+        coincide con el de calculate_coefficients(..., include_steps=False,
+        include_explanation=False) sobre los coeficientes densos.
+        
+        Args:
+            coefficients: Lista densa de coeficientes o forma dispersa (se expande)
+            roots: Raíces como float
+        """
+        if isinstance(coefficients, dict):
+            coefficients = self.expand_terms(coefficients)
+        coefficients = [float(coef) for coef in coefficients]
+        
+        start = time.perf_counter()
+        if np is not None:
+            quotients, remainders = self.ruffini_division_many(coefficients, roots)
+            quotients, remainders = quotients.tolist(), remainders.tolist()
+        else:
+            divisions = [self.synthetic_division(coefficients, root) for root in roots]
+            quotients = [quotient for quotient, _ in divisions]
+            remainders = [remainder for _, remainder in divisions]
+        start = self._lap('divide', start)
+        
+        results = [
+            {
+                'success': True,
+                'polynomial': polynomial_str,
+                'root': root,
+                'coefficients': coefficients,
+                'quotient_coefficients': quotient,
+                'quotient': self.format_polynomial(quotient),
+                'remainder': remainder
+            }
+            for root, quotient, remainder in zip(roots, quotients, remainders)
+        ]
+        self._lap('format', start)
+        
+        return results
+    
+    def calculate_divisor(self, polynomial_str: str, coefficients: Union[List[float], Dict[int, float]],
+                          divisor: Union[List[float], Dict[int, float]], include_steps: bool = True,
+                          exact: bool = False, verify: bool = False) -> Dict[str, Any]:
+        """
+        Divide un polinomio entre un divisor cualquiera (ver expanded_synthetic_division)
+        
+        Args:
+            coefficients: Dividendo como lista densa o forma dispersa
+            divisor: Divisor como lista densa o forma dispersa, por ejemplo
+                el resultado de parse_polynomial_terms("2x - 3")
+            include_steps: Si se incluyen los pasos ('steps')
+            exact: Aritmética exacta con int y Fraction (ver to_exact)
+            verify: Si se añade 'verification' (ver verification)
+        """
+        if isinstance(coefficients, dict):
+            coefficients = self.expand_terms(coefficients)
+        if isinstance(divisor, dict):
+            divisor = self.expand_terms(divisor)
+        
+        if exact:
+            coefficients = [self.to_exact(coef) for coef in coefficients]
+            divisor = [self.to_exact(coef) for coef in divisor]
+        
+        start = time.perf_counter()
+        quotient, remainder, steps = self.expanded_synthetic_division(coefficients, divisor, bool(include_steps))
+        start = self._lap('divide', start)
+        
+        result = {
+            'success': True,
+            'polynomial': polynomial_str,
+            'divisor': self.format_polynomial(divisor),
+            'coefficients': coefficients,
+            'divisor_coefficients': divisor,
+            'quotient_coefficients': quotient,
+            'quotient': self.format_polynomial(quotient),
+            'remainder_coefficients': remainder,
+            'remainder_polynomial': self.format_polynomial(remainder),
+            'is_factor': all(coef == 0 for coef in remainder)
+        }
+        start = self._lap('format', start)
+        
+        if verify:
+            result['verification'] = self.verification(coefficients, divisor, quotient, remainder)
+            self._lap('verify', start)
+        
+        if exact:
+            result['exact'] = True
+        if include_steps:
+            result['steps'] = steps
+        
+        return result
+    
+    def deflate(self, coefficients: List[float], roots: Iterable[float]) -> List[Dict[str, Any]]:
+        """
+        Divide sucesivamente entre (x - r) para cada raíz de la secuencia
+        
+        Trabaja sobre los vectores de coeficientes con synthetic_division, sin
+        formatear ni volver a parsear el cociente entre una división y la
+        siguiente. Para dividir entre (x - a)^k basta repetir a k veces.
+        
+        Returns:
+            Una etapa por raíz: {'root', 'quotient_coefficients', 'remainder'},
+            donde cada cociente es el dividendo de la etapa siguiente
+        """
+        stages = []
+        current = list(coefficients)
+        
+        for root in roots:
+            if len(current) < 2:
+                raise ValueError("El cociente ya es constante: hay más raíces que el grado del polinomio")
+            current, remainder = self.synthetic_division(current, root)
+            stages.append({
+                'root': root,
+                'quotient_coefficients': current,
+                'remainder': remainder
+            })
+        
+        return stages
+    
+    def taylor_shift(self, coefficients: List[float], root: float) -> List[float]:
+        """
+        Coeficientes de Taylor de P en a: P(x) = Σ c_k (x - a)^k
+        
+        Son los restos de dividir entre (x - a) una y otra vez (esquema de
+        Horner completo, O(n²)). c_k = P^(k)(a) / k!; el número de ceros
+        iniciales es la multiplicidad de a como raíz.
+        
+        Returns:
+            Lista [c_0, c_1, ..., c_n] de menor a mayor potencia de (x - a)
+        """
+        shifted = []
+        current = list(coefficients)
+        
+        while current:
+            current, remainder = self.synthetic_division(current, root)
+            shifted.append(remainder)
+        
+        return shifted
+    
+    def deflate_polynomial(self, polynomial_str: str, roots: List[float], exact: bool = False,
+                           taylor: bool = False) -> Dict[str, Any]:
+        """
+        Deflación de un polinomio por una secuencia de raíces (ver deflate)
+        
+        Parsea el polinomio una sola vez y devuelve cada cociente intermedio
+        con su resto. Con taylor=True añade los coeficientes de Taylor en la
+        primera raíz y la multiplicidad de esa raíz.
         """
         try:
-            # Parsear el polinomio
-            coefficients = self.parse_polynomial(polynomial_str)
+            coefficients = self.parse_polynomial(polynomial_str, exact)
             
-            # Realizar división de Ruffini
-            quotient, remainder = self.ruffini_division(coefficients, root)
+            if exact:
+                roots = [self.to_exact(root) for root in roots]
+                coefficients = [self.to_exact(coef) for coef in coefficients]
             
-            # Formatear resultado
-            quotient_str = self.format_polynomial(quotient)
+            if not roots:
+                raise ValueError("Se requiere al menos una raíz")
             
-            # Generar explicación con IA
-            explanation = self.generate_ai_explanation(
-                polynomial_str, root, quotient, remainder
-            )
+            stages = self.deflate(coefficients, roots)
+            for stage in stages:
+                stage['quotient'] = self.format_polynomial(stage['quotient_coefficients'])
+                stage['is_factor'] = stage['remainder'] == 0
+            
+            result = {
+                'success': True,
+                'polynomial': polynomial_str,
+                'coefficients': coefficients,
+                'stages': stages,
+                'quotient': stages[-1]['quotient'],
+                'all_factors': all(stage['is_factor'] for stage in stages)
+            }
+            
+            if exact:
+                result['exact'] = True
+            
+            if taylor:
+                shifted = self.taylor_shift(coefficients, roots[0])
+                multiplicity = 0
+                while multiplicity < len(shifted) - 1 and shifted[multiplicity] == 0:
+                    multiplicity += 1
+                result['taylor_coefficients'] = shifted
+                result['multiplicity'] = multiplicity
+            
+            return result
+            
+        except PolynomialParseError as e:
+            return {
+                'success': False,
+                'error': str(e),
+                'error_position': e.position,
+                'ai_help': self.generate_error_help(str(e))
+            }
+        except Exception as e:
+            return {
+                'success': False,
+                'error': str(e),
+                'ai_help': self.generate_error_help(str(e))
+            }
+    
+    def verification(self, dividend: List[float], divisor: List[float], quotient: List[float],
+                     remainder: List[float]) -> Dict[str, Any]:
+        """
+        Comprueba en el servidor que (cociente) × (divisor) + resto = dividendo
+        
+        Multiplica con polynomial_arithmetic (O(n) para un divisor lineal).
+        En modo exacto la igualdad es exacta; con float se tolera un error
+        relativo de 1e-9 respecto al mayor coeficiente.
+        
+        Returns:
+            Diccionario con 'verified' y 'max_error' (mayor diferencia entre
+            coeficientes)
+        """
+        verified, max_error = verify_division(dividend, divisor, quotient, remainder)
+        return {'verified': verified, 'max_error': max_error}
+    
+    def _calculate_sparse(self, polynomial_str: str, terms: Dict[int, float], root: float) -> Dict[str, Any]:
+        """Cálculo sin pasos para polinomios dispersos (ver calculate_coefficients)"""
+        start = time.perf_counter()
+        quotient, remainder = self.ruffini_division_sparse(terms, root)
+        start = self._lap('divide', start)
+        quotient_str = self.format_polynomial(quotient)
+        self._lap('format', start)
+        
+        return {
+            'success': True,
+            'polynomial': polynomial_str,
+            'root': root,
+            'degree': max(terms),
+            'terms': [[degree, coef] for degree, coef in sorted(terms.items(), reverse=True)],
+            'quotient_terms': [[degree, coef] for degree, coef in sorted(quotient.items(), reverse=True)],
+            'quotient': quotient_str,
+            'remainder': remainder
+        }
+    
+    def factor(self, polynomial_str: str) -> Dict[str, Any]:
+        """
+        Factoriza un polinomio buscando todas sus raíces racionales
+        
+        Usa el teorema de la raíz racional sobre los coeficientes exactos
+        (ver rational_roots.find_rational_roots) y deflación sucesiva por
+        Ruffini, informando la multiplicidad de cada raíz. Lo que no se
+        puede factorizar con raíces racionales queda en 'remaining_factor'.
+        """
+        try:
+            coefficients = self.parse_polynomial(polynomial_str, exact=True)
+            
+            # Quitar ceros iniciales (por ejemplo, '0x^3 + x')
+            while len(coefficients) > 1 and coefficients[0] == 0:
+                coefficients = coefficients[1:]
+            
+            if coefficients == [0]:
+                raise ValueError("El polinomio nulo no se puede factorizar")
+            
+            # Pasar a coeficientes enteros primitivos con coeficiente principal positivo
+            scale = 1
+            for coef in coefficients:
+                denominator = Fraction(coef).denominator
+                scale = scale * denominator // math.gcd(scale, denominator)
+            integer_coefficients = [int(coef * scale) for coef in coefficients]
+            content = reduce(math.gcd, integer_coefficients)
+            if integer_coefficients[0] < 0:
+                content = -content
+            integer_coefficients = [coef // content for coef in integer_coefficients]
+            
+            roots, remaining, tested = find_rational_roots(integer_coefficients)
+            
+            # P(x) = constante · Π(qx - p)^m · resto
+            constant = self.to_exact(Fraction(content, scale))
+            if len(remaining) == 1:
+                constant = self.to_exact(constant * remaining[0])
+                remaining = [1]
+            
+            root_info = []
+            factors = []
+            for root, multiplicity in roots:
+                binomial = self.format_polynomial([root.denominator, -root.numerator])
+                factor_str = binomial if root == 0 else f"({binomial})"
+                if multiplicity > 1:
+                    factor_str += f"^{multiplicity}"
+                factors.append(factor_str)
+                root_info.append({
+                    'root': self.to_exact(root),
+                    'value': float(root),
+                    'multiplicity': multiplicity,
+                    'factor': factor_str
+                })
+            
+            remaining_str = self.format_polynomial(remaining)
+            if len(remaining) > 1:
+                factors.append(f"({remaining_str})")
+            
+            if constant == 1 and factors:
+                prefix = ""
+            elif constant == -1 and factors:
+                prefix = "-"
+            elif isinstance(constant, Fraction) and factors:
+                prefix = f"({number_str(constant)})"
+            else:
+                prefix = number_str(constant)
             
             return {
                 'success': True,
                 'polynomial': polynomial_str,
-                'root': root,
+                'degree': len(coefficients) - 1,
                 'coefficients': coefficients,
-                'quotient_coefficients': quotient,
-                'quotient': quotient_str,
-                'remainder': remainder,
-                'steps': self.steps,
-                'ai_explanation': explanation
+                'roots': root_info,
+                'leading_constant': constant,
+                'remaining_coefficients': remaining,
+                'remaining_factor': remaining_str,
+                'fully_factored': len(remaining) == 1,
+                'factorization': prefix + "".join(factors),
+                'candidates_tested': tested
+            }
+            
+        except PolynomialParseError as e:
+            return {
+                'success': False,
+                'error': str(e),
+                'error_position': e.position,
+                'ai_help': self.generate_error_help(str(e))
+            }
+        except Exception as e:
+            return {
+                'success': False,
+                'error': str(e),
+                'ai_help': self.generate_error_help(str(e))
             }
+    
+    def find_roots(self, polynomial_str: str, method: str = 'aberth') -> Dict[str, Any]:
+        """
+        Calcula numéricamente todas las raíces (reales y complejas) de un polinomio
+        
+        Las aproxima con Aberth-Ehrlich (o con la matriz compañera si
+        method='companion' y NumPy está instalado) y refina cada una con
+        Newton usando synthetic_division para evaluar P y P'. Las raíces
+        reales que redondeadas a una fracción sencilla dan resto 0 en la
+        división exacta se devuelven en 'rational_roots', listas para usarse
+        como raíz en calculate. Las raíces múltiples llegan como grupos de
+        aproximaciones cercanas, y la tolerancia para darlas por reales
+        crece con el tamaño del grupo (ver ROOT_CLUSTER_RADIUS).
+        """
+        try:
+            if method not in ('aberth', 'companion'):
+                raise ValueError("Método desconocido: usa 'aberth' o 'companion'")
+            
+            exact_coefficients = self.parse_polynomial(polynomial_str, exact=True)
+            
+            # Quitar ceros iniciales (por ejemplo, '0x^3 + x')
+            while len(exact_coefficients) > 1 and exact_coefficients[0] == 0:
+                exact_coefficients = exact_coefficients[1:]
+            
+            if exact_coefficients == [0]:
+                raise ValueError("El polinomio nulo no tiene raíces aisladas")
+            if len(exact_coefficients) == 1:
+                raise ValueError("Un polinomio constante no tiene raíces")
+            
+            # Los ceros finales son raíces x = 0 exactas
+            zero_roots = 0
+            while exact_coefficients[-1 - zero_roots] == 0:
+                zero_roots += 1
+            reduced = exact_coefficients[:len(exact_coefficients) - zero_roots]
+            coefficients = [float(coef) for coef in reduced]
+            
+            if method == 'companion':
+                approximations, iterations = companion_roots(coefficients), 0
+            else:
+                approximations, iterations = aberth_roots(coefficients)
+            
+            roots = [(0j, 0.0)] * zero_roots
+            for z in approximations:
+                roots.append(newton_polish(coefficients, complex(z), self.synthetic_division))
+            
+            root_info = []
+            real_roots = []
+            rational_roots = set()
+            for z, residual in sorted(roots, key=lambda item: (item[0].real, item[0].imag)):
+                scale = max(abs(z), 1.0)
+                cluster = sum(1 for w, _ in roots if abs(w - z) <= ROOT_CLUSTER_RADIUS * scale)
+                is_real = abs(z.imag) <= REAL_ROOT_TOLERANCE ** (1 / cluster) * scale
+                if is_real:
+                    z = complex(z.real, 0.0)
+                    real_roots.append(z.real)
+                    candidate = Fraction(z.real).limit_denominator(RATIONAL_ROOT_MAX_DENOMINATOR)
+                    if candidate not in rational_roots and self.synthetic_division(exact_coefficients, candidate)[1] == 0:
+                        rational_roots.add(candidate)
+                root_info.append({
+                    'real': z.real,
+                    'imag': z.imag,
+                    'is_real': is_real,
+                    'residual': residual
+                })
             
+            return {
+                'success': True,
+                'polynomial': polynomial_str,
+                'degree': len(exact_coefficients) - 1,
+                'method': method,
+                'iterations': iterations,
+                'roots': root_info,
+                'real_roots': real_roots,
+                'rational_roots': [self.to_exact(root) for root in sorted(rational_roots)]
+            }
+            
+        except PolynomialParseError as e:
+            return {
+                'success': False,
+                'error': str(e),
+                'error_position': e.position,
+                'ai_help': self.generate_error_help(str(e))
+            }
         except Exception as e:
             return {
                 'success': False,
@@ -281,7 +1406,18 @@ El resultado se puede verificar con: ({quotient_poly}) × (x - {root}) + {remain
 def main():
     """
     Función principal para uso desde línea de comandos
+    
+    Sin argumentos abre el modo interactivo; con argumentos procesa
+    trabajos en bloque (ver bulk_processor.py), por ejemplo:
+    python src/ruffini_calculator.py trabajos.ndjson --workers 4
     """
+    if len(sys.argv) > 1:
+        try:
+            from src.bulk_processor import main as bulk_main
+        except ImportError:  # Ejecución directa: python src/ruffini_calculator.py
+            from bulk_processor import main as bulk_main
+        sys.exit(bulk_main(sys.argv[1:]))
+    
     print("🧮 Calculadora de Ruffini con IA")
     print("=" * 40)
     
@@ -0,0 +1,193 @@
+"""
+Resultado compacto de una división de Ruffini
+Guarda los coeficientes y la fila de resultados en un único búfer y expone vistas sobre él
+"""
+
+from array import array
+from decimal import Decimal
+from fractions import Fraction
+from typing import Any, Dict, Iterator, List, Sequence, Union
+
+# Descripción de cada paso de la tabla
+STEP_DESCRIPTION = 'Paso {i}: Multiplicar {previous} × {root} = {product}, luego sumar {coef} + {product} = {value}'
+
+
+def number_str(value: Any) -> str:
+    """
+    str de un número, también para los int del modo exacto con más cifras
+    de las que str admite (sys.get_int_max_str_digits), que se convierten
+    a través de Decimal
+    """
+    try:
+        return str(value)
+    except ValueError:
+        if isinstance(value, Fraction):
+            return f'{number_str(value.numerator)}/{number_str(value.denominator)}'
+        if isinstance(value, int):
+            return str(Decimal(value))
+        raise
+
+
+def _as_list(values: Sequence[Any]) -> List[Any]:
+    """Copia una vista (memoryview) o lista a una lista de Python"""
+    return values.tolist() if isinstance(values, memoryview) else list(values)
+
+
+class RuffiniResult:
+    """
+    Resultado de dividir un polinomio entre (x - root)
+
+    El búfer guarda la fila 1 (coeficientes) seguida de la fila 3 de la
+    tabla (cociente y resto): 2n valores en total. Con coeficientes float
+    es un array('d') y coefficients, quotient_coefficients y las filas de
+    los pasos son memoryview sobre él, sin copias. En modo exacto (int o
+    Fraction) es una lista y las vistas son copias.
+
+    La fila 2 (productos) no se guarda: products[i] = row3[i-1] · root se
+    recalcula con la misma operación, así que coincide exactamente.
+
+    Para la API HTTP, to_dict produce el diccionario JSON de siempre.
+    """
+
+    __slots__ = ('polynomial', 'root', 'quotient', 'exact', '_table')
+
+    def __init__(self, polynomial: str, root: Any, table: Union[array, List[Any]],
+                 quotient: str, exact: bool = False):
+        self.polynomial = polynomial
+        self.root = root
+        self.quotient = quotient
+        self.exact = exact
+        self._table = table
+
+    @classmethod
+    def from_trace(cls, trace: Dict[str, Sequence[Any]], root: Any, polynomial: str = '',
+                   quotient: str = '') -> 'RuffiniResult':
+        """Resultado a partir de una traza compacta (ver trace); la fila 2 no se usa"""
+        return cls(polynomial, root, list(trace['row1']) + list(trace['row3']), quotient)
+
+    def __repr__(self) -> str:
+        return f'RuffiniResult({self.polynomial!r}, root={self.root!r}, remainder={self.remainder!r})'
+
+    def _view(self, start: int, stop: int) -> Sequence[Any]:
+        if isinstance(self._table, array):
+            return memoryview(self._table)[start:stop]
+        return self._table[start:stop]
+
+    @property
+    def size(self) -> int:
+        """Número de coeficientes (grado + 1)"""
+        return len(self._table) // 2
+
+    @property
+    def degree(self) -> int:
+        return self.size - 1
+
+    @property
+    def coefficients(self) -> Sequence[Any]:
+        """Fila 1: coeficientes del polinomio"""
+        return self._view(0, self.size)
+
+    @property
+    def row3(self) -> Sequence[Any]:
+        """Fila 3: coeficientes del cociente seguidos del resto"""
+        return self._view(self.size, len(self._table))
+
+    @property
+    def quotient_coefficients(self) -> Sequence[Any]:
+        return self._view(self.size, len(self._table) - 1)
+
+    @property
+    def remainder(self) -> Any:
+        return self._table[-1]
+
+    @property
+    def is_factor(self) -> bool:
+        """Si (x - root) divide exactamente al polinomio"""
+        return self.remainder == 0
+
+    def products(self) -> List[Any]:
+        """Fila 2: productos de cada paso (0 en la primera columna)"""
+        row3 = self.row3
+        root = self.root
+        return [0] + [row3[i - 1] * root for i in range(1, self.size)]
+
+    def trace(self) -> Dict[str, List[Any]]:
+        """
+        Traza compacta como listas: 'row1' (coeficientes), 'row2'
+        (productos) y 'row3' (resultado; el último elemento es el resto)
+        """
+        return {
+            'row1': _as_list(self.coefficients),
+            'row2': self.products(),
+            'row3': _as_list(self.row3)
+        }
+
+    def step(self, i: int) -> Dict[str, Any]:
+        """
+        Paso i de la tabla (0 = coeficientes originales)
+
+        'row1' y 'row3' son vistas sobre el búfer del resultado.
+        """
+        n = self.size
+        row1 = self.coefficients
+        row3 = self.row3
+        row2 = [0] * n
+
+        if i == 0:
+            return {
+                'step': 0,
+                'description': 'Coeficientes del polinomio original',
+                'row1': row1,
+                'row2': row2,
+                'row3': row3[:1]
+            }
+
+        product = row3[i - 1] * self.root
+        row2[i] = product
+
+        return {
+            'step': i,
+            'description': STEP_DESCRIPTION.format(i=i, previous=number_str(row3[i - 1]),
+                                                   root=number_str(self.root), product=number_str(product),
+                                                   coef=number_str(row1[i]), value=number_str(row3[i])),
+            'row1': row1,
+            'row2': row2,
+            'row3': row3[:i + 1]
+        }
+
+    def iter_steps(self) -> Iterator[Dict[str, Any]]:
+        """Genera los pasos bajo demanda (ver step)"""
+        for i in range(self.size):
+            yield self.step(i)
+
+    def to_dict(self, include_steps: Union[bool, str] = False, polynomial: str = None) -> Dict[str, Any]:
+        """
+        Diccionario serializable a JSON con las claves de calculate_coefficients
+
+        Args:
+            include_steps: True para 'steps', 'compact' para 'trace'
+            polynomial: Cadena a mostrar en lugar de la original (por
+                ejemplo, la de la petición cuando el resultado viene de caché)
+        """
+        result = {
+            'success': True,
+            'polynomial': self.polynomial if polynomial is None else polynomial,
+            'root': self.root,
+            'coefficients': _as_list(self.coefficients),
+            'quotient_coefficients': _as_list(self.quotient_coefficients),
+            'quotient': self.quotient,
+            'remainder': self.remainder
+        }
+
+        if self.exact:
+            result['exact'] = True
+
+        if include_steps == 'compact':
+            result['trace'] = self.trace()
+        elif include_steps:
+            result['steps'] = [
+                dict(step, row1=_as_list(step['row1']), row3=_as_list(step['row3']))
+                for step in self.iter_steps()
+            ]
+
+        return result
@@ -0,0 +1,67 @@
+"""
+Agrupación de cálculos idénticos en curso (single-flight)
+Las peticiones concurrentes con la misma clave esperan a un único cálculo y comparten su resultado
+"""
+
+import threading
+from typing import Any, Callable, Dict, Hashable
+
+
+class _Call:
+    """Cálculo en curso: los que esperan se bloquean en done hasta que termina"""
+
+    __slots__ = ('done', 'value', 'error')
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.value = None
+        self.error = None
+
+
+class SingleFlight:
+    """
+    Deduplica llamadas concurrentes por clave
+
+    La primera llamada con una clave ejecuta la función; las que llegan
+    mientras tanto con la misma clave esperan y reciben el mismo valor (o
+    la misma excepción). En cuanto termina, la clave se olvida: no es una
+    caché, así que nunca devuelve resultados antiguos.
+    """
+
+    def __init__(self):
+        self._calls: Dict[Hashable, _Call] = {}
+        self._lock = threading.Lock()
+        self.shared = 0
+
+    def do(self, key: Hashable, func: Callable[[], Any]) -> Any:
+        """Ejecuta func() o espera al cálculo en curso con la misma clave"""
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = _Call()
+
+        if not leader:
+            call.done.wait()
+            with self._lock:
+                self.shared += 1
+            if call.error is not None:
+                raise call.error
+            return call.value
+
+        try:
+            call.value = func()
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+
+        return call.value
+
+    @property
+    def in_flight(self) -> int:
+        """Claves con un cálculo en curso"""
+        return len(self._calls)
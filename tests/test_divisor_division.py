@@ -0,0 +1,72 @@
+"""
+Pruebas de la división sintética expandida entre divisores cualesquiera
+"""
+
+from fractions import Fraction
+
+import pytest
+
+from src.ruffini_calculator import RuffiniCalculator
+
+
+@pytest.fixture
+def calculator():
+    return RuffiniCalculator()
+
+
+@pytest.mark.parametrize('dividend, divisor, quotient, remainder', [
+    # x^4 + 1 = (x^2 + 1)(x^2 - 1) + 2
+    ([1, 0, 0, 0, 1], [1, 0, 1], [1, 0, -1], [0, 2]),
+    # 2x^2 - 3x + 1 = (2x - 1)(x - 1)
+    ([2, -3, 1], [2, -1], [1, -1], [0]),
+    # 6x^2 - 5x + 1 = (3x - 1)(2x - 1)
+    ([6, -5, 1], [3, -1], [2, -1], [0]),
+    # Divisor lineal mónico: igual que Ruffini con raíz 2
+    ([1, 2, -5, 6], [1, -2], [1, 4, 3], [12]),
+    # Ceros iniciales del divisor
+    ([1, 0, -1], [0, 1, -1], [1, 1], [0]),
+])
+def test_expanded_synthetic_division(calculator, dividend, divisor, quotient, remainder):
+    assert calculator.expanded_synthetic_division(dividend, divisor) == (quotient, remainder, None)
+
+
+def test_dividend_of_lower_degree(calculator):
+    quotient, remainder, _ = calculator.expanded_synthetic_division([1.0, 2.0], [1.0, 0.0, 1.0])
+    assert quotient == [0.0] and str(quotient[0]) == '0.0'
+    assert remainder == [1.0, 2.0]
+
+
+def test_zero_divisor_is_rejected(calculator):
+    with pytest.raises(ValueError):
+        calculator.expanded_synthetic_division([1, 2], [0, 0])
+
+
+def test_steps_record_each_quotient_coefficient(calculator):
+    _, _, steps = calculator.expanded_synthetic_division([1, 0, 0, 0, 1], [1, 0, 1], record_steps=True)
+    assert [step['quotient_coefficient'] for step in steps] == [1, 0, -1]
+    assert [step['position'] for step in steps] == [0, 1, 2]
+    assert steps[0]['products'] == [0, 1]
+
+
+def test_calculate_divisor_exact(calculator):
+    terms = calculator.parse_polynomial_terms('x^3 - 1', exact=True)
+    divisor = calculator.parse_polynomial_terms('2x - 1', exact=True)
+    result = calculator.calculate_divisor('x^3 - 1', terms, divisor, include_steps=False, exact=True, verify=True)
+
+    assert result['quotient_coefficients'] == [Fraction(1, 2), Fraction(1, 4), Fraction(1, 8)]
+    assert result['quotient'] == '(1/2)x^2 + (1/4)x + 1/8'
+    assert result['remainder_coefficients'] == [Fraction(-7, 8)]
+    assert result['remainder_polynomial'] == '-7/8'
+    assert 'remainder' not in result
+    assert result['is_factor'] is False
+    assert result['verification']['verified'] is True
+
+
+def test_calculate_divisor_detects_factors(calculator):
+    terms = calculator.parse_polynomial_terms('x^4 - 1')
+    divisor = calculator.parse_polynomial_terms('x^2 + 1')
+    result = calculator.calculate_divisor('x^4 - 1', terms, divisor, include_steps=True)
+
+    assert result['quotient'] == 'x^2 - 1'
+    assert result['is_factor'] is True
+    assert len(result['steps']) == 3
@@ -0,0 +1,120 @@
+"""
+Pruebas de regresión del parser de polinomios (parse_polynomial_terms)
+Ejemplos de siempre, términos repetidos, coeficientes implícitos y posiciones de error
+"""
+
+from fractions import Fraction
+
+import pytest
+
+from src.ruffini_calculator import PolynomialParseError, RuffiniCalculator
+
+
+@pytest.fixture
+def calculator():
+    return RuffiniCalculator()
+
+
+@pytest.mark.parametrize('polynomial, coefficients', [
+    # Ejemplos de /examples
+    ('x^3 + 2x^2 - 5x + 6', [1, 2, -5, 6]),
+    ('x^4 - 1', [1, 0, 0, 0, -1]),
+    ('2x^3 - 3x^2 + x - 2', [2, -3, 1, -2]),
+    ('x^2 - 5x + 6', [1, -5, 6]),
+    ('x^3 + x^2 - 2x', [1, 1, -2, 0]),
+    # Espacios opcionales
+    ('x^3+2x^2-5x+6', [1, 2, -5, 6]),
+    ('  x ^ 2  -  4  ', [1, 0, -4]),
+    ('3', [3]),
+])
+def test_examples(calculator, polynomial, coefficients):
+    assert calculator.parse_polynomial(polynomial) == coefficients
+
+
+def test_returns_sparse_terms(calculator):
+    assert calculator.parse_polynomial_terms('x^1000000 - 1') == {1000000: 1.0, 0: -1.0}
+
+
+@pytest.mark.parametrize('polynomial, terms', [
+    ('x^2 + x^2', {2: 2.0}),
+    ('3x^2 + 2x^2 - x^2 - 5', {2: 4.0, 0: -5.0}),
+    ('x - x + 1', {1: 0.0, 0: 1.0}),
+    ('1 + 2', {0: 3.0}),
+])
+def test_repeated_degrees_are_summed(calculator, polynomial, terms):
+    assert calculator.parse_polynomial_terms(polynomial) == terms
+
+
+@pytest.mark.parametrize('polynomial, terms', [
+    ('x', {1: 1.0}),
+    ('-x', {1: -1.0}),
+    ('+x^3', {3: 1.0}),
+    ('x^2 - x', {2: 1.0, 1: -1.0}),
+    ('2*x^2', {2: 2.0}),
+    ('2 * x', {1: 2.0}),
+])
+def test_implicit_coefficients_and_exponents(calculator, polynomial, terms):
+    assert calculator.parse_polynomial_terms(polynomial) == terms
+
+
+@pytest.mark.parametrize('polynomial, terms', [
+    ('1.5x - .5', {1: 1.5, 0: -0.5}),
+    ('2.x', {1: 2.0}),
+    ('1e3x + 2.5E-1', {1: 1000.0, 0: 0.25}),
+])
+def test_decimal_and_scientific_coefficients(calculator, polynomial, terms):
+    assert calculator.parse_polynomial_terms(polynomial) == terms
+
+
+def test_exact_mode(calculator):
+    terms = calculator.parse_polynomial_terms('x^2 + 0.5x - 3', exact=True)
+    assert terms == {2: 1, 1: Fraction(1, 2), 0: -3}
+    assert type(terms[2]) is int and type(terms[0]) is int
+
+
+def test_expand_has_no_negative_zero(calculator):
+    coefficients = calculator.parse_polynomial('-x^3 + 1')
+    assert coefficients == [-1.0, 0.0, 0.0, 1.0]
+    assert all(str(coef) != '-0.0' for coef in coefficients)
+
+
+@pytest.mark.parametrize('polynomial, message, position', [
+    ('', 'Polinomio vacío', 0),
+    ('   ', 'Polinomio vacío', 3),
+    ('x^2 +', 'Término incompleto al final', 5),
+    ('x^2 x', "Se esperaba '+' o '-' antes de 'x'", 4),
+    ('x2', "Se esperaba '+' o '-' antes de '2'", 1),
+    ('2*', "Se esperaba 'x' después de '*'", 2),
+    ('*x', "Falta el coeficiente antes de '*'", 0),
+    ('x^', "Carácter inesperado '^'", 1),
+    ('x + y', "Carácter inesperado 'y'", 4),
+    ('x^2 -- 1', "Carácter inesperado '-'", 5),
+    ('x^-2', "Carácter inesperado '^'", 1),
+])
+def test_malformed_input_reports_position(calculator, polynomial, message, position):
+    with pytest.raises(PolynomialParseError) as info:
+        calculator.parse_polynomial_terms(polynomial)
+    assert info.value.position == position
+    assert str(info.value) == f'{message} (posición {position})'
+
+
+def test_calculate_reports_parse_errors(calculator):
+    result = calculator.calculate('x^2 x', 1)
+    assert result['success'] is False
+    assert result['error_position'] == 4
+
+
+@pytest.mark.parametrize('literal', ['1e9999999', '1' * 1001, '0.' + '5' * 1000, '2.5E-1000'])
+def test_exact_mode_rejects_huge_literals(calculator, literal):
+    with pytest.raises(ValueError):
+        calculator.to_exact(literal)
+    with pytest.raises(ValueError):
+        calculator.parse_polynomial_terms(f'{literal}x + 1', exact=True)
+
+
+def test_exact_results_beyond_the_str_digit_limit_are_formatted(calculator):
+    root = 10 ** 999
+    result = calculator.calculate('x^6 - 1', str(root), exact=True, include_steps='compact')
+    assert result['remainder'] == root ** 6 - 1
+    assert result['quotient'].startswith('x^5 + 1' + '0' * 999 + 'x^4')
+    assert result['ai_explanation'].endswith('no es un factor exacto del polinomio.')
@@ -0,0 +1,78 @@
+"""
+Pruebas de src/polynomial_arithmetic.py: producto (clásico, Karatsuba y FFT), potencia y verificación
+"""
+
+import random
+from fractions import Fraction
+from math import comb
+
+import pytest
+
+from src import polynomial_arithmetic as pa
+
+
+def schoolbook(p, q):
+    """Producto de referencia, término a término"""
+    result = [0] * (len(p) + len(q) - 1)
+    for i, a in enumerate(p):
+        for j, b in enumerate(q):
+            result[i + j] += a * b
+    return result
+
+
+def test_add_subtract_and_trim():
+    assert pa.add([1, 2, 3], [1, 1]) == [1, 3, 4]
+    assert pa.subtract([1, 2], [1, 2]) == [0]
+    assert pa.trim([0, 0, 1, 0]) == [1, 0]
+
+
+@pytest.mark.parametrize('length', [1, 5, pa.KARATSUBA_THRESHOLD, 3 * pa.KARATSUBA_THRESHOLD + 7])
+def test_multiply_exact_matches_schoolbook(length):
+    rng = random.Random(length)
+    p = [rng.randint(-9, 9) for _ in range(length)]
+    q = [rng.randint(-9, 9) for _ in range(length + 3)]
+    p[0] = q[0] = 1
+    assert pa.multiply(p, q) == schoolbook(p, q)
+
+
+def test_multiply_keeps_fractions_exact():
+    p = [Fraction(1, 2)] * 40
+    q = [Fraction(1, 3)] * 40
+    assert pa.multiply(p, q) == schoolbook(p, q)
+
+
+def test_multiply_unbalanced_factors():
+    p = list(range(1, 200))
+    q = [1, -1]
+    assert pa.multiply(p, q) == schoolbook(p, q)
+
+
+def test_multiply_float_uses_a_close_product():
+    rng = random.Random(1)
+    p = [rng.uniform(1, 2) for _ in range(4 * pa.FFT_THRESHOLD)]
+    q = [rng.uniform(1, 2) for _ in range(4 * pa.FFT_THRESHOLD)]
+    expected = schoolbook(p, q)
+    product = pa.multiply(p, q)
+    assert len(product) == len(expected)
+    assert max(abs(a - b) for a, b in zip(product, expected)) <= 1e-9 * max(map(abs, expected))
+
+
+def test_power_gives_binomial_coefficients():
+    n = 100
+    assert pa.power([1, -1], n) == [(-1) ** k * comb(n, k) for k in range(n + 1)]
+    assert pa.power([1, 2], 0) == [1]
+    with pytest.raises(ValueError):
+        pa.power([1, 1], -1)
+
+
+def test_compose():
+    # p(x) = x^2 + 1, q(x) = x - 1  ->  x^2 - 2x + 2
+    assert pa.compose([1, 0, 1], [1, -1]) == [1, -2, 2]
+
+
+def test_verify_division():
+    # x^3 + 2x^2 - 5x + 6 = (x^2 + 4x + 3)(x - 2) + 12
+    assert pa.verify_division([1, 2, -5, 6], [1, -2], [1, 4, 3], [12]) == (True, 0)
+    assert pa.verify_division([1, 2, -5, 6], [1, -2], [1, 4, 3], [11]) == (False, 1)
+    verified, max_error = pa.verify_division([1.0, 2.0, -5.0, 6.0], [1.0, -2.0], [1.0, 4.0, 3.0], [12.0 + 1e-12])
+    assert verified and max_error > 0
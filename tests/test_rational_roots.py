@@ -0,0 +1,81 @@
+"""
+Pruebas de la búsqueda de raíces racionales y de RuffiniCalculator.factor
+"""
+
+from fractions import Fraction
+
+import pytest
+
+from src.rational_roots import divide_linear, divisors, find_rational_roots, is_probable_prime, prime_factors
+from src.ruffini_calculator import RuffiniCalculator
+
+
+@pytest.fixture
+def calculator():
+    return RuffiniCalculator()
+
+
+def test_prime_factors():
+    assert prime_factors(360) == {2: 3, 3: 2, 5: 1}
+    assert prime_factors(-7) == {7: 1}
+    # Factores mayores que los primos de la división por tentativa
+    assert prime_factors(1000003 * 1000033) == {1000003: 1, 1000033: 1}
+
+
+def test_is_probable_prime():
+    assert is_probable_prime(2) and is_probable_prime(1000003)
+    assert not is_probable_prime(1) and not is_probable_prime(1000003 * 1000033)
+
+
+def test_divisors_with_limit():
+    assert divisors(12) == [1, 2, 3, 4, 6, 12]
+    assert divisors(12, limit=4) == [1, 2, 3, 4]
+
+
+def test_divide_linear():
+    # x^2 - 3x + 2 = (x - 1)(x - 2)
+    assert divide_linear([1, -3, 2], 1, 1) == [1, -2]
+    # 2x^2 - 3x + 1 = (2x - 1)(x - 1)
+    assert divide_linear([2, -3, 1], 1, 2) == [1, -1]
+    assert divide_linear([1, -3, 2], 3, 1) is None
+
+
+@pytest.mark.parametrize('coefficients, roots, remaining', [
+    ([1, -6, 11, -6], [(Fraction(1), 1), (Fraction(2), 1), (Fraction(3), 1)], [1]),
+    ([2, -3, -3, 2], [(Fraction(1, 2), 1), (Fraction(-1), 1), (Fraction(2), 1)], [1]),
+    ([1, -2, 1, 0, 0], [(Fraction(0), 2), (Fraction(1), 2)], [1]),
+    ([4, -4, 1], [(Fraction(1, 2), 2)], [1]),
+    ([1, 0, 1], [], [1, 0, 1]),
+    ([1, -1, -2, 2], [(Fraction(1), 1)], [1, 0, -2]),
+])
+def test_find_rational_roots(coefficients, roots, remaining):
+    found, rest, _ = find_rational_roots(coefficients)
+    assert sorted(found) == sorted(roots)
+    assert rest == remaining
+
+
+@pytest.mark.parametrize('polynomial, factorization, fully_factored', [
+    ('x^3 - 6x^2 + 11x - 6', '(x - 1)(x - 2)(x - 3)', True),
+    ('2x^3 - 3x^2 - 3x + 2', '(2x - 1)(x + 1)(x - 2)', True),
+    ('x^3 - 2x^2 + x', 'x(x - 1)^2', True),
+    ('0.5x^2 - 2', '(1/2)(x - 2)(x + 2)', True),
+    ('x^2 + 1', '(x^2 + 1)', False),
+    ('6', '6', True),
+])
+def test_factor(calculator, polynomial, factorization, fully_factored):
+    result = calculator.factor(polynomial)
+    assert result['success'] is True
+    assert result['factorization'] == factorization
+    assert result['fully_factored'] is fully_factored
+
+
+def test_factor_reports_multiplicity_and_exact_roots(calculator):
+    result = calculator.factor('4x^2 - 4x + 1')
+    assert result['roots'] == [
+        {'root': Fraction(1, 2), 'value': 0.5, 'multiplicity': 2, 'factor': '(2x - 1)^2'}
+    ]
+
+
+def test_factor_rejects_the_zero_polynomial(calculator):
+    result = calculator.factor('0x^2')
+    assert result['success'] is False
@@ -0,0 +1,54 @@
+"""
+Pruebas de src/result_cache.py: formato JSON de la caché SQLite y entradas ilegibles
+"""
+
+import sqlite3
+from array import array
+from fractions import Fraction
+
+import pytest
+
+from src.result_cache import SQLiteCache, dumps, loads
+from src.ruffini_calculator import RuffiniCalculator
+
+
+@pytest.fixture
+def cache(tmp_path):
+    return SQLiteCache(str(tmp_path / 'cache.sqlite3'), max_size=8)
+
+
+@pytest.mark.parametrize('value', [
+    {'success': True, 'quotient_terms': [[3, 1.0], [0, -2.5]], 'root': Fraction(2, 3)},
+    ('x^2 - 1', {2: 1, 0: -1}, Fraction(1, 2), True),
+    {'~tag': 1, 'huge': -3 ** 9000, 'values': [float('inf'), None, complex(1, -2)]},
+    array('d', [1.0, -0.5, 2.25]),
+])
+def test_values_round_trip(value):
+    assert loads(dumps(value)) == value
+
+
+@pytest.mark.parametrize('exact', [False, True])
+def test_ruffini_result_round_trip(exact):
+    calculator = RuffiniCalculator()
+    terms = calculator.parse_polynomial_terms('x^3 + 2x^2 - 5x + 6', exact)
+    division = calculator.divide('x^3 + 2x^2 - 5x + 6', terms, '1/2' if exact else 2.0, exact)
+
+    restored = loads(dumps(division))
+    assert type(restored._table) is type(division._table)
+    assert restored.to_dict(True) == division.to_dict(True)
+
+
+def test_unsupported_values_are_not_stored(cache):
+    cache.set('key', object())
+    assert cache.get('key') is None
+    assert cache.errors == 1
+
+
+def test_unreadable_entries_are_misses_and_deleted(cache):
+    cache.set('key', {'a': 1})
+    with sqlite3.connect(cache.path) as connection:
+        connection.execute("UPDATE entries SET value = ?", (b'\x80\x04not json',))
+
+    assert cache.get('key', 'default') == 'default'
+    assert cache.errors == 1 and cache.misses == 1
+    assert len(cache) == 0